@@ -1,13 +1,33 @@
-import dotenv
+import argparse
+import logging
 
-from memento.engine import run
+import dotenv
 
 
 def main():
-    # Load environment variables from .env file
+    parser = argparse.ArgumentParser(
+        prog="memento",
+        description="Print Apple Reminders on a thermal printer.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and print new reminders as they arrive",
+    )
+    args = parser.parse_args()
+
+    # Load environment variables from .env file before importing the engine,
+    # so that configuration defaults read at import time pick them up
     dotenv.load_dotenv()
-    # Run the Memento engine
-    run()
+    logging.basicConfig(level=logging.INFO)
+    from memento.engine import run, watch
+
+    if args.watch:
+        # Run the Memento engine as a daemon
+        watch()
+    else:
+        # Run the Memento engine
+        run()
 
 
 if __name__ == "__main__":
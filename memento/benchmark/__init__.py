@@ -0,0 +1,28 @@
+import importlib
+
+__all__ = [
+    "DummySession",
+    "FakeOllama",
+    "PrinterSink",
+    "add_synthetic_reminders",
+    "run_benchmark",
+    "synthetic_texts",
+]
+
+_MODULES = {
+    "DummySession": "printer",
+    "FakeOllama": "ollama",
+    "PrinterSink": "printer",
+    "add_synthetic_reminders": "reminders",
+    "run_benchmark": "harness",
+    "synthetic_texts": "reminders",
+}
+
+
+def __getattr__(name):
+    # Imported lazily, so `python -m memento.benchmark` can load the .env
+    # file before the engine reads its configuration
+    if name in _MODULES:
+        module = importlib.import_module(f"memento.benchmark.{_MODULES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,138 @@
+import argparse
+import json
+import logging
+
+import dotenv
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="memento.benchmark",
+        description="Benchmark the Memento pipeline against local stand-ins "
+                    "for the reminders store, Ollama and the printer.",
+    )
+    parser.add_argument("--reminders", type=int, default=100,
+                        help="number of reminders per run (default 100)")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="number of runs on the same engine (default 1)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="model requests in flight (default 1)")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="reminders per model request (default 1)")
+    parser.add_argument("--commit-size", type=int, default=1,
+                        help="reminders per store commit (default 1)")
+    parser.add_argument("--render-workers", type=int, default=0,
+                        help="render worker processes (default 0)")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream model outputs to the printer")
+    parser.add_argument("--cache", action="store_true",
+                        help="use an LLM cache")
+    parser.add_argument("--no-fast-path", action="store_true",
+                        help="send every reminder to the model")
+    parser.add_argument("--printer", choices=["tcp", "dummy"], default="tcp",
+                        help="TCP sink or in-memory printer (default tcp)")
+    parser.add_argument("--printers", type=int, default=1,
+                        help="number of printers in the pool (default 1)")
+    parser.add_argument("--routing", choices=["round_robin", "least_queue"],
+                        default="round_robin",
+                        help="printer pool routing (default round_robin)")
+    parser.add_argument("--print-rate", type=float, default=0,
+                        help="in-memory printer speed in bytes per second, "
+                             "0 for instant (default 0)")
+    parser.add_argument("--endpoints", type=int, default=1,
+                        help="number of emulated Ollama servers (default 1)")
+    parser.add_argument("--small-model",
+                        help="small model name for short reminders "
+                             "(default none)")
+    parser.add_argument("--small-speedup", type=float, default=4.0,
+                        help="how many times faster the small model "
+                             "answers (default 4)")
+    parser.add_argument("--load-time", type=float, default=0.0,
+                        help="model load time in seconds (default 0)")
+    parser.add_argument("--keep-alive", type=float, default=300.0,
+                        help="seconds a model stays loaded after a request "
+                             "(default 300)")
+    parser.add_argument("--warm-up", choices=["off", "start", "run"],
+                        default="off",
+                        help="model warm-up policy (default off)")
+    parser.add_argument("--warm-keep-alive", type=float,
+                        help="seconds a warm-up keeps a model loaded "
+                             "(default --keep-alive)")
+    parser.add_argument("--idle", type=float, default=0.0,
+                        help="seconds between runs (default 0)")
+    parser.add_argument("--compact-prompt", action="store_true",
+                        help="send the compact prompt")
+    parser.add_argument("--notes-budget", type=int, default=512,
+                        help="maximum tokens of a reminder text, 0 for no "
+                             "limit (default 512)")
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="model latency per request in seconds "
+                             "(default 0.05)")
+    parser.add_argument("--prompt-rate", type=float, default=2000.0,
+                        help="prompt tokens per second (default 2000)")
+    parser.add_argument("--generation-rate", type=float, default=50.0,
+                        help="generated tokens per second (default 50)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="random seed of the reminders (default 0)")
+    parser.add_argument("--json", action="store_true",
+                        help="print the report as JSON")
+    args = parser.parse_args()
+
+    # Load environment variables before importing the engine, as in
+    # `python -m memento`
+    dotenv.load_dotenv()
+    logging.basicConfig(level=logging.WARNING)
+    from memento.benchmark.harness import run_benchmark
+
+    report = run_benchmark(
+        reminders=args.reminders,
+        runs=args.runs,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        commit_size=args.commit_size,
+        render_workers=args.render_workers,
+        stream=args.stream,
+        cache=args.cache,
+        fast_path=not args.no_fast_path,
+        printer=args.printer,
+        printers=args.printers,
+        routing=args.routing,
+        print_rate=args.print_rate,
+        endpoints=args.endpoints,
+        small_model=args.small_model,
+        small_speedup=args.small_speedup,
+        load_time=args.load_time,
+        keep_alive=args.keep_alive,
+        warm_up=args.warm_up,
+        warm_keep_alive=args.warm_keep_alive,
+        idle=args.idle,
+        compact_prompt=args.compact_prompt,
+        notes_budget=args.notes_budget,
+        latency=args.latency,
+        prompt_rate=args.prompt_rate,
+        generation_rate=args.generation_rate,
+        seed=args.seed,
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Reminders:  {report['reminders']}")
+    print(f"Elapsed:    {report['elapsed']:.3f} s")
+    print(f"Throughput: {report['reminders_per_second']:.1f} reminders/s")
+    print(f"Bytes sent: {report['bytes_sent']}")
+    print(f"Model:      {report['model']}")
+    print(f"Usage:      {report['usage']}")
+    print(f"Paths:      {report['paths']}")
+    print(f"Budget:     {report['budget']}")
+    print(f"\n{'Stage':<14}{'Count':>8}{'p50 ms':>10}{'p95 ms':>10}")
+    for stage, summary in report["stages"].items():
+        print(
+            f"{stage:<14}{summary['count']:>8}"
+            f"{summary['p50'] * 1000:>10.1f}{summary['p95'] * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Optional
+
+from memento.benchmark.ollama import FakeOllama
+from memento.benchmark.printer import DummySession, PrinterSink
+from memento.benchmark.reminders import add_synthetic_reminders
+from memento.engine import Engine
+from memento.llm import LLMProcessor, ReminderCache
+from memento.printer import PrinterPool, PrinterSession, PrintQueue
+from memento.reminders import SQLiteReminders
+
+
+def run_benchmark(
+        reminders: int = 100,
+        runs: int = 1,
+        concurrency: int = 1,
+        batch_size: int = 1,
+        commit_size: int = 1,
+        render_workers: int = 0,
+        stream: bool = False,
+        cache: bool = False,
+        fast_path: bool = True,
+        printer: str = "tcp",
+        printers: int = 1,
+        routing: str = "round_robin",
+        print_rate: float = 0,
+        endpoints: int = 1,
+        small_model: Optional[str] = None,
+        small_speedup: float = 4.0,
+        load_time: float = 0.0,
+        keep_alive: float = 300.0,
+        warm_up: str = "off",
+        warm_keep_alive: Optional[float] = None,
+        idle: float = 0.0,
+        compact_prompt: bool = False,
+        notes_budget: int = 512,
+        latency: float = 0.05,
+        prompt_rate: float = 2000.0,
+        generation_rate: float = 50.0,
+        seed: int = 0,
+) -> dict[str, Any]:
+    """Run the engine end to end against local stand-ins.
+
+    Reminders come from a SQLite backend filled with synthetic reminders,
+    the model is a `FakeOllama` server and tickets go to a `PrinterSink`
+    over TCP or to an in-memory `DummySession`. Nothing leaves the machine.
+
+    Every run adds the same synthetic reminders again and processes them
+    with the same engine, so later runs show the effect of the caches.
+    Stage latencies come from the engine's own metrics.
+
+    Args:
+        reminders: Number of reminders per run (default 100)
+        runs: Number of runs (default 1)
+        concurrency: Maximum number of model requests in flight (default 1)
+        batch_size: Number of reminders per model request (default 1)
+        commit_size: Number of reminders per store commit (default 1)
+        render_workers: Number of render worker processes (default 0)
+        stream: Stream model outputs to the printer (default False)
+        cache: Use an LLM cache in a temporary file (default False)
+        fast_path: Use the rule based fast path (default True)
+        printer: "tcp" for a TCP sink, "dummy" for an in-memory printer
+            (default "tcp")
+        printers: Number of printers, more than one are used as a
+            `PrinterPool` (default 1)
+        routing: Routing strategy of the printer pool (default
+            "round_robin")
+        print_rate: Printing speed of in-memory printers in bytes per
+            second, 0 for instant (default 0)
+        endpoints: Number of emulated Ollama servers (default 1)
+        small_model: Name of a small model for short reminders, None to
+            send every reminder to the large model (default None)
+        small_speedup: How many times faster the small model answers
+            (default 4)
+        load_time: Seconds the emulated Ollama needs to load a model
+            (default 0)
+        keep_alive: Seconds the emulated Ollama keeps a model loaded after a
+            request (default 300)
+        warm_up: Warm-up policy of the processor, "off", "start" or "run"
+            (default "off")
+        warm_keep_alive: Seconds the processor asks models to stay loaded
+            after a warm-up (default `keep_alive`)
+        idle: Seconds to wait between runs, to let models unload
+            (default 0)
+        compact_prompt: Send the compact prompt (default False)
+        notes_budget: Maximum number of tokens of a reminder text sent to
+            the model, 0 for no limit (default 512)
+        latency: Fixed model latency per request in seconds (default 0.05)
+        prompt_rate: Model prompt evaluation speed in tokens per second
+            (default 2000)
+        generation_rate: Model generation speed in tokens per second
+            (default 50)
+        seed: Random seed of the synthetic reminders (default 0)
+
+    Returns:
+        The benchmark report.
+    """
+    servers = []
+    for _ in range(endpoints):
+        ollama = FakeOllama(
+            latency=latency,
+            prompt_rate=prompt_rate,
+            generation_rate=generation_rate,
+            speedups={small_model: small_speedup} if small_model else None,
+            load_time=load_time,
+            keep_alive=keep_alive,
+        )
+        ollama.start()
+        servers.append(ollama)
+    sinks = []
+    sessions = []
+    for _ in range(printers):
+        if printer == "tcp":
+            sink = PrinterSink()
+            sink.start()
+            host, port = sink.address
+            sinks.append(sink)
+            sessions.append(PrinterSession(host=host, port=port))
+        else:
+            sessions.append(DummySession(rate=print_rate))
+    if printers > 1:
+        print_queue = PrinterPool(
+            {f"printer{i}": PrintQueue(s) for i, s in enumerate(sessions)},
+            routing=routing,
+        )
+    else:
+        print_queue = PrintQueue(sessions[0])
+
+    backend = SQLiteReminders()
+    with tempfile.TemporaryDirectory() as tmp:
+        processor = LLMProcessor(
+            base_url=",".join(ollama.base_url for ollama in servers),
+            cache=ReminderCache(f"{tmp}/cache.sqlite3") if cache else None,
+            fast_path=fast_path,
+            small_model_name=small_model,
+            warm_up=warm_up,
+            keep_alive=str(
+                keep_alive if warm_keep_alive is None else warm_keep_alive),
+            compact_prompt=compact_prompt,
+            notes_budget=notes_budget,
+        )
+        engine = Engine(
+            reminders=backend,
+            processor=processor,
+            print_queue=print_queue,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            commit_size=commit_size,
+            render_workers=render_workers,
+            stream=stream,
+        )
+        processed = 0
+        idled = 0.0
+        start = time.perf_counter()
+        try:
+            for run in range(runs):
+                if run and idle:
+                    time.sleep(idle)
+                    idled += idle
+                add_synthetic_reminders(backend, reminders, seed=seed)
+                processed += engine.run_once()
+        finally:
+            engine.close()
+            # Idle time between runs is not counted
+            elapsed = time.perf_counter() - start - idled
+            for ollama in servers:
+                ollama.close()
+            for sink in sinks:
+                sink.close()
+
+    bytes_sent = sum(s.bytes_received for s in sinks or sessions)
+
+    return {
+        "reminders": processed,
+        "elapsed": elapsed,
+        "reminders_per_second": processed / elapsed if elapsed else 0,
+        "stages": engine.metrics.summary(),
+        "bytes_sent": bytes_sent,
+        "model": {
+            "requests": sum(ollama.requests for ollama in servers),
+            "prompt_tokens": sum(ollama.prompt_tokens for ollama in servers),
+            "completion_tokens": sum(
+                ollama.completion_tokens for ollama in servers),
+            "endpoints": [ollama.requests for ollama in servers],
+            "loads": sum(ollama.loads for ollama in servers),
+            "models": dict(sum(
+                (Counter(ollama.models) for ollama in servers), Counter())),
+        },
+        "paths": dict(processor.stats),
+        "usage": dict(processor.usage),
+        "budget": dict(processor.tokens),
+    }
+
@@ -0,0 +1,372 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
+
+from memento.llm.ollama import keep_alive_seconds
+from memento.llm.rules import ASSIGNEE_PATTERN, MAX_TITLE_LENGTH, URL_PATTERN
+
+# Characters per token, used to estimate token counts and stream chunks
+TOKEN_LENGTH = 4
+# Separator between reminders in the batch prompt
+BATCH_ITEM_PATTERN = re.compile(r"^--- REMINDER \d+ ---$", re.MULTILINE)
+
+
+class FakeOllama:
+    """OpenAI-compatible chat completions server emulating Ollama timing.
+
+    Every request is answered with a structured output tool call derived
+    from the reminder text in the prompt. The response is delayed by a
+    fixed latency plus the time Ollama would need to evaluate the prompt
+    and generate the completion at the configured token rates. A model that
+    is not loaded first takes `load_time` to load, and stays loaded for
+    `keep_alive` after its last request, or for as long as the last request
+    asks, as a warm-up through the native `/api/generate` endpoint can.
+    """
+
+    def __init__(
+            self,
+            latency: float = 0.05,
+            prompt_rate: float = 2000.0,
+            generation_rate: float = 50.0,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            speedups: Optional[dict[str, float]] = None,
+            load_time: float = 0.0,
+            keep_alive: float = 300.0,
+    ):
+        """Create the server without starting it.
+
+        Args:
+            latency: Fixed per-request latency in seconds (default 0.05)
+            prompt_rate: Prompt evaluation speed in tokens per second
+                (default 2000)
+            generation_rate: Generation speed in tokens per second
+                (default 50)
+            host: Address to listen on (default "127.0.0.1")
+            port: Port to listen on, 0 for any free port (default 0)
+            speedups: Speed factor of each model name, dividing all delays,
+                e.g. to emulate a small model (optional)
+            load_time: Seconds needed to load a model (default 0)
+            keep_alive: Seconds a model stays loaded after a request
+                (default 300)
+        """
+        self.latency = latency
+        self.prompt_rate = prompt_rate
+        self.generation_rate = generation_rate
+        self.speedups = speedups or {}
+        self.load_time = load_time
+        self.keep_alive = keep_alive
+        self.loads = 0
+        # Time each loaded model is ready and unloaded, by model name
+        self._loaded: dict[str, tuple[float, float]] = {}
+        self.requests = 0
+        # Number of requests for each model name
+        self.models: dict[str, int] = {}
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.fake = self
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """The OpenAI-compatible API endpoint of the server."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        """Start serving requests in a background thread."""
+        self._thread.start()
+
+    def close(self):
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def complete(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer a chat completion request.
+
+        Args:
+            request: The decoded request body
+
+        Returns:
+            The chat completion response.
+        """
+        tool_name, arguments, prompt_tokens, completion_tokens = (
+            self._answer(request))
+        speedup = self.speedups.get(request.get("model"), 1.0)
+        time.sleep(self._load(request.get("model", "")) + (
+            self.latency
+            + prompt_tokens / self.prompt_rate
+            + completion_tokens / self.generation_rate
+        ) / speedup)
+        self._count(request, prompt_tokens, completion_tokens)
+
+        return {
+            **self._response(request, "chat.completion"),
+            "choices": [{
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [{
+                        "id": "call_0",
+                        "type": "function",
+                        "function": {
+                            "name": tool_name,
+                            "arguments": arguments,
+                        },
+                    }],
+                },
+                "finish_reason": "tool_calls",
+            }],
+            "usage": _usage(prompt_tokens, completion_tokens),
+        }
+
+    def stream(self, request: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Answer a chat completion request as a stream of chunks.
+
+        The first chunk arrives after the latency and prompt evaluation
+        time, then one chunk per token at the generation rate.
+
+        Args:
+            request: The decoded request body
+
+        Yields:
+            The chat completion chunks.
+        """
+        tool_name, arguments, prompt_tokens, completion_tokens = (
+            self._answer(request))
+        chunk = self._response(request, "chat.completion.chunk")
+        speedup = self.speedups.get(request.get("model"), 1.0)
+        time.sleep(
+            self._load(request.get("model", ""))
+            + (self.latency + prompt_tokens / self.prompt_rate) / speedup
+        )
+
+        call = {
+            "index": 0,
+            "id": "call_0",
+            "type": "function",
+            "function": {"name": tool_name, "arguments": ""},
+        }
+        for i in range(0, len(arguments), TOKEN_LENGTH):
+            call["function"]["arguments"] = arguments[i:i + TOKEN_LENGTH]
+            yield {**chunk, "choices": [{
+                "index": 0,
+                "delta": {"role": "assistant", "tool_calls": [call]},
+                "finish_reason": None,
+            }]}
+            call = {"index": 0, "function": {}}
+            time.sleep(1 / (self.generation_rate * speedup))
+        self._count(request, prompt_tokens, completion_tokens)
+
+        yield {**chunk, "choices": [{
+            "index": 0,
+            "delta": {},
+            "finish_reason": "tool_calls",
+        }]}
+        if request.get("stream_options", {}).get("include_usage"):
+            yield {
+                **chunk,
+                "choices": [],
+                "usage": _usage(prompt_tokens, completion_tokens),
+            }
+
+    def generate(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer a native generate request, which loads the model.
+
+        Args:
+            request: The decoded request body
+
+        Returns:
+            The generate response, with the load duration in nanoseconds.
+        """
+        model = request.get("model", "")
+        keep_alive = request.get("keep_alive")
+        if keep_alive is not None:
+            keep_alive = keep_alive_seconds(str(keep_alive))
+        wait = self._load(model, keep_alive)
+        time.sleep(wait)
+        return {
+            "model": model,
+            "response": "",
+            "done": True,
+            "load_duration": int(wait * 1e9),
+        }
+
+    def _load(self, model: str, keep_alive: Optional[float] = None) -> float:
+        """Load a model if needed and extend its keep-alive.
+
+        Args:
+            model: The model name
+            keep_alive: Seconds to keep the model loaded after this request
+                (default the server's `keep_alive`)
+
+        Returns:
+            Seconds until the model is ready.
+        """
+        if keep_alive is None:
+            keep_alive = self.keep_alive
+        speedup = self.speedups.get(model, 1.0)
+        with self._lock:
+            now = time.perf_counter()
+            ready, unloaded = self._loaded.get(model, (0.0, 0.0))
+            if now >= unloaded:
+                ready = now + self.load_time / speedup
+                self.loads += 1
+            self._loaded[model] = (ready, max(ready, now) + keep_alive)
+        return max(0.0, ready - now)
+
+    def _answer(self, request: dict[str, Any]) -> tuple[str, str, int, int]:
+        """Produce the structured output tool call for a request.
+
+        Args:
+            request: The decoded request body
+
+        Returns:
+            The output tool name, its JSON arguments and the number of
+            prompt and completion tokens.
+        """
+        prompt = "\n".join(
+            message.get("content") or ""
+            for message in request["messages"]
+            if isinstance(message.get("content"), str)
+        )
+        tool = request["tools"][0]["function"]
+        if "reminders" in tool["parameters"].get("properties", {}):
+            texts = _batch_texts(prompt)
+            output = {"reminders": [_extract(text) for text in texts]}
+        else:
+            output = _extract(_single_text(prompt))
+        arguments = json.dumps(output)
+        # Like a real model, stop generating at the token limit
+        limit = request.get("max_completion_tokens") or request.get(
+            "max_tokens")
+        if limit:
+            arguments = arguments[:limit * TOKEN_LENGTH]
+        return tool["name"], arguments, _tokens(prompt), _tokens(arguments)
+
+    def _count(
+            self,
+            request: dict[str, Any],
+            prompt_tokens: int,
+            completion_tokens: int,
+    ):
+        """Count an answered request."""
+        model = request.get("model", "")
+        with self._lock:
+            self.requests += 1
+            self.models[model] = self.models.get(model, 0) + 1
+            # Like in Ollama, the keep-alive restarts after every request
+            ready, _ = self._loaded[model]
+            unloaded = time.perf_counter() + self.keep_alive
+            self._loaded[model] = (ready, unloaded)
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+    def _response(self, request: dict[str, Any], kind: str) -> dict[str, Any]:
+        """Return the fields common to every response."""
+        return {
+            "id": f"chatcmpl-{self.requests}",
+            "object": kind,
+            "created": int(time.time()),
+            "model": request.get("model", ""),
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler delegating chat completions to `FakeOllama`."""
+
+    # Keep connections alive, as the OpenAI client pools them
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        request = json.loads(self.rfile.read(length))
+        path = self.path.rstrip("/")
+        if path == "/api/generate":
+            status, response = 200, self.server.fake.generate(request)
+        elif not path.endswith("/chat/completions"):
+            status, response = 404, {"error": {"message": "Not found"}}
+        elif request.get("stream"):
+            self._send_stream(self.server.fake.stream(request))
+            return
+        else:
+            status, response = 200, self.server.fake.complete(request)
+        body = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, chunks: Iterator[dict[str, Any]]):
+        """Send chunks as server-sent events and close the connection."""
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for chunk in chunks:
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _single_text(prompt: str) -> str:
+    """Return the reminder text of a single reminder prompt."""
+    return _section(prompt, "INPUT TEXT:")
+
+
+def _batch_texts(prompt: str) -> list[str]:
+    """Return the reminder texts of a batch prompt."""
+    reminders = _section(prompt, "INPUT REMINDERS:")
+    return [
+        text.strip() for text in BATCH_ITEM_PATTERN.split(reminders)
+        if text.strip()
+    ]
+
+
+def _section(prompt: str, header: str) -> str:
+    """Return the prompt text between a header and the extraction rules."""
+    _, _, text = prompt.partition(header)
+    text, _, _ = (text or prompt).partition("EXTRACTION RULES:")
+    return text.strip()
+
+
+def _extract(text: str) -> dict[str, Optional[str]]:
+    """Produce a plausible structured output for a reminder text."""
+    link = URL_PATTERN.search(text)
+    assignee = ASSIGNEE_PATTERN.search(text)
+    text = ASSIGNEE_PATTERN.sub("", URL_PATTERN.sub("", text)).strip()
+    title, _, body = text.partition("\n")
+    return {
+        "title": title.strip()[:MAX_TITLE_LENGTH],
+        "text": " ".join(body.split()) or None,
+        "link": link.group(0) if link else None,
+        "assignee": assignee.group(1) if assignee else None,
+    }
+
+
+def _usage(prompt_tokens: int, completion_tokens: int) -> dict[str, int]:
+    """Return the usage field of a response."""
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _tokens(text: str) -> int:
+    """Estimate the number of tokens in a text."""
+    return max(1, len(text) // TOKEN_LENGTH)
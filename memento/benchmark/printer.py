@@ -0,0 +1,109 @@
+import os
+import socketserver
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from escpos.printer import Dummy
+
+
+class PrinterSink:
+    """TCP server accepting ESC/POS data like a network printer.
+
+    Received data is counted and discarded.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """Create the server without starting it.
+
+        Args:
+            host: Address to listen on (default "127.0.0.1")
+            port: Port to listen on, 0 for any free port (default 0)
+        """
+        self.bytes_received = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self.server = socketserver.ThreadingTCPServer((host, port), _Handler)
+        self.server.sink = self
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Host and port the sink listens on."""
+        host, port = self.server.server_address[:2]
+        return host, port
+
+    def start(self):
+        """Start accepting connections in a background thread."""
+        self._thread.start()
+
+    def close(self):
+        """Stop the server, after all open connections are closed."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _received(self, size: int):
+        """Count received data."""
+        with self._lock:
+            self.bytes_received += size
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """Connection handler reading data until the client disconnects."""
+
+    def handle(self):
+        sink = self.server.sink
+        with sink._lock:
+            sink.connections += 1
+        while data := self.request.recv(65536):
+            sink._received(len(data))
+
+
+class DummySession:
+    """Printer session writing into an in-memory escpos `Dummy` printer.
+
+    It can replace a `PrinterSession` in a `PrintQueue` to measure the
+    pipeline without any socket.
+    """
+
+    def __init__(self, profile: Optional[str] = None, rate: float = 0):
+        """Create the dummy printer.
+
+        Args:
+            profile: Printer profile (default from PRINTER_PROFILE)
+            rate: Printing speed in bytes per second, emulating a thermal
+                printer, 0 for instant (default 0)
+        """
+        self.profile = profile or os.environ.get("PRINTER_PROFILE")
+        self.printer = Dummy(profile=self.profile)
+        self.rate = rate
+        self.bytes_received = 0
+
+    def run(self, job: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a print job and discard its output.
+
+        Args:
+            job: Callable receiving the printer as its first argument
+            *args: Additional positional arguments for the job
+            **kwargs: Additional keyword arguments for the job
+
+        Returns:
+            Whatever the job returns.
+        """
+        try:
+            return job(self.printer, *args, **kwargs)
+        finally:
+            size = len(self.printer.output)
+            self.bytes_received += size
+            self.printer.clear()
+            if self.rate:
+                time.sleep(size / self.rate)
+
+    def check(self, timeout: float = 1.0) -> bool:
+        """Always reachable."""
+        return True
+
+    def close(self):
+        """Nothing to close."""
+        pass
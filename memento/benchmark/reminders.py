@@ -0,0 +1,106 @@
+import random
+import uuid
+from datetime import datetime, timezone
+
+from memento.reminders import Reminder, SQLiteReminders
+
+# Single line reminders, handled by the rule based fast path
+SIMPLE = [
+    "Buy milk",
+    "Call the plumber @alex",
+    "Renew passport",
+    "Review https://dashboards.example.com/latency @sam",
+    "Water the plants",
+]
+
+TITLES = [
+    "Database failover drill",
+    "Quarterly planning",
+    "Fix flaky deploy pipeline",
+    "Prepare the board meeting",
+    "Migrate the billing service",
+]
+
+NOTES = [
+    "Follow the runbook step by step and write down anything that is "
+    "unclear so the document can be updated afterwards.",
+    "Collect numbers from every team, compare them with last quarter and "
+    "draft the summary before Friday.",
+    "It fails roughly once a day on the integration stage, look at the "
+    "retry logic and the test fixtures.",
+    "Slides, budget overview and hiring plan.",
+]
+
+LINKS = [
+    "https://runbooks.example.com/database/failover",
+    "https://dashboards.example.com/deploys",
+    "https://wiki.example.com/planning",
+]
+
+ASSIGNEES = ["alex", "sam", "kim"]
+
+
+def synthetic_texts(
+        count: int,
+        simple: float = 0.3,
+        duplicates: float = 0.2,
+        seed: int = 0,
+) -> list[tuple[str, str]]:
+    """Generate reminder titles and notes.
+
+    Args:
+        count: Number of reminders
+        simple: Fraction of single line reminders (default 0.3)
+        duplicates: Fraction of reminders repeating an earlier one
+            (default 0.2)
+        seed: Random seed, the same seed gives the same reminders
+            (default 0)
+
+    Returns:
+        The title and notes of every reminder.
+    """
+    rng = random.Random(seed)
+    texts = []
+    for i in range(count):
+        if texts and rng.random() < duplicates:
+            texts.append(rng.choice(texts))
+        elif rng.random() < simple:
+            texts.append((rng.choice(SIMPLE), ""))
+        else:
+            notes = [rng.choice(NOTES)]
+            if rng.random() < 0.5:
+                notes.append(rng.choice(LINKS))
+            if rng.random() < 0.5:
+                notes.append(f"@{rng.choice(ASSIGNEES)}")
+            texts.append((f"{rng.choice(TITLES)} #{i}", "\n".join(notes)))
+    return texts
+
+
+def add_synthetic_reminders(
+        backend: SQLiteReminders,
+        count: int,
+        calendar: str = "Reminders",
+        **kwargs,
+):
+    """Add synthetic reminders to a SQLite backend.
+
+    The calendar is created if it does not exist.
+
+    Args:
+        backend: The backend to fill
+        count: Number of reminders
+        calendar: Calendar the reminders are added to (default "Reminders")
+        **kwargs: Additional arguments for `synthetic_texts`
+    """
+    now = datetime.now(timezone.utc)
+    backend.insert_reminders(
+        Reminder(
+            id=str(uuid.uuid4()).upper(),
+            title=title,
+            notes=notes,
+            creation_date=now,
+            modification_date=now,
+            calendar=calendar,
+        )
+        for title, notes in synthetic_texts(count, **kwargs)
+    )
@@ -1,35 +1,759 @@
+import asyncio
+import json
+import logging
 import os
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import AsyncIterable, AsyncIterator, Callable, Optional, Union
 
-from memento.llm import LLMProcessor
-from memento.printer import print_reminder
-from memento.reminders import Reminders
+from escpos.capabilities import get_profile
+from escpos.escpos import Escpos
+
+from memento.journal import EXTRACTED, PRINTED, RENDERED, Journal
+from memento.llm import LLMProcessor, ReminderCache, ReminderOutput
+from memento.metrics import Metrics
+from memento.printer import (
+    PrinterPool,
+    PrinterSession,
+    PrintQueue,
+    RenderPool,
+    TicketStream,
+    print_raw,
+    print_stream,
+    render_cache_stats,
+    render_reminder,
+)
+from memento.reminders import (
+    Reminder,
+    RemindersBackend,
+    create_backend,
+)
+
+logger = logging.getLogger(__name__)
 
 PROCESSED_CALENDAR = "Processed"
+# Reminder fields the engine reads, everything else is never fetched
+REMINDER_FIELDS = ("id", "title", "notes", "calendar")
 
 
-def run():
-    """Run the Memento engine to process reminders and print them."""
-    reminders = Reminders()
-    processor = LLMProcessor()
-    skip_calendars = os.environ.get("SKIP_CALENDARS", "").split(",")
+class Engine:
+    """Process reminders and print them.
 
-    processed_calendar = reminders.get_calendar_by_title(PROCESSED_CALENDAR)
-    if processed_calendar is None:
-        reminders.create_calendar(PROCESSED_CALENDAR)
+    The reminders store, LLM processor and printer connection are created
+    once and reused across runs, so a long-running process stays warm.
+    """
 
-    for reminder in reminders.get_reminders():
-        if (
-                reminder.calendar != PROCESSED_CALENDAR and
-                reminder.calendar not in skip_calendars
-        ):
-            processed = processor.process_reminder(reminder.text)
-            print_reminder(
+    def __init__(
+            self,
+            reminders: Optional[RemindersBackend] = None,
+            processor: Optional[LLMProcessor] = None,
+            print_queue: Union[PrintQueue, PrinterPool, None] = None,
+            concurrency: Optional[int] = None,
+            batch_size: Optional[int] = None,
+            commit_size: Optional[int] = None,
+            render_workers: Optional[int] = None,
+            stream: Optional[bool] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            reminders: The reminders store (default from `create_backend`)
+            processor: The LLM processor (default a new `LLMProcessor`, with
+                a cache if CACHE_PATH is set)
+            print_queue: The print queue, or a pool of printers (default a
+                `PrinterPool` if PRINTERS is set, otherwise a queue on a new
+                `PrinterSession`)
+            concurrency: Maximum number of model requests in flight at once
+                (default from the CONCURRENCY environment variable, or 1)
+            batch_size: Number of reminders packed into a single model
+                request (default from the BATCH_SIZE environment variable,
+                or 1)
+            commit_size: Number of printed reminders moved to the processed
+                calendar with a single store commit, 0 to commit once at the
+                end of the run (default from the COMMIT_SIZE environment
+                variable, or 1)
+            render_workers: Number of worker processes rendering tickets, 0
+                to render on the print thread (default from the
+                RENDER_WORKERS environment variable, or 0)
+            stream: Stream model outputs and start printing each ticket as
+                soon as its title is known. Reminders are then sent to the
+                model one by one and rendered on the print thread, so
+                `batch_size` and `render_workers` do not apply (default from
+                the STREAM environment variable, or False)
+        """
+        if concurrency is None:
+            concurrency = int(os.environ.get("CONCURRENCY", "1"))
+        if batch_size is None:
+            batch_size = int(os.environ.get("BATCH_SIZE", "1"))
+        if commit_size is None:
+            commit_size = int(os.environ.get("COMMIT_SIZE", "1"))
+        if render_workers is None:
+            render_workers = int(os.environ.get("RENDER_WORKERS", "0"))
+        if stream is None:
+            stream = os.environ.get(
+                "STREAM", "false").lower() in ("1", "true", "yes")
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.commit_size = commit_size
+        self.stream = stream
+
+        # A backend created here is closed with the engine
+        self._owns_reminders = reminders is None
+        self.reminders = reminders or create_backend()
+        if processor is None:
+            cache = ReminderCache() if os.environ.get("CACHE_PATH") else None
+            processor = LLMProcessor(cache=cache)
+        self.processor = processor
+        # Every run uses the same private event loop, so the model client
+        # keeps its connections alive from one run to the next
+        self.loop = asyncio.new_event_loop()
+        if print_queue is None:
+            if os.environ.get("PRINTERS"):
+                print_queue = PrinterPool.from_config()
+            else:
+                print_queue = PrintQueue(PrinterSession())
+        self.print_queue = print_queue
+        self.render_pool = None
+        if render_workers > 0:
+            self.render_pool = RenderPool(render_workers)
+
+        journal_path = os.environ.get("JOURNAL_PATH")
+        self.journal = Journal(journal_path) if journal_path else None
+        # Calendars are filtered in the fetch predicate, so the ever-growing
+        # processed calendar is never read and only pending reminders are
+        # fetched
+        skip_calendars = os.environ.get("SKIP_CALENDARS", "").split(",")
+        self.exclude_calendars = {PROCESSED_CALENDAR, *skip_calendars}
+        # Stage timings and counters, written to METRICS_PATH after each run.
+        # Shared with the processor, which records model warm-up and cold and
+        # warm request latencies
+        self.metrics = self.processor.metrics
+        self.metrics_path = os.environ.get("METRICS_PATH")
+
+        processed_calendar = self.reminders.get_calendar_by_title(
+            PROCESSED_CALENDAR)
+        if processed_calendar is None:
+            self.reminders.create_calendar(PROCESSED_CALENDAR)
+
+    def run_once(self) -> int:
+        """Process and print all pending reminders.
+
+        Returns:
+            The number of reminders processed.
+        """
+        mover = _Mover(
+            self.reminders,
+            self.commit_size,
+            self.metrics,
+            self.journal,
+        )
+
+        def handle(reminder: Reminder, processed: ReminderOutput):
+            self._submit(mover, reminder, processed)
+
+        pending = None
+        try:
+            if self.stream:
+                pending = self.loop.run_until_complete(
+                    self._astream_once(mover))
+            elif self.concurrency > 1 or self.batch_size > 1:
+                pending = self.loop.run_until_complete(
+                    self._arun_once(handle, mover))
+            else:
+                with self.metrics.span("fetch"):
+                    pending = self.reminders.get_reminders(
+                        exclude_calendars=self.exclude_calendars,
+                        fields=REMINDER_FIELDS,
+                    )
+                for reminder in self._resume(pending, mover):
+                    with self.metrics.span("extract", id=reminder.id):
+                        processed = self.loop.run_until_complete(
+                            self.processor.aprocess_reminder(reminder.text))
+                    handle(reminder, processed)
+        finally:
+            mover.finish()
+            if self.journal is not None:
+                # Only a completed fetch tells which reminders are gone
+                self.journal.compact(
+                    None if pending is None
+                    else (reminder.id for reminder in pending))
+            self.processor.keep_warm()
+
+        self.metrics.set_counters("reminders", self.processor.stats)
+        self.metrics.set_counters("tokens", self.processor.usage)
+        self.metrics.set_counters("models", self.processor.models)
+        self.metrics.set_counters("budget", self.processor.tokens)
+        if self.metrics_path:
+            self.metrics.write(self.metrics_path)
+
+        if pending:
+            logger.info("Stages: %s", json.dumps(self.metrics.summary()))
+            logger.info("Extraction paths: %s", dict(self.processor.stats))
+            logger.info("Model usage: %s", dict(self.processor.usage))
+            logger.info("Model requests: %s", dict(self.processor.models))
+            logger.info("Token budget: %s", dict(self.processor.tokens))
+            logger.info("Print queue: %s", self.print_queue.stats())
+            if self.processor.cache is not None:
+                logger.info("LLM cache: %s", self.processor.cache.stats())
+            if self.render_pool is None:
+                logger.info("Render cache: %s", render_cache_stats())
+        return len(pending)
+
+    def _submit(
+            self,
+            mover: "_Mover",
+            reminder: Reminder,
+            processed: ReminderOutput,
+    ):
+        """Journal an extracted reminder and queue its print job.
+
+        Args:
+            mover: Mover tracking the print jobs
+            reminder: The reminder
+            processed: The structured output for the reminder
+        """
+        if self.journal is not None:
+            self.journal.extracted(reminder.id, reminder.text, processed)
+        queue = self.print_queue.select(
+            calendar=reminder.calendar, assignee=processed.assignee)
+        if self.render_pool is not None:
+            profile = queue.session.profile
+            start = time.perf_counter()
+            rendered = self.render_pool.submit(
                 title=processed.title,
                 text=processed.text,
                 link=processed.link,
                 assignee=processed.assignee,
+                profile=profile,
             )
-            reminders.update_reminder(
-                id=reminder.id,
-                calendar=PROCESSED_CALENDAR,
+            # Time the render from submission until the worker returns it
+            rendered.add_done_callback(lambda _: self.metrics.observe(
+                "render", time.perf_counter() - start))
+            job = queue.submit(
+                _print_rendered,
+                rendered,
+                processed,
+                profile,
+                self.metrics,
+                self.journal,
+                reminder.id,
             )
+        else:
+            job = queue.submit(
+                _print, processed, self.metrics, self.journal, reminder.id)
+        mover.add(reminder, job)
+
+    def _resume(
+            self,
+            pending: list[Reminder],
+            mover: "_Mover",
+    ) -> list[Reminder]:
+        """Finish reminders an interrupted run already worked on.
+
+        Printed reminders are only moved, rendered tickets are printed from
+        the journal and extracted outputs are rendered and printed, without
+        calling the model again.
+
+        Args:
+            pending: The pending reminders
+            mover: Mover tracking the print jobs
+
+        Returns:
+            The pending reminders that still need to be extracted.
+        """
+        if self.journal is None:
+            return pending
+
+        remaining = []
+        for reminder in pending:
+            entry = self.journal.get(reminder.id, reminder.text)
+            if entry is None:
+                remaining.append(reminder)
+                continue
+            logger.info(
+                "Resuming reminder %s from stage %s",
+                reminder.id, entry["stage"])
+            if entry["stage"] == PRINTED:
+                job = Future()
+                job.set_result(None)
+                mover.add(reminder, job)
+            elif entry["stage"] == RENDERED:
+                output = Journal.output(entry)
+                queue = self.print_queue.select(
+                    calendar=reminder.calendar, assignee=output.assignee)
+                mover.add(reminder, queue.submit(
+                    _send,
+                    Journal.data(entry),
+                    self.metrics,
+                    self.journal,
+                    reminder.id,
+                ))
+            elif entry["stage"] == EXTRACTED:
+                self._submit(mover, reminder, Journal.output(entry))
+        return remaining
+
+    async def _arun_once(
+            self,
+            handle: Callable[[Reminder, ReminderOutput], None],
+            mover: "_Mover",
+    ) -> list[Reminder]:
+        """Fetch and extract pending reminders concurrently.
+
+        Reminders are extracted as soon as they are fetched, while the
+        store is still fetching the rest.
+
+        Args:
+            handle: Callback receiving each reminder and its output, in order
+            mover: Mover tracking the print jobs
+
+        Returns:
+            The pending reminders.
+        """
+        pending = []
+
+        async def remaining() -> AsyncIterator[list[Reminder]]:
+            async for chunk in self._afetch():
+                pending.extend(chunk)
+                yield self._resume(chunk, mover)
+
+        await _process_concurrently(
+            self.processor,
+            remaining(),
+            self.concurrency,
+            self.batch_size,
+            handle,
+            self.metrics,
+        )
+        return pending
+
+    async def _astream_once(self, mover: "_Mover") -> list[Reminder]:
+        """Fetch pending reminders and stream them to the printer.
+
+        A print job is queued for every reminder as soon as it is fetched,
+        in order. Each job prints its ticket section by section while the
+        model output streams in. Up to `concurrency` reminders are generated
+        at once, the sections of later tickets wait until the printer gets
+        to them.
+
+        Args:
+            mover: Mover tracking the print jobs
+
+        Returns:
+            The pending reminders.
+        """
+        pending = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def stream(reminder: Reminder, ticket: TicketStream):
+            async with semaphore:
+                ticket.start()
+                fields = {}
+                try:
+                    with self.metrics.span("extract", id=reminder.id):
+                        async for name, value in (
+                                self.processor.astream_reminder(reminder.text)
+                        ):
+                            ticket.put(name, value)
+                            fields[name] = value
+                    if self.journal is not None:
+                        self.journal.extracted(
+                            reminder.id,
+                            reminder.text,
+                            ReminderOutput(**fields),
+                        )
+                except Exception as e:
+                    ticket.fail(e)
+                    raise
+                ticket.close()
+
+        tickets = []
+        tasks = []
+        try:
+            async for chunk in self._afetch():
+                pending.extend(chunk)
+                for reminder in self._resume(chunk, mover):
+                    ticket = TicketStream()
+                    # The assignee is not known before the stream, so only
+                    # calendar rules apply
+                    queue = self.print_queue.select(calendar=reminder.calendar)
+                    mover.add(
+                        reminder,
+                        queue.submit(
+                            _print_stream,
+                            ticket,
+                            self.metrics,
+                            self.journal,
+                            reminder.id,
+                        ),
+                    )
+                    tickets.append(ticket)
+                    tasks.append(
+                        asyncio.create_task(stream(reminder, ticket)))
+            for task in tasks:
+                await task
+                mover.poll()
+        finally:
+            # Unblock the print jobs of tickets that were never completed,
+            # closed tickets ignore this
+            for task, ticket in zip(tasks, tickets):
+                task.cancel()
+                ticket.fail(RuntimeError("Reminder processing was aborted"))
+        return pending
+
+    async def _afetch(self) -> AsyncIterator[list[Reminder]]:
+        """Fetch the pending reminders without blocking the event loop.
+
+        The fetch span covers the time until the last chunk arrives.
+
+        Yields:
+            The pending reminders, in chunks as the store fetches them.
+        """
+        start = time.perf_counter()
+        async for chunk in self.reminders.astream_reminders(
+                exclude_calendars=self.exclude_calendars,
+                fields=REMINDER_FIELDS,
+        ):
+            yield chunk
+        self.metrics.observe("fetch", time.perf_counter() - start)
+
+    def watch(
+            self,
+            min_interval: float = float(
+                os.environ.get("WATCH_MIN_INTERVAL", "2")),
+            max_interval: float = float(
+                os.environ.get("WATCH_MAX_INTERVAL", "60")),
+    ):
+        """Keep processing reminders as they arrive.
+
+        Between runs the engine waits for a change notification from the
+        reminders store. The wait is also bounded by a polling interval
+        that doubles after every idle run, up to `max_interval`, and resets
+        to `min_interval` whenever something was printed. Stores without
+        change notifications are simply polled on that schedule.
+
+        Args:
+            min_interval: Shortest wait between runs in seconds (default 2)
+            max_interval: Longest wait between runs in seconds (default 60)
+        """
+        interval = min_interval
+        wait_for_changes = getattr(self.reminders, "wait_for_changes", None)
+        while True:
+            try:
+                processed = self.run_once()
+            except Exception:
+                logger.exception("Run failed")
+                processed = 0
+
+            if processed:
+                interval = min_interval
+            else:
+                interval = min(interval * 2, max_interval)
+
+            if wait_for_changes is not None:
+                wait_for_changes(interval)
+            else:
+                time.sleep(interval)
+
+    def close(self):
+        """Finish queued print jobs and release resources."""
+        self.print_queue.close()
+        if self.journal is not None:
+            self.journal.close()
+        if self.render_pool is not None:
+            self.render_pool.close()
+        if self.processor.cache is not None:
+            self.processor.cache.close()
+        self.loop.run_until_complete(self.processor.aclose())
+        self.loop.close()
+        close = getattr(self.reminders, "close", None)
+        if self._owns_reminders and close is not None:
+            close()
+
+
+def run(
+        concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        commit_size: Optional[int] = None,
+):
+    """Run the Memento engine once to process reminders and print them.
+
+    Args:
+        concurrency: Maximum number of model requests in flight at once
+            (default from the CONCURRENCY environment variable, or 1)
+        batch_size: Number of reminders packed into a single model request
+            (default from the BATCH_SIZE environment variable, or 1)
+        commit_size: Number of printed reminders moved to the processed
+            calendar with a single store commit, 0 to commit once at the end
+            of the run (default from the COMMIT_SIZE environment variable,
+            or 1)
+    """
+    engine = Engine(
+        concurrency=concurrency,
+        batch_size=batch_size,
+        commit_size=commit_size,
+    )
+    try:
+        engine.run_once()
+    finally:
+        engine.close()
+
+
+def watch():
+    """Run the Memento engine as a daemon printing reminders as they arrive."""
+    engine = Engine()
+    try:
+        engine.watch()
+    finally:
+        engine.close()
+
+
+async def _process_concurrently(
+        processor: LLMProcessor,
+        chunks: AsyncIterable[list[Reminder]],
+        concurrency: int,
+        batch_size: int,
+        handle: Callable[[Reminder, ReminderOutput], None],
+        metrics: Optional[Metrics] = None,
+):
+    """Extract reminders concurrently while handling them in order.
+
+    Every chunk of reminders is grouped into batches of `batch_size` as
+    soon as it arrives, and up to `concurrency` batches are sent to the
+    model at the same time. Results are handed to `handle` in the original
+    order, so printing and moving to the processed calendar happen exactly
+    as in the sequential mode.
+
+    Args:
+        processor: The LLM processor
+        chunks: Reminders to process, in print order, in chunks as they
+            are fetched
+        concurrency: Maximum number of in-flight model requests
+        batch_size: Number of reminders per model request
+        handle: Callback receiving each reminder and its output
+        metrics: Metrics recording one extract span per batch (optional)
+    """
+    metrics = metrics or Metrics()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def process(batch: list[Reminder]) -> list[ReminderOutput]:
+        async with semaphore:
+            with metrics.span("extract", reminders=len(batch)):
+                return await processor.aprocess_reminders(
+                    [reminder.text for reminder in batch]
+                )
+
+    tasks = []
+    # Batches and their tasks in order, None once every chunk arrived
+    started = asyncio.Queue()
+
+    async def start():
+        try:
+            async for chunk in chunks:
+                for i in range(0, len(chunk), batch_size):
+                    batch = chunk[i:i + batch_size]
+                    tasks.append(asyncio.create_task(process(batch)))
+                    started.put_nowait((batch, tasks[-1]))
+        finally:
+            started.put_nowait(None)
+
+    starter = asyncio.create_task(start())
+    try:
+        while (item := await started.get()) is not None:
+            batch, task = item
+            for reminder, processed in zip(batch, await task):
+                handle(reminder, processed)
+        # Raise any fetch error
+        await starter
+    finally:
+        starter.cancel()
+        for task in tasks:
+            task.cancel()
+
+
+class _Mover:
+    """Move printed reminders to the processed calendar, in print order.
+
+    Moves are committed to the store in groups of `commit_size`. A reminder
+    whose print job failed is left in place, so it is picked up again on the
+    next run.
+    """
+
+    def __init__(
+            self,
+            reminders: RemindersBackend,
+            commit_size: int = 1,
+            metrics: Optional[Metrics] = None,
+            journal: Optional[Journal] = None,
+    ):
+        """Initialize the mover.
+
+        Args:
+            reminders: The reminders store
+            commit_size: Number of reminders per store commit, 0 to commit
+                only when finishing (default 1)
+            metrics: Metrics recording a move span per commit (optional)
+            journal: Journal recording moved reminders (optional)
+        """
+        self.reminders = reminders
+        self.commit_size = commit_size
+        self.metrics = metrics or Metrics()
+        self.journal = journal
+        # Reminders handed to the print queue, in print order
+        self.printing: deque[tuple[Reminder, Future]] = deque()
+        # IDs of printed reminders waiting to be moved
+        self.printed: list[str] = []
+
+    def add(self, reminder: Reminder, job: Future):
+        """Track a print job and move any reminders printed so far.
+
+        Args:
+            reminder: The reminder being printed
+            job: The print job future
+        """
+        self.printing.append((reminder, job))
+        self._collect()
+
+    def poll(self):
+        """Move any reminders printed so far."""
+        self._collect()
+
+    def finish(self):
+        """Wait for all print jobs and move the remaining reminders."""
+        self._collect(wait=True)
+        self._commit()
+
+    def _collect(self, wait: bool = False):
+        """Collect finished print jobs in order and commit full groups."""
+        while self.printing and (wait or self.printing[0][1].done()):
+            reminder, job = self.printing.popleft()
+            try:
+                job.result()
+            except Exception:
+                logger.exception("Failed to print reminder %s", reminder.id)
+                continue
+            self.printed.append(reminder.id)
+            if 0 < self.commit_size <= len(self.printed):
+                self._commit()
+
+    def _commit(self):
+        """Move collected reminders with a single store commit."""
+        if not self.printed:
+            return
+        with self.metrics.span("move", reminders=len(self.printed)):
+            moved, errors = self.reminders.update_reminders(
+                self.printed, calendar=PROCESSED_CALENDAR, fields=["id"])
+        self.printed = []
+        for id, error in errors.items():
+            logger.error("Failed to move reminder %s: %s", id, error)
+        if self.journal is not None:
+            self.journal.moved(reminder.id for reminder in moved)
+
+
+def _print(
+        printer: Escpos,
+        processed: ReminderOutput,
+        metrics: Metrics,
+        journal: Optional[Journal] = None,
+        id: Optional[str] = None,
+):
+    """Render and print a processed reminder.
+
+    Args:
+        printer: The printer to print on
+        processed: The structured output for the reminder
+        metrics: Metrics recording the render and print spans
+        journal: Journal recording the rendered and printed stages
+            (optional)
+        id: The identifier of the reminder, required with a journal
+    """
+    with metrics.span("render"):
+        data = render_reminder(
+            title=processed.title,
+            text=processed.text,
+            link=processed.link,
+            assignee=processed.assignee,
+            profile=printer.profile,
+        )
+    if journal is not None:
+        journal.rendered(id, data)
+    _send(printer, data, metrics, journal, id)
+
+
+def _print_rendered(
+        printer: Escpos,
+        rendered: Future,
+        processed: ReminderOutput,
+        profile: Optional[str],
+        metrics: Metrics,
+        journal: Optional[Journal] = None,
+        id: Optional[str] = None,
+):
+    """Print a ticket rendered by the render pool.
+
+    A job that failed over to a printer with another profile is rendered
+    again for that printer.
+
+    Args:
+        printer: The printer to print on
+        rendered: Future resolved with the ESC/POS bytes of the ticket
+        processed: The structured output for the reminder
+        profile: Printer profile the ticket was rendered for
+        metrics: Metrics recording the render and print spans
+        journal: Journal recording the rendered and printed stages
+            (optional)
+        id: The identifier of the reminder, required with a journal
+    """
+    # Profile classes are cached by name, so equal profiles share a class
+    if type(printer.profile) is not type(get_profile(profile)):
+        _print(printer, processed, metrics, journal, id)
+        return
+    data = rendered.result()
+    if journal is not None:
+        journal.rendered(id, data)
+    _send(printer, data, metrics, journal, id)
+
+
+def _send(
+        printer: Escpos,
+        data: bytes,
+        metrics: Metrics,
+        journal: Optional[Journal] = None,
+        id: Optional[str] = None,
+):
+    """Send a rendered ticket to the printer.
+
+    Args:
+        printer: The printer to print on
+        data: The ESC/POS bytes of the ticket
+        metrics: Metrics recording the print span
+        journal: Journal recording the printed stage (optional)
+        id: The identifier of the reminder, required with a journal
+    """
+    with metrics.span("print", bytes=len(data)):
+        print_raw(data, printer=printer)
+    if journal is not None:
+        journal.printed(id)
+
+
+def _print_stream(
+        printer: Escpos,
+        ticket: TicketStream,
+        metrics: Metrics,
+        journal: Optional[Journal] = None,
+        id: Optional[str] = None,
+):
+    """Print a ticket while its content streams in.
+
+    Args:
+        printer: The printer to print on
+        ticket: The stream of ticket sections
+        metrics: Metrics recording the time to first paper
+        journal: Journal recording the printed stage (optional)
+        id: The identifier of the reminder, required with a journal
+    """
+    print_stream(ticket, printer=printer, profile=printer.profile)
+    if journal is not None:
+        journal.printed(id)
+    if ticket.started is not None and ticket.first_printed is not None:
+        metrics.observe("first_paper", ticket.first_printed - ticket.started)
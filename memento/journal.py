@@ -0,0 +1,226 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Iterable, Optional
+
+from memento.llm import ReminderOutput
+
+logger = logging.getLogger(__name__)
+
+# Stages a reminder goes through, in order
+EXTRACTED = "extracted"
+RENDERED = "rendered"
+PRINTED = "printed"
+MOVED = "moved"
+
+
+class Journal:
+    """Crash-safe, append-only record of the stage each reminder reached.
+
+    Every record is appended as a JSON line and fsync'd before the call
+    returns, so after a crash the engine knows which reminders were already
+    extracted, rendered or printed and resumes from there. Records of a
+    reminder are merged, and moved reminders are forgotten, as are
+    reminders no longer pending when the engine compacts the journal after
+    a run. The file is compacted to the unfinished reminders every
+    `compact_every` records.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            compact_every: int = int(
+                os.environ.get("JOURNAL_COMPACT_EVERY", "1000")),
+    ):
+        """Open the journal and replay existing records.
+
+        Args:
+            path: Path to the journal file.
+            compact_every: Number of appended records between compactions
+                (default 1000)
+        """
+        self.path = path
+        self.compact_every = compact_every
+        # Merged records of unfinished reminders, by reminder ID
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._appended = 0
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self._replay()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def get(self, id: str, text: str) -> Optional[dict[str, Any]]:
+        """Get the record of an unfinished reminder.
+
+        Args:
+            id: The identifier of the reminder.
+            text: The current text of the reminder. Records made for a
+                different text are ignored, as the reminder was edited.
+
+        Returns:
+            The merged record, with at least "stage", or None.
+        """
+        with self._lock:
+            entry = self.entries.get(id)
+        if entry is None or entry.get("digest") != _digest(text):
+            return None
+        return entry
+
+    def extracted(self, id: str, text: str, output: ReminderOutput):
+        """Record the extracted output of a reminder.
+
+        Args:
+            id: The identifier of the reminder.
+            text: The text the output was extracted from.
+            output: The structured output.
+        """
+        self._append([{
+            "id": id,
+            "stage": EXTRACTED,
+            "digest": _digest(text),
+            "output": output.model_dump(),
+        }])
+
+    def rendered(self, id: str, data: bytes):
+        """Record the rendered ticket of a reminder.
+
+        Args:
+            id: The identifier of the reminder.
+            data: The ESC/POS bytes of the ticket.
+        """
+        self._append([{
+            "id": id,
+            "stage": RENDERED,
+            "data": base64.b64encode(data).decode("ascii"),
+        }])
+
+    def printed(self, id: str):
+        """Record that the ticket of a reminder was printed.
+
+        Args:
+            id: The identifier of the reminder.
+        """
+        self._append([{"id": id, "stage": PRINTED}])
+
+    def moved(self, ids: Iterable[str]):
+        """Record that reminders were moved, with a single fsync.
+
+        Args:
+            ids: The identifiers of the moved reminders.
+        """
+        self._append([{"id": id, "stage": MOVED} for id in ids])
+
+    def compact(self, pending: Optional[Iterable[str]] = None):
+        """Atomically rewrite the journal with the unfinished reminders.
+
+        Args:
+            pending: The identifiers of all pending reminders. Entries of
+                other reminders, e.g. deleted or completed outside the app,
+                or moved just before a crash, are dropped (default keep all)
+        """
+        with self._lock:
+            if pending is not None:
+                pending = set(pending)
+                self.entries = {
+                    id: entry for id, entry in self.entries.items()
+                    if id in pending
+                }
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for entry in self.entries.values():
+                    f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            _fsync_directory(self.path)
+            self._file.close()
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._appended = 0
+
+    def close(self):
+        """Compact and close the journal."""
+        self.compact()
+        self._file.close()
+
+    @staticmethod
+    def output(entry: dict[str, Any]) -> ReminderOutput:
+        """Return the extracted output stored in a record."""
+        return ReminderOutput.model_validate(entry["output"])
+
+    @staticmethod
+    def data(entry: dict[str, Any]) -> bytes:
+        """Return the rendered ticket stored in a record."""
+        return base64.b64decode(entry["data"])
+
+    def _append(self, records: list[dict[str, Any]]):
+        """Append records, fsync them and update the entries."""
+        if not records:
+            return
+        with self._lock:
+            self._file.write(
+                "".join(json.dumps(record) + "\n" for record in records))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            for record in records:
+                self._apply(record)
+            self._appended += len(records)
+            compact = self._appended >= self.compact_every
+        if compact:
+            self.compact()
+
+    def _apply(self, record: dict[str, Any]):
+        """Merge a record into the entries."""
+        if record["stage"] == MOVED:
+            self.entries.pop(record["id"], None)
+        elif record["stage"] == EXTRACTED:
+            self.entries[record["id"]] = record
+        elif record["id"] in self.entries:
+            self.entries[record["id"]].update(record)
+
+    def _replay(self):
+        """Load the entries from the journal file.
+
+        A crash can leave the last line incomplete. It is cut off, so the
+        next appended record starts on a line of its own.
+        """
+        complete = 0
+        with open(self.path, "rb") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.endswith(b"\n"):
+                    logger.warning(
+                        "Dropping incomplete journal record %s:%d",
+                        self.path, number)
+                    break
+                complete += len(line)
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning(
+                        "Ignoring corrupt journal record %s:%d",
+                        self.path, number)
+                    continue
+                self._apply(record)
+        if complete < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(complete)
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def _digest(text: str) -> str:
+    """Return a short digest identifying a reminder text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _fsync_directory(path: str):
+    """Make a rename in the directory of a file durable."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
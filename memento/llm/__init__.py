@@ -1,3 +1,6 @@
-__all__ = ["LLMProcessor"]
+__all__ = ["LLMProcessor", "ModelRouter", "ReminderCache", "ReminderOutput"]
 
+from memento.llm.cache import ReminderCache
+from memento.llm.models import ReminderOutput
 from memento.llm.ollama import LLMProcessor
+from memento.llm.router import ModelRouter
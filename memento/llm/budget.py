@@ -0,0 +1,102 @@
+import json
+import math
+
+from memento.llm.models import ReminderOutput
+from memento.llm.rules import ASSIGNEE_PATTERN, MAX_TITLE_LENGTH, URL_PATTERN
+
+# Characters per token of English text and JSON, used to estimate prompt
+# sizes. Other languages can take about twice as many tokens.
+CHARS_PER_TOKEN = 4
+# Characters per token assumed when sizing the generation limit, so it also
+# holds for non-English text
+OUTPUT_CHARS_PER_TOKEN = 2
+# Headroom over the estimated output, as a factor and a fixed number of
+# tokens, so a slightly longer rewrite is never cut off
+OUTPUT_MARGIN = 2
+OUTPUT_SLACK = 16
+# Tokens of every response around the output: the tool call and the empty
+# think block of reasoning models
+OUTPUT_ENVELOPE = 32
+# Smallest generation limit of a request
+MIN_OUTPUT_TOKENS = 256
+# Marks the place where truncated notes were cut
+ELLIPSIS = " [...]"
+
+
+def count_tokens(text: str, chars_per_token: int = CHARS_PER_TOKEN) -> int:
+    """Estimate the number of tokens in a text.
+
+    Args:
+        text: The text
+        chars_per_token: Characters per token (default `CHARS_PER_TOKEN`)
+
+    Returns:
+        The estimated number of tokens, at least 1 for a non-empty text.
+    """
+    return math.ceil(len(text) / chars_per_token)
+
+
+def truncate_notes(text: str, budget: int) -> str:
+    """Shorten a reminder text to a token budget.
+
+    The first line, the reminder title, is always kept. The notes after it
+    are cut at a word boundary, and links and @NAME mentions from the cut
+    part are appended, so the link and assignee can still be extracted.
+
+    Args:
+        text: The raw reminder text
+        budget: Maximum number of tokens of the text, 0 for no limit
+
+    Returns:
+        The text, truncated if it is over the budget.
+    """
+    title, _, notes = text.partition("\n")
+    if not budget or not notes or count_tokens(text) <= budget:
+        return text
+    limit = max(0, budget * CHARS_PER_TOKEN - len(title) - len(ELLIPSIS) - 1)
+    kept, cut = notes[:limit], notes[limit:]
+    if cut and not cut[0].isspace() and " " in kept:
+        kept, rest = kept.rsplit(" ", 1)
+        cut = rest + cut
+    keep = URL_PATTERN.findall(cut) + [
+        f"@{name}" for name in ASSIGNEE_PATTERN.findall(cut)]
+    notes = (kept.rstrip() + ELLIPSIS).strip()
+    return "\n".join(part for part in (title, notes, " ".join(keep)) if part)
+
+
+def output_tokens(text: str) -> int:
+    """Size the generation limit for the output of a reminder text.
+
+    Every `ReminderOutput` field is budgeted from what it can hold: the
+    JSON keys, a title of at most `MAX_TITLE_LENGTH` characters, a rewrite
+    of the text, and the links and mentions found in the text.
+
+    Args:
+        text: The reminder text sent to the model
+
+    Returns:
+        The maximum number of tokens the output needs, with headroom.
+    """
+    keys = json.dumps(dict.fromkeys(ReminderOutput.model_fields))
+    links = " ".join(URL_PATTERN.findall(text))
+    assignees = " ".join(ASSIGNEE_PATTERN.findall(text))
+    estimate = math.ceil(MAX_TITLE_LENGTH / OUTPUT_CHARS_PER_TOKEN) + sum(
+        count_tokens(part, OUTPUT_CHARS_PER_TOKEN)
+        for part in (keys, text, links, assignees)
+    )
+    return estimate * OUTPUT_MARGIN + OUTPUT_SLACK
+
+
+def generation_limit(texts: list[str], max_tokens: int) -> int:
+    """Size the generation limit of a model request.
+
+    Args:
+        texts: The reminder texts sent to the model
+        max_tokens: The upper limit
+
+    Returns:
+        The tokens the outputs and the response envelope can need, at least
+        `MIN_OUTPUT_TOKENS` and at most `max_tokens`.
+    """
+    needed = OUTPUT_ENVELOPE + sum(output_tokens(text) for text in texts)
+    return min(max_tokens, max(MIN_OUTPUT_TOKENS, needed))
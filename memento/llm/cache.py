@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from memento.llm.models import ReminderOutput
+
+
+class ReminderCache:
+    """Persistent SQLite cache for LLM extraction results.
+
+    Entries are keyed by a hash of everything that influences the model
+    output, so a changed prompt, model or sampling setting never returns a
+    stale result.
+    """
+
+    def __init__(
+            self,
+            path: str = os.environ.get("CACHE_PATH", "memento-cache.sqlite3"),
+            ttl: Optional[float] = float(os.environ.get("CACHE_TTL", "0")),
+            max_entries: int = int(
+                os.environ.get("CACHE_MAX_ENTRIES", "10000")),
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl: Seconds after which entries expire, 0 or None to never
+                expire (default 0)
+            max_entries: Maximum number of entries kept, least recently used
+                entries are evicted first (default 10000)
+        """
+        self.ttl = ttl or None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS outputs ("
+                " key TEXT PRIMARY KEY,"
+                " output TEXT NOT NULL,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL"
+                ")"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS outputs_accessed"
+                " ON outputs (accessed)"
+            )
+
+    @staticmethod
+    def key(text: str, prompt: str, model_name: str, settings: dict) -> str:
+        """Build a cache key.
+
+        Args:
+            text: The raw reminder text
+            prompt: The prompt template used for extraction
+            model_name: Name of the model
+            settings: Sampling settings passed to the model
+
+        Returns:
+            A hex SHA-256 digest identifying the request.
+        """
+        payload = json.dumps(
+            [text, prompt, model_name, settings],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ReminderOutput]:
+        """Get a cached output.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached output, or None if missing or expired.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT output, created FROM outputs WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl and now - row[1] > self.ttl:
+                self._connection.execute(
+                    "DELETE FROM outputs WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE outputs SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return ReminderOutput.model_validate_json(row[0])
+
+    def set(self, key: str, output: ReminderOutput):
+        """Store an output and evict entries over the limits.
+
+        Args:
+            key: The cache key
+            output: The output to store
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO outputs (key, output, created, accessed)"
+                " VALUES (?, ?, ?, ?)",
+                (key, output.model_dump_json(), now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        """Remove expired entries and trim the cache to `max_entries`."""
+        if self.ttl:
+            self._connection.execute(
+                "DELETE FROM outputs WHERE created < ?", (now - self.ttl,))
+        self._connection.execute(
+            "DELETE FROM outputs WHERE key NOT IN ("
+            " SELECT key FROM outputs ORDER BY accessed DESC LIMIT ?"
+            ")",
+            (self.max_entries,),
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM outputs").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "size": size}
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._connection.close()
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ReminderOutput(BaseModel):
+    title: str = Field(description="Short title for the reminder")
+    text: Optional[str] = Field(
+        description="Main text of the reminder",
+        default=None,
+    )
+    link: Optional[str] = Field(
+        description="Any link found in the reminder",
+        default=None,
+    )
+    assignee: Optional[str] = Field(
+        description="Person assigned to do reminder",
+        default=None,
+    )
+
+
+class BatchOutput(BaseModel):
+    reminders: list[ReminderOutput] = Field(
+        description="One result per input reminder, in the input order",
+    )
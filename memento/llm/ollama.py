@@ -1,29 +1,41 @@
+import logging
+import math
 import os
-from typing import Optional
+import re
+import threading
+import time
+from collections import Counter
+from typing import AsyncIterator, Optional
 
-from pydantic import BaseModel, Field
-from pydantic_ai import Agent
+import httpx
+from pydantic import ValidationError
+from pydantic_ai import Agent, capture_run_messages
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.messages import ModelResponse
 from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.settings import ModelSettings
 
-from memento.llm.prompt import PROMPT
+from memento.llm.budget import count_tokens, generation_limit, truncate_notes
+from memento.llm.cache import ReminderCache
+from memento.llm.models import BatchOutput, ReminderOutput
+from memento.llm.prompt import COMPACT_PROMPT, PROMPT, format_batch_prompt
+from memento.llm.router import ModelRouter
+from memento.llm.rules import extract_simple
+from memento.metrics import Metrics
 
+logger = logging.getLogger(__name__)
 
-class ReminderOutput(BaseModel):
-    title: str = Field(description="Short title for the reminder")
-    text: Optional[str] = Field(
-        description="Main text of the reminder",
-        default=None,
-    )
-    link: Optional[str] = Field(
-        description="Any link found in the reminder",
-        default=None,
-    )
-    assignee: Optional[str] = Field(
-        description="Person assigned to do reminder",
-        default=None,
-    )
+# Output fields in the order the model writes them
+OUTPUT_FIELDS = tuple(ReminderOutput.model_fields)
+# When models are loaded ahead of requests: never, once when the processor
+# is created, or additionally at the end of every engine run
+WARM_UP_POLICIES = ("off", "start", "run")
+# Units of a Go duration, as parsed by Ollama, in seconds
+DURATION_UNITS = {
+    "ns": 1e-9, "us": 1e-6, "µs": 1e-6, "μs": 1e-6, "ms": 1e-3,
+    "s": 1, "m": 60, "h": 3600,
+}
+DURATION_PART = re.compile(r"(\d+\.?\d*|\.\d+)(ns|us|µs|μs|ms|s|m|h)")
 
 
 class LLMProcessor:
@@ -33,6 +45,20 @@ class LLMProcessor:
             temperature: float = float(os.environ.get("TEMPERATURE", "0.3")),
             max_tokens: int = int(os.environ.get("MAX_TOKENS", "2048")),
             top_p: float = float(os.environ.get("TOP_P", "0.95")),
+            cache: Optional[ReminderCache] = None,
+            fast_path: bool = os.environ.get(
+                "FAST_PATH", "true").lower() in ("1", "true", "yes"),
+            base_url: str = os.environ.get(
+                "OLLAMA_BASE_URL", "http://localhost:11434/v1"),
+            small_model_name: Optional[str] = os.environ.get("SMALL_MODEL"),
+            small_max_length: int = int(
+                os.environ.get("SMALL_MODEL_MAX_LENGTH", "120")),
+            warm_up: str = os.environ.get("WARM_UP", "start"),
+            keep_alive: str = os.environ.get("OLLAMA_KEEP_ALIVE", "30m"),
+            metrics: Optional[Metrics] = None,
+            compact_prompt: bool = os.environ.get(
+                "COMPACT_PROMPT", "false").lower() in ("1", "true", "yes"),
+            notes_budget: int = int(os.environ.get("NOTES_BUDGET", "512")),
     ):
         """Initialize the LLMProcessor with Ollama model.
 
@@ -41,24 +67,92 @@ class LLMProcessor:
             temperature: Sampling temperature for the model (default 0.3)
             max_tokens: Maximum number of tokens to generate (default 2048)
             top_p: Top-p sampling parameter (default 0.95)
+            cache: Optional cache of extraction results (default None)
+            fast_path: Extract simple reminders with rules instead of the
+                model (default True)
+            base_url: OpenAI-compatible API endpoint of the Ollama server,
+                or a comma-separated list of endpoints to spread requests
+                over (default "http://localhost:11434/v1")
+            small_model_name: Name of a small, fast model for short
+                reminders, None to use `model_name` for all of them
+                (default None)
+            small_max_length: Longest reminder text in characters sent to
+                the small model (default 120)
+            warm_up: When to load the models on every endpoint ahead of
+                requests, one of `WARM_UP_POLICIES` (default "start")
+            keep_alive: How long Ollama keeps a model loaded after a
+                request or warm-up, as a duration such as "30m" or
+                "1h30m", or a number of seconds, negative for ever. It is
+                sent with every request, and requests count as warm if the
+                model was used within this time (default "30m")
+            metrics: Metrics recording warm-up, model load and cold and
+                warm request latencies (default new metrics)
+            compact_prompt: Send the compact prompt, with shorter
+                instructions, instead of the full one (default False)
+            notes_budget: Maximum number of tokens of a reminder text sent
+                to the model, longer notes are truncated, 0 for no limit
+                (default 512)
         """
-        model = OpenAIModel(
+        if warm_up not in WARM_UP_POLICIES:
+            raise ValueError(f"Unknown warm-up policy: {warm_up}")
+        self.keep_alive_seconds = keep_alive_seconds(keep_alive)
+        self.model_name = model_name
+        self.max_tokens = max_tokens
+        self.settings = ModelSettings(
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+        )
+        self.cache = cache
+        self.fast_path = fast_path
+        # Number of reminders handled by each path (fast_path, cache, model)
+        # and number of failed batch requests (batch_fallback)
+        self.stats = Counter()
+        # Model usage summed over all requests (requests, request_tokens,
+        # response_tokens and total_tokens)
+        self.usage = Counter()
+        # Number of model requests answered by each model
+        self.models = Counter()
+        # Estimated prompt tokens sent and saved by the compact prompt and
+        # truncated notes, generation limits requested and saved by sizing
+        # them to the output, the number of truncated notes, and the number
+        # of requests retried with `max_tokens` after being cut off
+        self.tokens = Counter()
+        self.compact_prompt = compact_prompt
+        self.notes_budget = notes_budget
+        self.router = ModelRouter(
             model_name=model_name,
-            provider=OpenAIProvider(  # pragma: no cover
-                base_url="http://localhost:11434/v1",
-                api_key="ollama",
-            ),
+            small_model_name=small_model_name,
+            base_urls=[url.strip() for url in base_url.split(",")],
+            small_max_length=small_max_length,
+            # Every request asks Ollama to keep its model loaded, the
+            # cache keys only cover the settings that change the output
             settings=ModelSettings(
-                temperature=temperature,
-                max_tokens=max_tokens,
-                top_p=top_p,
+                **self.settings,
+                extra_body={"keep_alive": _keep_alive_value(keep_alive)},
             ),
         )
+        # Agents default to the large model, each run passes the routed one
         self.agent = Agent(
-            model=model,
+            model=self.router.default,
             result_type=ReminderOutput,
             system_prompt="/nothink",
         )
+        self.batch_agent = Agent(
+            model=self.router.default,
+            result_type=BatchOutput,
+            system_prompt="/nothink",
+        )
+        self.warm_up_policy = warm_up
+        self.keep_alive = keep_alive
+        self.metrics = metrics or Metrics()
+        # perf_counter() times each model, by id, was known to be loaded
+        # since and last finished a request or warm-up, to tell cold
+        # requests from warm ones
+        self._loaded: dict[int, tuple[float, float]] = {}
+        self._warm_up_thread: Optional[threading.Thread] = None
+        if warm_up != "off":
+            self.preload()
 
     def process_reminder(self, text: str,
                          debug: bool = False) -> ReminderOutput:
@@ -70,8 +164,431 @@ class LLMProcessor:
             debug: If True, prints debug information (default False)
 
         Returns:
+            The structured reminder output.
+        """
+        key, output = self._lookup(text)
+        if output is None:
+            prompt, settings = self._request([text])
+            model = self.router.model([text])
+            start = time.perf_counter()
+            try:
+                with capture_run_messages() as messages:
+                    result = self.agent.run_sync(
+                        prompt, model=model, model_settings=settings)
+            except UnexpectedModelBehavior:
+                if not self._cut_off(_response_tokens(messages), settings):
+                    raise
+                result = self.agent.run_sync(
+                    prompt, model=model, model_settings=self._full_limit())
+            self._observe(model, start)
+            output = self._output(result, debug=debug)
+            self._cache_set(key, output)
+            self.stats["model"] += 1
+        return self._finalize(output)
+
+    async def aprocess_reminder(self, text: str,
+                                debug: bool = False) -> ReminderOutput:
+        """Asynchronously process a reminder text.
+
+        Several calls can be awaited at once to send multiple reminders to
+        the model concurrently.
+
+        Args:
+            text: The raw reminder text to process
+            debug: If True, prints debug information (default False)
+
+        Returns:
+            The structured reminder output.
+        """
+        key, output = self._lookup(text)
+        if output is None:
+            result = await self._arun(self.agent, [text])
+            output = self._output(result, debug=debug)
+            self._cache_set(key, output)
+            self.stats["model"] += 1
+        return self._finalize(output)
+
+    async def aprocess_reminders(
+            self,
+            texts: list[str],
+            debug: bool = False,
+    ) -> list[ReminderOutput]:
+        """Process several reminders with a single model request.
+
+        Reminders that can be answered by the fast path or the cache are
+        resolved first, the rest are packed into one batch prompt. If the
+        batch response does not validate or does not contain one result per
+        reminder, every reminder is retried on its own.
+
+        Args:
+            texts: The raw reminder texts to process
+            debug: If True, prints debug information (default False)
+
+        Returns:
+            The structured reminder outputs, in the order of `texts`.
+        """
+        keys = []
+        outputs = []
+        for text in texts:
+            key, output = self._lookup(text)
+            keys.append(key)
+            outputs.append(output)
+        missing = [i for i, output in enumerate(outputs) if output is None]
+
+        batch = []
+        if len(missing) == 1:
+            text = texts[missing[0]]
+            result = await self._arun(self.agent, [text])
+            batch = [self._output(result, debug=debug)]
+        elif len(missing) > 1:
+            try:
+                batch_texts = [texts[i] for i in missing]
+                result = await self._arun(self.batch_agent, batch_texts)
+                batch = self._output(result, debug=debug).reminders
+                if len(batch) != len(missing):
+                    raise UnexpectedModelBehavior(
+                        f"Expected {len(missing)} results, got {len(batch)}"
+                    )
+            except UnexpectedModelBehavior:
+                self.stats["batch_fallback"] += 1
+                batch = []
+                for i in missing:
+                    result = await self._arun(self.agent, [texts[i]])
+                    batch.append(self._output(result, debug=debug))
+
+        for i, output in zip(missing, batch):
+            outputs[i] = output
+            self._cache_set(keys[i], output)
+            self.stats["model"] += 1
+
+        return [self._finalize(output) for output in outputs]
+
+    async def astream_reminder(
+            self,
+            text: str,
+            debug: bool = False,
+    ) -> AsyncIterator[tuple[str, Optional[str]]]:
+        """Stream the fields of a reminder output as soon as they are complete.
+
+        Fields are yielded in the order of `ReminderOutput`. A field is
+        complete once the model has started another field after it, so the
+        title is known after a handful of tokens, also if the model leaves
+        out the optional fields or writes them in another order. Outputs
+        from the fast path or the cache are yielded at once.
+
+        Args:
+            text: The raw reminder text to process
+            debug: If True, prints debug information (default False)
+
+        Yields:
+            The name and value of every output field.
+        """
+        key, output = self._lookup(text)
+        sent = 0
+        # Fields the model has started, in the order it started them
+        started: list[str] = []
+        if output is None:
+            prompt, settings = self._request([text])
+            model = self.router.model([text])
+            start = time.perf_counter()
+            result = None
+            try:
+                async with self.agent.run_stream(
+                        prompt,
+                        model=model,
+                        model_settings=settings,
+                ) as result:
+                    async for partial in result.stream(debounce_by=None):
+                        output = partial
+                        started += [
+                            name for name in OUTPUT_FIELDS
+                            if name in partial.model_fields_set
+                            and name not in started
+                        ]
+                        complete = _complete_fields(started)
+                        for name in OUTPUT_FIELDS[sent:complete]:
+                            yield name, getattr(partial, name)
+                        sent = max(sent, complete)
+            # A streamed output is validated as a whole at its end
+            except (UnexpectedModelBehavior, ValidationError):
+                tokens = result and result.usage().response_tokens
+                if not self._cut_off(tokens, settings):
+                    raise
+                # Fields already sent were complete, the rest come from
+                # the retried output
+                result = await self.agent.run(
+                    prompt, model=model, model_settings=self._full_limit())
+                output = result.output
+            self._observe(model, start)
+            self._record(result, debug=debug)
+            self._cache_set(key, output)
+            self.stats["model"] += 1
+
+        # The last field is only complete with the whole output, so the
+        # default assignee is applied before it is sent
+        output = self._finalize(output)
+        for name in OUTPUT_FIELDS[sent:]:
+            yield name, getattr(output, name)
+
+    def warm_up(self) -> dict[str, float]:
+        """Load every model on every endpoint and wait until they are ready.
+
+        Each model is asked to stay loaded for `keep_alive`. Endpoints that
+        cannot be reached are logged and skipped.
+
+        Returns:
+            The warm-up time in seconds of each "model@endpoint".
+        """
+        timings = {}
+        for name, models in self.router.models.items():
+            for model, base_url in zip(models, self.router.base_urls):
+                start = time.perf_counter()
+                try:
+                    response = httpx.post(
+                        _native_url(base_url) + "/api/generate",
+                        json={
+                            "model": name,
+                            "keep_alive": _keep_alive_value(self.keep_alive),
+                        },
+                        timeout=self.router.http_client.timeout,
+                    )
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    logger.warning(
+                        "Could not warm up %s at %s: %s", name, base_url, e)
+                    continue
+                seconds = time.perf_counter() - start
+                self._used(model, start)
+                timings[f"{name}@{base_url}"] = seconds
+                self.metrics.observe("warm_up", seconds)
+                # Ollama reports the time spent loading the model, 0 if it
+                # was already loaded
+                load = response.json().get("load_duration", 0) / 1e9
+                if load:
+                    self.metrics.observe("model_load", load)
+        return timings
+
+    def preload(self):
+        """Warm up the models in the background, unless already under way."""
+        if self._warm_up_thread and self._warm_up_thread.is_alive():
+            return
+        self._warm_up_thread = threading.Thread(
+            target=self.warm_up, daemon=True)
+        self._warm_up_thread.start()
+
+    def keep_warm(self):
+        """Apply the warm-up policy at the end of an engine run.
+
+        With the "run" policy the models are warmed up again, so Ollama
+        keeps every model loaded for `keep_alive` after the run, also the
+        ones the run did not use, and the next run, e.g. from cron, starts
+        warm.
+        """
+        if self.warm_up_policy == "run":
+            if self._warm_up_thread is not None:
+                self._warm_up_thread.join()
+            self.warm_up()
+
+    async def aclose(self):
+        """Close the connections to the Ollama servers."""
+        await self.router.http_client.aclose()
+
+    async def _arun(self, agent: Agent, texts: list[str]):
+        """Run an agent on the model routed for the reminder texts.
+
+        Args:
+            agent: The agent to run
+            texts: The raw reminder texts, one for the single reminder
+                prompt, several for the batch prompt
+
+        Returns:
+            The agent run result.
+        """
+        prompt, settings = self._request(texts)
+        model = self.router.model(texts)
+        start = time.perf_counter()
+        try:
+            with capture_run_messages() as messages:
+                result = await agent.run(
+                    prompt, model=model, model_settings=settings)
+        except UnexpectedModelBehavior:
+            if not self._cut_off(_response_tokens(messages), settings):
+                raise
+            result = await agent.run(
+                prompt, model=model, model_settings=self._full_limit())
+        self._observe(model, start)
+        return result
+
+    def _request(self, texts: list[str]) -> tuple[str, ModelSettings]:
+        """Build the prompt and generation limit of a model request.
+
+        Notes over `notes_budget` are truncated, and the generation limit
+        is sized to the outputs, never above `max_tokens`. The tokens this
+        saves compared to the full prompt and `max_tokens` are counted in
+        `tokens`.
+
+        Args:
+            texts: The raw reminder texts, one for the single reminder
+                prompt, several for the batch prompt
+
+        Returns:
+            The prompt and the model settings of the request.
+        """
+        prepared = [truncate_notes(text, self.notes_budget) for text in texts]
+        if len(texts) == 1:
+            template = COMPACT_PROMPT if self.compact_prompt else PROMPT
+            prompt = template.format(text=prepared[0])
+            full_prompt = PROMPT.format(text=texts[0])
+        else:
+            prompt = format_batch_prompt(prepared, compact=self.compact_prompt)
+            full_prompt = format_batch_prompt(texts)
+        max_tokens = generation_limit(prepared, self.max_tokens)
+
+        prompt_tokens = count_tokens(prompt)
+        self.tokens["prompt_tokens"] += prompt_tokens
+        self.tokens["prompt_tokens_saved"] += (
+            count_tokens(full_prompt) - prompt_tokens)
+        self.tokens["max_tokens"] += max_tokens
+        self.tokens["max_tokens_saved"] += self.max_tokens - max_tokens
+        self.tokens["notes_truncated"] += sum(
+            text != original for text, original in zip(prepared, texts))
+        return prompt, ModelSettings(max_tokens=max_tokens)
+
+    def _cut_off(
+            self,
+            tokens: Optional[int],
+            settings: ModelSettings,
+    ) -> bool:
+        """Check whether a failed run was cut off by a lowered limit.
+
+        A response reaching the generation limit is cut off, and so is its
+        retry with the same limit, so the run is retried once with
+        `max_tokens`. A response of unknown length counts as cut off.
+
+        Args:
+            tokens: Generated tokens of the last response, if known
+            settings: The model settings of the failed run
+
+        Returns:
+            True if the run should be retried with `max_tokens`.
+        """
+        limit = settings["max_tokens"]
+        if limit >= self.max_tokens or (tokens is not None and tokens < limit):
+            return False
+        logger.warning(
+            "Model output cut off at %d tokens, retrying with %d",
+            limit, self.max_tokens)
+        self.tokens["length_retries"] += 1
+        return True
+
+    def _full_limit(self) -> ModelSettings:
+        """Return the model settings of a retry with `max_tokens`."""
+        self.tokens["max_tokens"] += self.max_tokens
+        return ModelSettings(max_tokens=self.max_tokens)
+
+    def _observe(self, model: OpenAIModel, start: float):
+        """Record the latency of a model request as cold or warm.
+
+        Args:
+            model: The model the request was sent to
+            start: perf_counter() time the request started
+        """
+        warm = self._used(model, start)
+        self.metrics.observe(
+            "request_warm" if warm else "request_cold",
+            time.perf_counter() - start,
+        )
+
+    def _used(self, model: OpenAIModel, start: float) -> bool:
+        """Record that a request or warm-up of a model just finished.
+
+        A model is loaded once a request or warm-up finishes, and unloaded
+        `keep_alive` after the last one. Requests sent together to an
+        unloaded model all wait for it to load.
+
+        Args:
+            model: The model used
+            start: perf_counter() time the request or warm-up started
+
+        Returns:
+            True if the model was already loaded when it started.
+        """
+        end = time.perf_counter()
+        loaded, last_used = self._loaded.get(id(model), (None, None))
+        if loaded is None or (
+                start - last_used >= self.keep_alive_seconds):
+            # Unloaded when the request started, loaded by the time it ended
+            self._loaded[id(model)] = (end, end)
+            return False
+        self._loaded[id(model)] = (loaded, end)
+        return loaded <= start
+
+    def _lookup(
+            self, text: str
+    ) -> tuple[Optional[str], Optional[ReminderOutput]]:
+        """Try to produce an output without calling the model.
+
+        Args:
+            text: The raw reminder text
+
+        Returns:
+            The cache key for the text (None if it should not be cached) and
+            the output if the fast path or the cache produced one.
+        """
+        if self.fast_path:
+            output = extract_simple(text)
+            if output is not None:
+                self.stats["fast_path"] += 1
+                return None, output
+
+        key = self._cache_key(text)
+        output = self._cache_get(key)
+        if output is not None:
+            self.stats["cache"] += 1
+        return key, output
+
+    def _cache_key(self, text: str) -> Optional[str]:
+        """Return the cache key for a reminder text, if caching is enabled."""
+        if self.cache is None:
+            return None
+        return ReminderCache.key(
+            text=truncate_notes(text, self.notes_budget),
+            prompt=COMPACT_PROMPT if self.compact_prompt else PROMPT,
+            model_name=self.router.select([text]),
+            settings=dict(self.settings),
+        )
+
+    def _cache_get(self, key: Optional[str]) -> Optional[ReminderOutput]:
+        """Look up a cached output."""
+        if key is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_set(self, key: Optional[str], output: ReminderOutput):
+        """Store an output in the cache."""
+        if key is not None:
+            self.cache.set(key, output)
+
+    def _output(self, result, debug: bool = False) -> ReminderOutput:
+        """Extract the output from an agent run result and record its usage.
+
+        Args:
+            result: The agent run result
+            debug: If True, prints debug information (default False)
+
+        Returns:
+            The structured reminder output as returned by the model.
+        """
+        self._record(result, debug=debug)
+        return result.output
+
+    def _record(self, result, debug: bool = False):
+        """Record the usage of an agent run, streamed or not.
+
+        Args:
+            result: The agent run result
+            debug: If True, prints debug information (default False)
         """
-        result = self.agent.run_sync(PROMPT.format(text=text))
         if debug:
             print("-" * 30 + "\nDEBUG INFO START\n" + "-" * 30)
             for message in result.all_messages():
@@ -79,8 +596,106 @@ class LLMProcessor:
                     print(part)
             print("-" * 30 + "\nDEBUG INFO END\n" + "-" * 30)
 
-        output = result.output
+        usage = result.usage()
+        # Counted from the responses, as streamed runs over-report requests
+        for message in result.new_messages():
+            if isinstance(message, ModelResponse):
+                self.usage["requests"] += 1
+                self.models[message.model_name] += 1
+        self.usage["request_tokens"] += usage.request_tokens or 0
+        self.usage["response_tokens"] += usage.response_tokens or 0
+        self.usage["total_tokens"] += usage.total_tokens or 0
+
+    @staticmethod
+    def _finalize(output: ReminderOutput) -> ReminderOutput:
+        """Apply defaults to a model output.
+
+        Args:
+            output: The structured reminder output
+
+        Returns:
+            A copy of the output with the default assignee applied.
+        """
+        output = output.model_copy()
         if output.assignee is None:
             output.assignee = os.environ.get("DEFAULT_ASSIGNEE")
 
         return output
+
+
+def _complete_fields(started: list[str]) -> int:
+    """Count the leading fields of a partial output that are complete.
+
+    A field is complete once another field has started after it. A field
+    the model has not started yet holds back the fields declared after it.
+
+    Args:
+        started: Names of the fields the model has started, in the order
+            it started them
+
+    Returns:
+        The number of leading `OUTPUT_FIELDS` that are complete.
+    """
+    count = 0
+    for name in OUTPUT_FIELDS:
+        if name not in started[:-1]:
+            break
+        count += 1
+    return count
+
+
+def _response_tokens(messages: list) -> Optional[int]:
+    """Return the generated tokens of the last response of a run, if known."""
+    responses = [m for m in messages if isinstance(m, ModelResponse)]
+    return responses[-1].usage.response_tokens if responses else None
+
+
+def _native_url(base_url: str) -> str:
+    """Return the native Ollama API root of an OpenAI-compatible endpoint."""
+    return base_url.rstrip("/").removesuffix("/v1")
+
+
+def keep_alive_seconds(value: str) -> float:
+    """Convert an Ollama keep-alive duration into seconds.
+
+    Args:
+        value: A number of seconds, or a Go duration such as "500ms",
+            "5m0s" or "1h30m". Negative durations keep the model loaded
+            for ever.
+
+    Returns:
+        The duration in seconds.
+
+    Raises:
+        ValueError: If the value is not a valid duration.
+    """
+    text = value.strip()
+    try:
+        seconds = float(text)
+    except ValueError:
+        sign = -1 if text[:1] == "-" else 1
+        digits = text[1:] if text[:1] in "+-" else text
+        parts = DURATION_PART.findall(digits)
+        if not parts or "".join(map("".join, parts)) != digits:
+            raise ValueError(
+                f"Invalid keep-alive duration: {value!r}, expected a number "
+                f"of seconds or a duration such as \"30m\" or \"1h30m\""
+            ) from None
+        seconds = sign * sum(
+            float(number) * DURATION_UNITS[unit] for number, unit in parts)
+    if math.isnan(seconds):
+        raise ValueError(f"Invalid keep-alive duration: {value!r}")
+    return math.inf if seconds < 0 else seconds
+
+
+def _keep_alive_value(value: str):
+    """Return a keep-alive duration as sent to Ollama.
+
+    Ollama reads a JSON number as seconds and a string as a Go duration,
+    which needs a unit, so bare numbers are sent as numbers.
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        return value.strip()
+    return int(seconds) if seconds.is_integer() else seconds
@@ -14,12 +14,7 @@ Reminder text to process:
 {text}\
 """
 
-PROMPT = """\
-You are a task processing assistant. Analyze the following text and extract the required information according to these rules:
-
-INPUT TEXT:
-{text}
-
+RULES = """\
 EXTRACTION RULES:
 
 1. TITLE: Create a short, descriptive title (maximum 40 characters)
@@ -35,7 +30,77 @@ EXTRACTION RULES:
    - Look for @NAME patterns and remove the @ symbol
    - Set to null if no assignee is mentioned
 
-5. NULL RULE: Set any field to null if it cannot be determined from the input
+5. NULL RULE: Set any field to null if it cannot be determined from the input\
+"""
+
+PROMPT = """\
+You are a task processing assistant. Analyze the following text and extract the required information according to these rules:
+
+INPUT TEXT:
+{text}
+
+""" + RULES + """
 
 Process the text above and extract the information according to these rules.\
-"""
\ No newline at end of file
+"""
+
+BATCH_PROMPT = """\
+You are a task processing assistant. Analyze each of the following {count} reminders independently and extract the required information for every one of them according to these rules:
+
+INPUT REMINDERS:
+{reminders}
+
+""" + RULES + """
+
+Return exactly {count} results, one per reminder, in the same order as the input.\
+"""
+
+# Compact variants with the same sections, for a shorter prefill
+COMPACT_RULES = """\
+EXTRACTION RULES:
+title: short title, max 40 characters
+text: the task rewritten clearly, without links or @mentions; null if same as title
+link: URL in the text, else null
+assignee: @NAME mention without the @, else null\
+"""
+
+COMPACT_PROMPT = """\
+Extract the task.
+
+INPUT TEXT:
+{text}
+
+""" + COMPACT_RULES
+
+COMPACT_BATCH_PROMPT = """\
+Extract each of the {count} tasks independently.
+
+INPUT REMINDERS:
+{reminders}
+
+""" + COMPACT_RULES + """
+Return {count} results in input order.\
+"""
+
+BATCH_ITEM = """\
+--- REMINDER {number} ---
+{text}
+"""
+
+
+def format_batch_prompt(texts: list[str], compact: bool = False) -> str:
+    """Format the batch prompt for several reminders.
+
+    Args:
+        texts: The raw reminder texts
+        compact: Use the compact prompt (default False)
+
+    Returns:
+        The prompt asking for one result per reminder.
+    """
+    reminders = "".join(
+        BATCH_ITEM.format(number=number, text=text)
+        for number, text in enumerate(texts, start=1)
+    )
+    template = COMPACT_BATCH_PROMPT if compact else BATCH_PROMPT
+    return template.format(count=len(texts), reminders=reminders.strip())
@@ -0,0 +1,134 @@
+import itertools
+import os
+from typing import Iterable, Optional
+
+import httpx
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
+from pydantic_ai.settings import ModelSettings
+
+
+class ModelRouter:
+    """Choose the model and the Ollama endpoint of every model request.
+
+    Reminders no longer than `small_max_length` characters go to the small
+    model, longer ones to the large model, so the large model is only used
+    where the text needs it. Requests for a model rotate over the
+    endpoints, and every endpoint shares one HTTP client whose keep-alive
+    connections are reused across requests.
+    """
+
+    def __init__(
+            self,
+            model_name: str,
+            small_model_name: Optional[str] = None,
+            base_urls: Iterable[str] = ("http://localhost:11434/v1",),
+            small_max_length: int = 120,
+            settings: Optional[ModelSettings] = None,
+            http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Create a model per model name and endpoint.
+
+        Args:
+            model_name: Name of the large model
+            small_model_name: Name of the small model, None to send every
+                request to the large model (default None)
+            base_urls: OpenAI-compatible API endpoints of the Ollama
+                servers (default "http://localhost:11434/v1")
+            small_max_length: Longest reminder text in characters sent to
+                the small model (default 120)
+            settings: Model settings of every request (optional)
+            http_client: HTTP client shared by all endpoints (default a
+                client from `pooled_http_client`)
+        """
+        self.model_name = model_name
+        self.small_model_name = small_model_name
+        self.small_max_length = small_max_length
+        self.base_urls = list(base_urls)
+        self.http_client = http_client or pooled_http_client()
+        providers = [
+            OpenAIProvider(
+                base_url=base_url,
+                api_key="ollama",
+                http_client=self.http_client,
+            )
+            for base_url in self.base_urls
+        ]
+        if not providers:
+            raise ValueError("At least one Ollama endpoint is required")
+        self.models = {
+            name: [
+                OpenAIModel(
+                    model_name=name,
+                    provider=provider,
+                    settings=settings,
+                )
+                for provider in providers
+            ]
+            for name in (model_name, small_model_name) if name
+        }
+        self._cycles = {
+            name: itertools.cycle(models)
+            for name, models in self.models.items()
+        }
+
+    @property
+    def default(self) -> OpenAIModel:
+        """The large model on the first endpoint."""
+        return self.models[self.model_name][0]
+
+    def select(self, texts: Iterable[str]) -> str:
+        """Choose the model for a request.
+
+        Args:
+            texts: The reminder texts of the request
+
+        Returns:
+            The name of the small model if every text is short enough,
+            otherwise the name of the large model.
+        """
+        if self.small_model_name and all(
+                len(text) <= self.small_max_length for text in texts):
+            return self.small_model_name
+        return self.model_name
+
+    def model(self, texts: Iterable[str]) -> OpenAIModel:
+        """Return the model for a request on the next endpoint.
+
+        Args:
+            texts: The reminder texts of the request
+
+        Returns:
+            The model to run the request with.
+        """
+        return next(self._cycles[self.select(texts)])
+
+
+def pooled_http_client(
+        max_connections: int = int(
+            os.environ.get("OLLAMA_MAX_CONNECTIONS", "16")),
+        keepalive_expiry: float = float(
+            os.environ.get("OLLAMA_KEEPALIVE_EXPIRY", "60")),
+        timeout: float = float(os.environ.get("OLLAMA_TIMEOUT", "600")),
+) -> httpx.AsyncClient:
+    """Create an HTTP client keeping connections to Ollama alive.
+
+    Args:
+        max_connections: Maximum number of open connections, all of them
+            kept alive when idle (default 16)
+        keepalive_expiry: Seconds an idle connection is kept open
+            (default 60)
+        timeout: Request timeout in seconds, connecting times out after 5
+            (default 600)
+
+    Returns:
+        The HTTP client.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(timeout, connect=5),
+    )
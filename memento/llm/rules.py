@@ -0,0 +1,41 @@
+import re
+from typing import Optional
+
+from memento.llm.models import ReminderOutput
+
+URL_PATTERN = re.compile(r"https?://\S+")
+ASSIGNEE_PATTERN = re.compile(r"(?<!\S)@(\w[\w.-]*\w|\w)")
+MAX_TITLE_LENGTH = 40
+
+
+def extract_simple(text: str) -> Optional[ReminderOutput]:
+    """Extract a reminder without the model if the text is simple enough.
+
+    A reminder is simple when it is a single line with at most one link and
+    at most one @NAME mention, and what remains fits in a title.
+
+    Args:
+        text: The raw reminder text
+
+    Returns:
+        The structured reminder output, or None if the text needs the model.
+    """
+    text = text.strip()
+    if not text or "\n" in text:
+        return None
+
+    links = URL_PATTERN.findall(text)
+    assignees = ASSIGNEE_PATTERN.findall(text)
+    if len(links) > 1 or len(assignees) > 1:
+        return None
+
+    title = ASSIGNEE_PATTERN.sub(" ", URL_PATTERN.sub(" ", text))
+    title = " ".join(title.split()).strip(" :-,;")
+    if not title or len(title) > MAX_TITLE_LENGTH:
+        return None
+
+    return ReminderOutput(
+        title=title,
+        link=links[0].rstrip(".,;:!?)]") if links else None,
+        assignee=assignees[0] if assignees else None,
+    )
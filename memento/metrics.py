@@ -0,0 +1,167 @@
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Any, Iterator, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Label name and help text of every counter family
+COUNTERS = {
+    "reminders": ("path", "Reminders handled by each extraction path."),
+    "tokens": ("kind", "Model token usage."),
+    "models": ("model", "Model requests answered by each model."),
+    "budget": ("kind", "Estimated prompt and generation token budget."),
+}
+QUANTILES = (0.5, 0.95)
+
+
+class Metrics:
+    """Timing spans of the pipeline stages and counters.
+
+    Every span is logged as a JSON record at debug level. Stage durations
+    are kept as a running count and sum plus a window of recent samples for
+    quantiles, so memory stays bounded in a long-running process.
+    """
+
+    def __init__(self, window: int = 1024):
+        """Initialize empty metrics.
+
+        Args:
+            window: Number of recent samples per stage used for quantiles
+                (default 1024)
+        """
+        self.window = window
+        self.counts: Counter = Counter()
+        self.sums: Counter = Counter()
+        self.samples: dict[str, deque[float]] = {}
+        self.counters: dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage: str, **fields) -> Iterator[None]:
+        """Time a pipeline stage.
+
+        Args:
+            stage: Name of the stage
+            **fields: Additional fields for the log record
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.observe(stage, seconds)
+            logger.debug("%s", json.dumps(
+                {"stage": stage, "seconds": round(seconds, 6), **fields}))
+
+    def observe(self, stage: str, seconds: float):
+        """Record the duration of a stage.
+
+        Args:
+            stage: Name of the stage
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            self.counts[stage] += 1
+            self.sums[stage] += seconds
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=self.window)
+            self.samples[stage].append(seconds)
+
+    def set_counters(self, family: str, values: Mapping[str, float]):
+        """Set the values of a counter family.
+
+        Args:
+            family: Counter family, one of `COUNTERS`
+            values: Counter value by label value
+        """
+        with self._lock:
+            self.counters[family] = Counter(values)
+
+    def summary(self) -> dict[str, dict[str, Optional[float]]]:
+        """Return the count, sum, p50, p95 and max duration of every stage."""
+        with self._lock:
+            return {
+                stage: {
+                    "count": self.counts[stage],
+                    "sum": self.sums[stage],
+                    "p50": _quantile(samples, 0.5),
+                    "p95": _quantile(samples, 0.95),
+                    "max": max(samples, default=None),
+                }
+                for stage, samples in self.samples.items()
+            }
+
+    def to_json(self) -> str:
+        """Serialise the stage summary and counters to JSON."""
+        data: dict[str, Any] = {"stages": self.summary()}
+        with self._lock:
+            data.update(
+                (family, dict(values))
+                for family, values in self.counters.items()
+            )
+        return json.dumps(data, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Serialise the metrics in the Prometheus text format."""
+        lines = [
+            "# HELP memento_stage_seconds Time spent in each pipeline stage.",
+            "# TYPE memento_stage_seconds summary",
+        ]
+        for stage, summary in self.summary().items():
+            for quantile in QUANTILES:
+                value = summary[f"p{round(quantile * 100)}"]
+                lines.append(
+                    f'memento_stage_seconds{{stage="{stage}",'
+                    f'quantile="{quantile}"}} {value}'
+                )
+            lines.append(
+                f'memento_stage_seconds_sum{{stage="{stage}"}} '
+                f'{summary["sum"]}'
+            )
+            lines.append(
+                f'memento_stage_seconds_count{{stage="{stage}"}} '
+                f'{summary["count"]}'
+            )
+        with self._lock:
+            counters = {
+                family: dict(values)
+                for family, values in self.counters.items()
+            }
+        for family, values in counters.items():
+            label, help = COUNTERS[family]
+            name = f"memento_{family}_total"
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(values.items()):
+                lines.append(f'{name}{{{label}="{key}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Atomically write the metrics to a file.
+
+        Args:
+            path: Path of the metrics file, written as JSON if it ends with
+                ".json" and in the Prometheus text format otherwise.
+        """
+        if path.endswith(".json"):
+            data = self.to_json()
+        else:
+            data = self.to_prometheus()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+def _quantile(samples: deque[float], quantile: float) -> Optional[float]:
+    """Return the nearest-rank quantile of the samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(quantile * len(ordered)) - 1)]
@@ -1,3 +1,24 @@
-__all__ = ["print_reminder"]
+__all__ = [
+    "print_reminder",
+    "print_raw",
+    "print_stream",
+    "render_reminder",
+    "render_cache_stats",
+    "RenderPool",
+    "PrinterPool",
+    "PrintInterruptedError",
+    "PrinterSession",
+    "PrintQueue",
+    "TicketStream",
+]
 
-from memento.printer.reminder import print_reminder
+from memento.printer.pool import PrinterPool
+from memento.printer.reminder import print_reminder, print_raw, print_stream
+from memento.printer.render import RenderPool, render_reminder
+from memento.printer.session import (
+    PrintInterruptedError,
+    PrinterSession,
+    PrintQueue,
+)
+from memento.printer.stream import TicketStream
+from memento.printer.utils import render_cache_stats
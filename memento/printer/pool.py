@@ -0,0 +1,277 @@
+import itertools
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, Optional
+
+from escpos.exceptions import DeviceNotFoundError
+
+from memento.printer.session import (
+    PrintInterruptedError,
+    PrinterSession,
+    PrintQueue,
+)
+
+logger = logging.getLogger(__name__)
+
+# Routing strategies for reminders not matched by a rule
+ROUND_ROBIN = "round_robin"
+LEAST_QUEUE = "least_queue"
+ROUTINGS = (ROUND_ROBIN, LEAST_QUEUE)
+# Reminder fields a routing rule can match
+RULE_FIELDS = ("calendar", "assignee")
+
+
+class PrinterPool:
+    """Spread print jobs over several printers, each with its own queue.
+
+    A reminder goes to the printer of the first rule matching its calendar
+    or assignee, otherwise to the next printer in turn (round robin) or to
+    the printer with the fewest outstanding jobs (least queue). A job whose
+    printer cannot be reached marks it as unhealthy and is retried on
+    another printer. A job interrupted while printing also marks its
+    printer as unhealthy, but fails, as part of its ticket may have been
+    printed. Unhealthy printers get no new jobs until a background health
+    check reaches them again.
+    """
+
+    def __init__(
+            self,
+            queues: dict[str, PrintQueue],
+            routing: str = ROUND_ROBIN,
+            rules: Iterable[tuple[str, str, str]] = (),
+            health_interval: float = 30.0,
+    ):
+        """Start the health checks.
+
+        Args:
+            queues: Print queue of each printer, by printer name
+            routing: Strategy for reminders no rule matches, "round_robin"
+                or "least_queue" (default "round_robin")
+            rules: Routing rules as (field, value, printer name) tuples,
+                where field is "calendar" or "assignee"
+            health_interval: Seconds between health checks of unhealthy
+                printers (default 30)
+        """
+        if not queues:
+            raise ValueError("A printer pool needs at least one printer")
+        if routing not in ROUTINGS:
+            raise ValueError(f"Unknown printer routing: {routing}")
+        self.rules = list(rules)
+        for field, _, name in self.rules:
+            if field not in RULE_FIELDS:
+                raise ValueError(f"Unknown printer rule field: {field}")
+            if name not in queues:
+                raise ValueError(f"Unknown printer in rule: {name}")
+        self.queues = queues
+        self.routing = routing
+        self.health_interval = health_interval
+        self.unhealthy: set[str] = set()
+        # Jobs submitted to each printer and not finished yet
+        self.outstanding = dict.fromkeys(queues, 0)
+        self.failovers = 0
+        self._cycle = itertools.cycle(queues)
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._check, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls) -> "PrinterPool":
+        """Create a pool from environment variables.
+
+        PRINTERS lists the printers as comma-separated
+        `[name=]host[:port][/profile]` entries, the name defaulting to the
+        host, the port to 9100 and the profile to PRINTER_PROFILE.
+        PRINTER_ROUTING selects the strategy, PRINTER_RULES lists
+        `field:value=name` rules, e.g. `calendar:Work=office`, and
+        PRINTER_HEALTH_INTERVAL the seconds between health checks.
+
+        Returns:
+            The printer pool.
+        """
+        queues = {}
+        for entry in _split(os.environ.get("PRINTERS", "")):
+            name, _, address = entry.rpartition("=")
+            address, _, profile = address.partition("/")
+            host, _, port = address.partition(":")
+            queues[name or host] = PrintQueue(PrinterSession(
+                host=host,
+                port=int(port or "9100"),
+                profile=profile or None,
+            ))
+        rules = []
+        for entry in _split(os.environ.get("PRINTER_RULES", "")):
+            condition, _, name = entry.rpartition("=")
+            field, _, value = condition.partition(":")
+            rules.append((field, value, name))
+        return cls(
+            queues,
+            routing=os.environ.get("PRINTER_ROUTING", ROUND_ROBIN),
+            rules=rules,
+            health_interval=float(
+                os.environ.get("PRINTER_HEALTH_INTERVAL", "30")),
+        )
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting to be printed on all printers."""
+        return sum(queue.depth for queue in self.queues.values())
+
+    def select(
+            self,
+            calendar: Optional[str] = None,
+            assignee: Optional[str] = None,
+    ) -> "_Route":
+        """Choose the printer for a reminder.
+
+        Args:
+            calendar: The calendar of the reminder
+            assignee: The assignee of the reminder
+
+        Returns:
+            The route to the printer, with the `session` and `submit` of a
+            `PrintQueue`.
+        """
+        values = {"calendar": calendar, "assignee": assignee}
+        with self._lock:
+            for field, value, name in self.rules:
+                if values[field] == value and name not in self.unhealthy:
+                    return _Route(self, name)
+            return _Route(self, self._choose(set()))
+
+    def stats(self) -> dict[str, Any]:
+        """Return per-printer queue statistics and the pool health."""
+        return {
+            "printers": {
+                name: queue.stats() for name, queue in self.queues.items()
+            },
+            "unhealthy": sorted(self.unhealthy),
+            "failovers": self.failovers,
+        }
+
+    def close(self):
+        """Stop the health checks and close every printer queue."""
+        self._closed.set()
+        self._thread.join()
+        for queue in self.queues.values():
+            queue.close()
+
+    def _choose(self, tried: set[str]) -> Optional[str]:
+        """Pick a printer by the routing strategy, the lock held.
+
+        Unhealthy and already tried printers are skipped. If every untried
+        printer is unhealthy, one of them is picked anyway, as the job would
+        fail otherwise.
+
+        Args:
+            tried: Printers the job already failed on
+
+        Returns:
+            The printer name, or None if every printer was tried.
+        """
+        names = [name for name in self.queues if name not in tried]
+        healthy = [name for name in names if name not in self.unhealthy]
+        names = healthy or names
+        if not names:
+            return None
+        if self.routing == LEAST_QUEUE:
+            return min(names, key=self.outstanding.__getitem__)
+        for name in self._cycle:
+            if name in names:
+                return name
+
+    def _submit(
+            self,
+            name: str,
+            job: Callable[..., Any],
+            args: tuple,
+            kwargs: dict[str, Any],
+            future: Future,
+            tried: set[str],
+    ):
+        """Queue a job on a printer, failing over if it cannot be reached.
+
+        Args:
+            name: The printer to print on
+            job: Callable receiving the printer as its first argument
+            args: Additional positional arguments for the job
+            kwargs: Additional keyword arguments for the job
+            future: Future resolved when the job has been printed
+            tried: Printers the job already failed on
+        """
+        with self._lock:
+            self.outstanding[name] += 1
+
+        def done(inner: Future):
+            with self._lock:
+                self.outstanding[name] -= 1
+            error = inner.exception()
+            if error is None:
+                future.set_result(inner.result())
+                return
+            unreachable = isinstance(error, (OSError, DeviceNotFoundError))
+            if not unreachable and not isinstance(
+                    error, PrintInterruptedError):
+                future.set_exception(error)
+                return
+            with self._lock:
+                if name not in self.unhealthy:
+                    logger.warning("Printer %s failed: %s", name, error)
+                self.unhealthy.add(name)
+                tried.add(name)
+                other = self._choose(tried) if unreachable else None
+                if other is not None:
+                    self.failovers += 1
+            if other is None:
+                future.set_exception(error)
+            else:
+                logger.warning("Failing over from printer %s to %s",
+                               name, other)
+                self._submit(other, job, args, kwargs, future, tried)
+
+        self.queues[name].submit(job, *args, **kwargs).add_done_callback(done)
+
+    def _check(self):
+        """Health check loop bringing back reachable printers."""
+        while not self._closed.wait(self.health_interval):
+            for name in list(self.unhealthy):
+                if self.queues[name].session.check():
+                    logger.info("Printer %s is back", name)
+                    with self._lock:
+                        self.unhealthy.discard(name)
+
+
+class _Route:
+    """A printer chosen by a `PrinterPool`, used like its `PrintQueue`."""
+
+    def __init__(self, pool: PrinterPool, name: str):
+        self.pool = pool
+        self.name = name
+
+    @property
+    def session(self) -> PrinterSession:
+        """The printer session of the chosen printer."""
+        return self.pool.queues[self.name].session
+
+    def submit(self, job: Callable[..., Any], *args, **kwargs) -> Future:
+        """Queue a print job on the chosen printer.
+
+        Args:
+            job: Callable receiving the printer as its first argument
+            *args: Additional positional arguments for the job
+            **kwargs: Additional keyword arguments for the job
+
+        Returns:
+            A future resolved when the job has been printed, on this or,
+            after a connection error, another printer.
+        """
+        future = Future()
+        self.pool._submit(self.name, job, args, kwargs, future, set())
+        return future
+
+
+def _split(value: str) -> list[str]:
+    """Split a comma-separated setting, skipping empty entries."""
+    return [entry.strip() for entry in value.split(",") if entry.strip()]
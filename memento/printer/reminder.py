@@ -1,9 +1,13 @@
 import os
-from typing import Optional
+import time
+from typing import Optional, Union
 
+from escpos.capabilities import BaseProfile
+from escpos.escpos import Escpos
 from escpos.printer import Network
 
-from memento.printer import utils
+from memento.printer.render import render_cut, render_reminder, render_section
+from memento.printer.stream import TicketStream
 
 
 def print_reminder(
@@ -11,6 +15,8 @@ def print_reminder(
         text: Optional[str] = None,
         link: Optional[str] = None,
         assignee: Optional[str] = None,
+        printer: Optional[Escpos] = None,
+        profile: Optional[str] = None,
 ):
     """Print a reminder.
 
@@ -19,21 +25,79 @@ def print_reminder(
         text: The body text of the reminder
         link: Any URL or link associated with the reminder
         assignee: The name of the person assigned to the reminder
+        printer: Printer to use, e.g. from a `PrinterSession`. If not
+            provided, a connection is opened and closed for this reminder.
+        profile: Printer profile name, or the profile of the printer, used
+            to render the ticket (default from PRINTER_PROFILE)
     """
-    p = Network(
+    data = render_reminder(
+        title=title,
+        text=text,
+        link=link,
+        assignee=assignee,
+        profile=profile,
+    )
+    print_raw(data, printer=printer)
+
+
+def print_raw(data: bytes, printer: Optional[Escpos] = None):
+    """Send pre-rendered ESC/POS bytes to the printer in a single write.
+
+    Args:
+        data: The rendered ticket, e.g. from `render_reminder`
+        printer: Printer to use, e.g. from a `PrinterSession`. If not
+            provided, a connection is opened and closed for this write.
+    """
+    p = printer or _network_printer()
+    try:
+        p._raw(data)
+    finally:
+        if printer is None:
+            p.close()
+
+
+def print_stream(
+        ticket: TicketStream,
+        printer: Optional[Escpos] = None,
+        profile: Union[str, BaseProfile, None] = None,
+):
+    """Print a ticket section by section while its content arrives.
+
+    Each section is written as soon as it is taken from the stream, and the
+    paper is cut when the stream is closed. If the stream fails after some
+    sections were printed, the paper is still cut so the next ticket starts
+    on a clean page, and the error is raised.
+
+    Args:
+        ticket: The stream of ticket sections
+        printer: Printer to use, e.g. from a `PrinterSession`. If not
+            provided, a connection is opened and closed for this ticket.
+        profile: Printer profile name, or the profile of the printer, used
+            to render the ticket (default from PRINTER_PROFILE)
+    """
+    p = printer or _network_printer()
+    printed = False
+    try:
+        for name, value in ticket:
+            if value is None:
+                continue
+            p._raw(render_section(name, value, profile=profile))
+            printed = True
+            if ticket.first_printed is None:
+                ticket.first_printed = time.perf_counter()
+    finally:
+        try:
+            if printed:
+                p._raw(render_cut(profile=profile))
+        finally:
+            if printer is None:
+                p.close()
+
+
+def _network_printer() -> Network:
+    """Create a printer connection from the environment configuration."""
+    return Network(
         host=os.environ.get("PRINTER_HOST"),
+        port=int(os.environ.get("PRINTER_PORT", "9100")),
         profile=os.environ.get("PRINTER_PROFILE"),
     )
-    # Print the title
-    utils.print_title(p, title)
-    # Print the body text if provided
-    if text is not None:
-        utils.print_body(p, text)
-    # Print the link if provided
-    if link is not None:
-        utils.print_link(p, link)
-    # Print the assignee name if provided
-    if assignee is not None:
-        utils.print_assignee(p, assignee)
-    # Cut the paper
-    p.cut()
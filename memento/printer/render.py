@@ -0,0 +1,166 @@
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Union
+
+from escpos.capabilities import BaseProfile
+from escpos.magicencode import MagicEncode
+from escpos.printer import Dummy
+
+from memento.printer import utils
+
+# Functions printing each section of a ticket, in ticket order
+SECTIONS = {
+    "title": utils.print_title,
+    "text": utils.print_body,
+    "link": utils.print_link,
+    "assignee": utils.print_assignee,
+}
+
+
+def render_reminder(
+        title: str,
+        text: Optional[str] = None,
+        link: Optional[str] = None,
+        assignee: Optional[str] = None,
+        profile: Union[str, BaseProfile, None] = None,
+) -> bytes:
+    """Render a reminder ticket into ESC/POS bytes.
+
+    The whole ticket, including the paper cut, is built in memory so it can
+    be sent to the printer in a single write.
+
+    Args:
+        title: The title of the reminder
+        text: The body text of the reminder
+        link: Any URL or link associated with the reminder
+        assignee: The name of the person assigned to the reminder
+        profile: Printer profile name, or the profile of the printer the
+            ticket is for (default from PRINTER_PROFILE)
+
+    Returns:
+        The ESC/POS commands for the ticket.
+    """
+    p = _dummy(profile)
+    # Print the title
+    utils.print_title(p, title)
+    # Print the body text if provided
+    if text is not None:
+        utils.print_body(p, text)
+    # Print the link if provided
+    if link is not None:
+        utils.print_link(p, link)
+    # Print the assignee name if provided
+    if assignee is not None:
+        utils.print_assignee(p, assignee)
+    # Cut the paper
+    p.cut()
+    return p.output
+
+
+def render_section(
+        name: str,
+        value: str,
+        profile: Union[str, BaseProfile, None] = None,
+) -> bytes:
+    """Render one section of a reminder ticket into ESC/POS bytes.
+
+    Used to print a ticket while the rest of its content is still being
+    generated.
+
+    Args:
+        name: The section, one of `SECTIONS`
+        value: The content of the section
+        profile: Printer profile name, or the profile of the printer the
+            ticket is for (default from PRINTER_PROFILE)
+
+    Returns:
+        The ESC/POS commands for the section.
+    """
+    p = _dummy(profile)
+    SECTIONS[name](p, value)
+    return p.output
+
+
+def render_cut(profile: Union[str, BaseProfile, None] = None) -> bytes:
+    """Render the paper cut ending a ticket into ESC/POS bytes.
+
+    Args:
+        profile: Printer profile name, or the profile of the printer the
+            ticket is for (default from PRINTER_PROFILE)
+
+    Returns:
+        The ESC/POS commands for the cut.
+    """
+    p = _dummy(profile)
+    p.cut()
+    return p.output
+
+
+class RenderPool:
+    """Render reminder tickets in worker processes.
+
+    Title-casing, wrapping, layout and QR generation run outside the engine
+    process, so rendering scales across cores independently of model and
+    printer latency. Each job returns the ticket as ready-to-send bytes.
+    """
+
+    def __init__(
+            self,
+            workers: Optional[int] = None,
+            profile: Optional[str] = None,
+    ):
+        """Start the worker processes.
+
+        Args:
+            workers: Number of worker processes (default one per CPU)
+            profile: Printer profile (default from PRINTER_PROFILE)
+        """
+        self.profile = profile or os.environ.get("PRINTER_PROFILE")
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+
+    def submit(
+            self,
+            title: str,
+            text: Optional[str] = None,
+            link: Optional[str] = None,
+            assignee: Optional[str] = None,
+            profile: Optional[str] = None,
+    ) -> Future:
+        """Queue a ticket for rendering.
+
+        Args:
+            title: The title of the reminder
+            text: The body text of the reminder
+            link: Any URL or link associated with the reminder
+            assignee: The name of the person assigned to the reminder
+            profile: Printer profile of the ticket (default the pool's)
+
+        Returns:
+            A future resolved with the ESC/POS bytes of the ticket.
+        """
+        return self.executor.submit(
+            render_reminder, title, text, link, assignee,
+            profile or self.profile)
+
+    def close(self):
+        """Wait for queued tickets and stop the worker processes."""
+        self.executor.shutdown()
+
+
+def _dummy(profile: Union[str, BaseProfile, None]) -> Dummy:
+    """Create an in-memory printer rendering for a profile.
+
+    Args:
+        profile: Printer profile name, or the profile of a printer
+            (default from PRINTER_PROFILE)
+
+    Returns:
+        The in-memory printer.
+    """
+    if profile is None or isinstance(profile, str):
+        return Dummy(profile=profile or os.environ.get("PRINTER_PROFILE"))
+    p = Dummy()
+    p.profile = profile
+    # The encoder holds the code pages of the profile it was created with
+    p.magic = MagicEncode(p)
+    return p
@@ -0,0 +1,234 @@
+import logging
+import os
+import queue
+import select
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from escpos.exceptions import DeviceNotFoundError
+from escpos.printer import Network
+
+logger = logging.getLogger(__name__)
+
+
+class PrintInterruptedError(Exception):
+    """A print job failed after it may have printed part of its ticket.
+
+    Unlike a connection error, it is not retried, as that could print the
+    ticket twice.
+    """
+    pass
+
+
+class PrinterSession:
+    """Long-lived connection to a network printer.
+
+    The same socket is reused for every job, and reopened if the printer
+    closed it. If connecting fails, nothing was printed and the connection
+    is retried. A job failing once connected is not retried, as part of
+    its ticket may have been printed, and raises `PrintInterruptedError`.
+    """
+
+    def __init__(
+            self,
+            host: Optional[str] = None,
+            port: Optional[int] = None,
+            profile: Optional[str] = None,
+            retries: int = 1,
+    ):
+        """Initialize the session without connecting.
+
+        Args:
+            host: Printer host (default from PRINTER_HOST)
+            port: Printer port (default from PRINTER_PORT, or 9100)
+            profile: Printer profile (default from PRINTER_PROFILE)
+            retries: Number of reconnect attempts per job (default 1)
+        """
+        self.profile = profile or os.environ.get("PRINTER_PROFILE")
+        self.printer = Network(
+            host=host or os.environ.get("PRINTER_HOST"),
+            port=port or int(os.environ.get("PRINTER_PORT", "9100")),
+            profile=self.profile,
+        )
+        self.retries = retries
+
+    def run(self, job: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a print job on the shared connection.
+
+        Args:
+            job: Callable receiving the printer as its first argument
+            *args: Additional positional arguments for the job
+            **kwargs: Additional keyword arguments for the job
+
+        Returns:
+            Whatever the job returns.
+
+        Raises:
+            DeviceNotFoundError: If the printer cannot be reached, nothing
+                was printed.
+            PrintInterruptedError: If the job failed once connected.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                self._connect()
+                break
+            except (OSError, DeviceNotFoundError):
+                # The printer reconnects on first use, also after a failed
+                # reconnect, so the next attempt or job starts afresh
+                self.close()
+                if attempt == self.retries:
+                    raise
+                logger.warning("Printer connection failed, reconnecting")
+        try:
+            return job(self.printer, *args, **kwargs)
+        except (OSError, DeviceNotFoundError) as e:
+            self.close()
+            raise PrintInterruptedError(
+                f"Printing was interrupted: {e}") from e
+
+    def check(self, timeout: float = 1.0) -> bool:
+        """Check that the printer accepts connections.
+
+        A separate connection is opened and closed right away, the session
+        connection is left untouched.
+
+        Args:
+            timeout: Connection timeout in seconds (default 1)
+
+        Returns:
+            True if the printer is reachable.
+        """
+        try:
+            socket.create_connection(
+                (self.printer.host, self.printer.port), timeout).close()
+        except OSError:
+            return False
+        return True
+
+    def close(self):
+        """Close the printer connection."""
+        self.printer.close()
+        self.printer.device = False
+
+    def _connect(self):
+        """Open the connection, replacing one the printer has closed.
+
+        Raises:
+            DeviceNotFoundError: If the printer cannot be reached.
+        """
+        device = self.printer._device
+        if device and _closed_by_peer(device):
+            self.close()
+        # Reading the device opens the connection if needed
+        if self.printer.device is None:
+            raise DeviceNotFoundError(
+                f"Printer {self.printer.host} is not connected")
+
+
+class PrintQueue:
+    """Print jobs in a background thread, one at a time, in FIFO order."""
+
+    def __init__(self, session: PrinterSession, maxsize: int = 0):
+        """Start the print worker.
+
+        Args:
+            session: The printer session used for all jobs
+            maxsize: Maximum number of queued jobs, 0 for unbounded
+                (default 0)
+        """
+        self.session = session
+        # Number of printed jobs, and their total and longest time in
+        # seconds, kept as running values so memory stays bounded
+        self.jobs = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._queue = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._work, daemon=True)
+        self._thread.start()
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting to be printed."""
+        return self._queue.qsize()
+
+    def select(
+            self,
+            calendar: Optional[str] = None,
+            assignee: Optional[str] = None,
+    ) -> "PrintQueue":
+        """Return the queue for a reminder, always this one.
+
+        It lets a single queue stand in for a `PrinterPool`.
+
+        Args:
+            calendar: The calendar of the reminder
+            assignee: The assignee of the reminder
+
+        Returns:
+            This queue.
+        """
+        return self
+
+    def submit(self, job: Callable[..., Any], *args, **kwargs) -> Future:
+        """Queue a print job.
+
+        Args:
+            job: Callable receiving the printer as its first argument
+            *args: Additional positional arguments for the job
+            **kwargs: Additional keyword arguments for the job
+
+        Returns:
+            A future resolved when the job has been printed.
+        """
+        future = Future()
+        self._queue.put((future, job, args, kwargs))
+        return future
+
+    def stats(self) -> dict[str, float]:
+        """Return the queue depth and per-job latency statistics."""
+        return {
+            "depth": self.depth,
+            "jobs": self.jobs,
+            "mean_latency": (
+                self.total_latency / self.jobs if self.jobs else 0),
+            "max_latency": self.max_latency,
+        }
+
+    def close(self):
+        """Wait for queued jobs to finish and close the printer session."""
+        self._queue.put(None)
+        self._thread.join()
+        self.session.close()
+
+    def _work(self):
+        """Worker loop printing queued jobs."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            future, job, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            start = time.perf_counter()
+            try:
+                result = self.session.run(job, *args, **kwargs)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            latency = time.perf_counter() - start
+            self.jobs += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+
+def _closed_by_peer(sock: socket.socket) -> bool:
+    """Check without blocking whether the other end closed a socket."""
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable) and sock.recv(1, socket.MSG_PEEK) == b""
+    except (OSError, ValueError):
+        return True
@@ -0,0 +1,69 @@
+import queue
+import time
+from typing import Iterator, Optional
+
+# Marks the end of a ticket stream
+_END = object()
+
+
+class TicketStream:
+    """Sections of a ticket handed to the printer as soon as they are known.
+
+    The producer puts sections in ticket order and closes the stream, or
+    fails it with an exception. The printer iterates over the stream,
+    blocking until the next section arrives. Every iteration starts from
+    the first section, so a print job retried after a connection error
+    prints the whole ticket.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        # Sections received so far and the end marker or error, once known
+        self._sections: list[tuple[str, Optional[str]]] = []
+        self._end = None
+        # perf_counter() times when generation started and when the first
+        # section was sent to the printer
+        self.started: Optional[float] = None
+        self.first_printed: Optional[float] = None
+
+    def start(self):
+        """Record that the content of the ticket is being generated."""
+        self.started = time.perf_counter()
+
+    def put(self, name: str, value: Optional[str]):
+        """Add a section.
+
+        Args:
+            name: The section name, e.g. "title"
+            value: The content, None to skip the section
+        """
+        self._queue.put((name, value))
+
+    def close(self):
+        """Mark the ticket as complete."""
+        self._queue.put(_END)
+
+    def fail(self, error: BaseException):
+        """Abort the ticket, the printer raises the error.
+
+        Args:
+            error: The reason the ticket cannot be completed
+        """
+        self._queue.put(error)
+
+    def __iter__(self) -> Iterator[tuple[str, Optional[str]]]:
+        index = 0
+        while True:
+            if index < len(self._sections):
+                yield self._sections[index]
+                index += 1
+            elif self._end is None:
+                item = self._queue.get()
+                if item is _END or isinstance(item, BaseException):
+                    self._end = item
+                else:
+                    self._sections.append(item)
+            elif self._end is _END:
+                return
+            else:
+                raise self._end
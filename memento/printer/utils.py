@@ -1,11 +1,101 @@
+import os
+from functools import lru_cache
 from textwrap import wrap
 
 import textcase
-from escpos.printer import Network
+from escpos.escpos import Escpos
+from escpos.printer import Dummy
+
+# Number of title blocks, body blocks and QR codes kept by each render cache
+RENDER_CACHE_SIZE = int(os.environ.get("RENDER_CACHE_SIZE", "256"))
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def title_block(text: str, max_width: int = 20) -> str:
+    """Lay out a title in a box, splitting text across multiple lines.
+
+    Args:
+        text: The title text
+        max_width: Maximum characters per line (default 20)
+
+    Returns:
+        The boxed title, one line per printed line.
+    """
+    # Split title into words
+    lines = wrap(
+        textcase.title(
+            text,
+            boundaries=[textcase.SPACE],
+            strip_punctuation=False
+        ),
+        width=max_width,
+    )
+    return "".join([
+        f"┌─{'─' * max_width}─┐\n",
+        *(f"│ {line.center(max_width)} │\n" for line in lines),
+        f"└─{'─' * max_width}─┘\n\n",
+    ])
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def body_block(text: str, max_width: int = 22) -> str:
+    """Lay out body text centered across multiple lines.
+
+    Args:
+        text: The body text
+        max_width: Maximum characters per line (default 22)
+
+    Returns:
+        The centered text, one line per printed line.
+    """
+    lines = wrap(text, width=max_width)
+    return "".join(f"{line.center(max_width)}\n" for line in lines) + "\n"
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def qr_data(link: str, size: int, profile: type) -> bytes:
+    """Render a QR code into ESC/POS raster data.
+
+    Args:
+        link: The content of the QR code
+        size: Pixel size of the QR code modules
+        profile: Printer profile class the raster is rendered for
+
+    Returns:
+        The ESC/POS commands printing the QR code.
+    """
+    p = Dummy()
+    p.profile = profile()
+    # Select a code page first, as the title already has on a real ticket,
+    # so the cached data does not carry a code page switch
+    p.text("\n")
+    p.clear()
+    p.qr(link, size=size)
+    return p.output
+
+
+def render_cache_stats() -> dict[str, dict[str, int]]:
+    """Return hits, misses and size of every render cache.
+
+    The caches are per process, so tickets rendered by a `RenderPool` are
+    counted in its worker processes.
+    """
+    return {
+        name: {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+        }
+        for name, info in (
+            ("title", title_block.cache_info()),
+            ("body", body_block.cache_info()),
+            ("qr", qr_data.cache_info()),
+        )
+    }
 
 
 def print_title(
-        p: Network,
+        p: Escpos,
         text: str,
         max_width: int = 20,
         font_width: int = 2,
@@ -20,16 +110,6 @@ def print_title(
         font_width: Width multiplier for the text (default 2)
         font_height: Height multiplier for the text (default 2)
     """
-    # Split title into words
-    lines = wrap(
-        textcase.title(
-            text,
-            boundaries=[textcase.SPACE],
-            strip_punctuation=False
-        ),
-        width=max_width,
-    )
-
     # Set text size and alignment
     p.set(
         align='center',
@@ -38,21 +118,14 @@ def print_title(
         height=font_height
     )
 
-    # Top border
-    p.text(f"┌─{'─' * max_width}─┐\n")
-
-    for line in lines:
-        p.text(f"│ {line.center(max_width)} │\n")
-
-    # Bottom border
-    p.text(f"└─{'─' * max_width}─┘\n\n")
+    p.text(title_block(text, max_width))
 
     # Reset to normal text size
     p.set(align="left", normal_textsize=True)
 
 
 def print_body(
-        p: Network,
+        p: Escpos,
         text: str,
         max_width: int = 22,
         font_width: int = 2,
@@ -67,9 +140,6 @@ def print_body(
         font_width: Width multiplier for the text (default 2)
         font_height: Height multiplier for the text (default 1)
     """
-    # Split title into words
-    lines = wrap(text, width=max_width)
-
     # Set text size and alignment
     p.set(
         align='center',
@@ -78,14 +148,12 @@ def print_body(
         height=font_height
     )
 
-    for line in lines:
-        p.text(f"{line.center(max_width)}\n")
-    p.text("\n")
+    p.text(body_block(text, max_width))
 
     # Reset to normal text size
     p.set(align="left", normal_textsize=True)
 
-def print_link(p: Network, link: str):
+def print_link(p: Escpos, link: str):
     """Print a QR code for the given link.
 
     Args:
@@ -94,14 +162,14 @@ def print_link(p: Network, link: str):
     """
     p.set(align="center")
 
-    # Print the QR code
-    p.qr(link, size=6)
+    # Print the QR code, rendered once per link and printer profile
+    p._raw(qr_data(link, 6, type(p.profile)))
 
     # Reset to normal text size
     p.set(align="left", normal_textsize=True)
 
 def print_assignee(
-        p: Network,
+        p: Escpos,
         text: str,
         font_width: int = 2,
         font_height: int = 1
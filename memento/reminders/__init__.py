@@ -1,4 +1,32 @@
-__all__ = ["Reminder", "Calendar", "Reminders"]
+__all__ = [
+    "Reminder",
+    "Calendar",
+    "FrozenReminder",
+    "FrozenCalendar",
+    "Reminders",
+    "RemindersBackend",
+    "RemindersError",
+    "SQLiteReminders",
+    "create_backend",
+]
 
-from memento.reminders.models import Reminder, Calendar
-from memento.reminders.reminders import Reminders
+from memento.reminders.backend import (
+    RemindersBackend,
+    RemindersError,
+    create_backend,
+)
+from memento.reminders.models import (
+    Calendar,
+    FrozenCalendar,
+    FrozenReminder,
+    Reminder,
+)
+from memento.reminders.sqlite import SQLiteReminders
+
+
+def __getattr__(name):
+    # The EventKit backend needs PyObjC, which is only available on macOS
+    if name == "Reminders":
+        from memento.reminders.reminders import Reminders
+        return Reminders
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
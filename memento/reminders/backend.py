@@ -0,0 +1,151 @@
+import os
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Optional, Protocol
+
+from memento.reminders.models import Calendar, Reminder
+
+
+class RemindersError(Exception):
+    """Base exception for reminder backend errors"""
+    pass
+
+
+class RemindersBackend(Protocol):
+    """CRUD interface every reminder source implements.
+
+    `memento.reminders.Reminders` implements it on top of EventKit and
+    `memento.reminders.sqlite.SQLiteReminders` on top of SQLite.
+    """
+
+    def create_reminder(
+            self, title: str,
+            notes: str = "",
+            due_date: Optional[datetime] = None,
+            priority: int = 0,
+            calendar: Optional[str] = None
+    ) -> Reminder:
+        """Create a new reminder."""
+        ...
+
+    def get_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+    ) -> list[Reminder]:
+        """Get all reminders matching the calendar filters."""
+        ...
+
+    async def aget_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+    ) -> list[Reminder]:
+        """Get all reminders without blocking the event loop."""
+        ...
+
+    def astream_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+    ) -> AsyncIterator[list[Reminder]]:
+        """Get reminders in chunks, each yielded as soon as it is fetched."""
+        ...
+
+    def get_reminder(self, id: str) -> Optional[Reminder]:
+        """Get a specific reminder by its ID."""
+        ...
+
+    def update_reminder(
+            self,
+            id: str,
+            title: Optional[str] = None,
+            notes: Optional[str] = None,
+            calendar: Optional[str] = None,
+            completed: Optional[bool] = None,
+            due_date: Optional[datetime] = None,
+            priority: Optional[int] = None
+    ) -> Reminder:
+        """Update a reminder."""
+        ...
+
+    def update_reminders(
+            self,
+            ids: Iterable[str],
+            title: Optional[str] = None,
+            notes: Optional[str] = None,
+            calendar: Optional[str] = None,
+            completed: Optional[bool] = None,
+            due_date: Optional[datetime] = None,
+            priority: Optional[int] = None,
+            fields: Optional[Iterable[str]] = None,
+    ) -> tuple[list[Reminder], dict[str, RemindersError]]:
+        """Apply the same update to many reminders with a single commit."""
+        ...
+
+    def delete_reminder(self, id: str) -> bool:
+        """Delete a reminder."""
+        ...
+
+    def create_calendar(self, title: str,
+                        color: Optional[str] = None) -> Calendar:
+        """Create a new calendar."""
+        ...
+
+    def get_calendars(self) -> list[Calendar]:
+        """Get all reminder calendars."""
+        ...
+
+    def get_calendar(self, id: str) -> Optional[Calendar]:
+        """Get a specific calendar by its ID."""
+        ...
+
+    def get_calendar_by_title(self, title: str) -> Optional[Calendar]:
+        """Get a calendar by its title."""
+        ...
+
+    def update_calendar(
+            self,
+            id: str,
+            title: Optional[str] = None,
+            color: Optional[str] = None
+    ) -> Calendar:
+        """Update a calendar."""
+        ...
+
+    def delete_calendar(self, id: str) -> bool:
+        """Delete a calendar."""
+        ...
+
+
+def create_backend(name: Optional[str] = None) -> RemindersBackend:
+    """Create the configured reminders backend.
+
+    Args:
+        name: Backend name, "eventkit" or "sqlite" (default from the
+            REMINDERS_BACKEND environment variable, or "eventkit")
+
+    Returns:
+        The reminders backend.
+    """
+    name = name or os.environ.get("REMINDERS_BACKEND", "eventkit")
+    if name == "eventkit":
+        # Imported lazily, PyObjC is only available on macOS
+        from memento.reminders.reminders import Reminders
+        return Reminders()
+    if name == "sqlite":
+        from memento.reminders.sqlite import SQLiteReminders
+        return SQLiteReminders(
+            os.environ.get("REMINDERS_DB", "memento-reminders.sqlite3"))
+    raise RemindersError(f"Unknown reminders backend: {name}")
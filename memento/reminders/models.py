@@ -1,10 +1,133 @@
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field, fields, make_dataclass
 from datetime import datetime
-from typing import Optional
+from functools import cache
+from typing import Any, Optional, get_args
 
 
-@dataclass
-class Calendar:
+class _Record:
+    """Tuple, JSON and msgpack serialisation shared by the models.
+
+    A record is serialised as the tuple of its field values in declaration
+    order. JSON and msgpack encode that tuple as an array, with datetimes
+    as ISO 8601 strings. Decoding tolerates arrays missing trailing fields,
+    which then take their defaults.
+    """
+
+    __slots__ = ()
+
+    def to_tuple(self) -> tuple:
+        """Return the field values in declaration order."""
+        # Dataclasses list their init fields, in order, in __match_args__
+        return tuple(getattr(self, name) for name in self.__match_args__)
+
+    @classmethod
+    def from_tuple(cls, values: tuple):
+        """Create a record from field values in declaration order.
+
+        Args:
+            values: The field values.
+
+        Returns:
+            The record.
+        """
+        return cls(*values)
+
+    def to_json(self) -> str:
+        """Serialise the record to a JSON array."""
+        return json.dumps(self._encode(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str | bytes):
+        """Create a record from a JSON array.
+
+        Args:
+            data: The output of `to_json`.
+
+        Returns:
+            The record.
+        """
+        return cls._decode(json.loads(data))
+
+    def to_msgpack(self) -> bytes:
+        """Serialise the record to a msgpack array.
+
+        Requires the optional `msgpack` package.
+        """
+        # Imported lazily, msgpack is an optional dependency
+        import msgpack
+        return msgpack.packb(self._encode())
+
+    @classmethod
+    def from_msgpack(cls, data: bytes):
+        """Create a record from a msgpack array.
+
+        Requires the optional `msgpack` package.
+
+        Args:
+            data: The output of `to_msgpack`.
+
+        Returns:
+            The record.
+        """
+        import msgpack
+        return cls._decode(msgpack.unpackb(data))
+
+    def _encode(self) -> list:
+        """Convert the field values to JSON compatible values."""
+        return [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in self.to_tuple()
+        ]
+
+    @classmethod
+    def _decode(cls, values: list):
+        """Create a record from the output of `_encode`."""
+        for i in _datetime_indexes(cls):
+            if i < len(values) and values[i] is not None:
+                values[i] = datetime.fromisoformat(values[i])
+        return cls(*values)
+
+
+@cache
+def _datetime_indexes(cls: type) -> tuple[int, ...]:
+    """Return the positions of the datetime fields of a record class."""
+    return tuple(
+        i for i, f in enumerate(fields(cls))
+        if f.type is datetime or datetime in get_args(f.type)
+    )
+
+
+def _frozen(cls: type, doc: str) -> type:
+    """Create a frozen copy of a record class.
+
+    Args:
+        cls: The record class to copy.
+        doc: Docstring of the new class.
+
+    Returns:
+        A slotted, frozen dataclass with the same fields and properties.
+    """
+    namespace: dict[str, Any] = {
+        "__doc__": doc,
+        "__module__": cls.__module__,
+    }
+    namespace.update(
+        (name, value) for name, value in vars(cls).items()
+        if isinstance(value, property)
+    )
+    return make_dataclass(
+        f"Frozen{cls.__name__}",
+        [(f.name, f.type, field(default=f.default)) for f in fields(cls)],
+        bases=(_Record,),
+        namespace=namespace,
+        frozen=True,
+        slots=True,
+    )
+
+
+@dataclass(slots=True)
+class Calendar(_Record):
     """Represents a calendar with its properties."""
     id: str
     title: str
@@ -13,8 +136,8 @@ class Calendar:
     is_subscribed: bool = False
 
 
-@dataclass
-class Reminder:
+@dataclass(slots=True)
+class Reminder(_Record):
     """Represents a reminder with all its properties."""
     id: str
     title: str
@@ -26,8 +149,15 @@ class Reminder:
     priority: int = 0
     calendar: Optional[str] = None
     url: Optional[str] = None
+    modification_date: Optional[datetime] = None
 
     @property
     def text(self) -> str:
         """Return the reminder text, combining title and notes."""
         return f"{self.title}\n{self.notes}".strip()
+
+
+FrozenCalendar = _frozen(
+    Calendar, "Immutable, hashable calendar with the fields of Calendar.")
+FrozenReminder = _frozen(
+    Reminder, "Immutable, hashable reminder with the fields of Reminder.")
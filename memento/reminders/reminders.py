@@ -1,23 +1,39 @@
+import asyncio
+import threading
 import time
+import weakref
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Iterable, Optional
 
 from EventKit import (
     EKReminder,
     EKCalendar,
     EKEventStore,
+    EKEventStoreChangedNotification,
     EKEntityTypeReminder,
     EKSourceTypeLocal,
     EKSourceTypeCalDAV,
 )
-from Foundation import NSDate, NSDateComponents  # noqa: F401
+from Foundation import (  # noqa: F401
+    NSDate,
+    NSDateComponents,
+    NSNotificationCenter,
+    NSRunLoop,
+)
 
+from memento.reminders.backend import RemindersError
 from memento.reminders.models import Calendar, Reminder
 from memento.reminders.utils import hex_to_ns_color, reminder_from_ek, \
-    calendar_from_ek
+    calendar_from_ek, LazyReminder
+
+
+# Seconds to wait for EventKit completion handlers
+TIMEOUT = 10
+# Seconds to wait for the change notifications of our own commits
+OWN_CHANGES_DELAY = 0.5
 
 
-class PyObjCRemindersError(Exception):
+class PyObjCRemindersError(RemindersError):
     """Custom exception for PyObjC Reminders errors"""
     pass
 
@@ -29,15 +45,48 @@ class Reminders:
         """Initialize the EventKit store and request permissions."""
         self.event_store = EKEventStore.alloc().init()
         self.access_granted = False
+        # Calendars, calendars by title and calendars by ID, built on demand
+        self._calendar_index = None
+        # Set whenever the event store reports a change
+        self._changed = threading.Event()
+        # Whether we committed since the last wait for changes, and whether
+        # change notifications are currently ignored as our own
+        self._own_changes = False
+        self._ignore_changes = False
+        # The block only holds a weak reference, so an instance that is not
+        # closed can still be collected
+        ref = weakref.ref(self)
+
+        def on_store_changed(notification):
+            reminders = ref()
+            if reminders is not None:
+                reminders._on_store_changed()
+
+        self._observer = (
+            NSNotificationCenter.defaultCenter()
+            .addObserverForName_object_queue_usingBlock_(
+                EKEventStoreChangedNotification,
+                self.event_store,
+                None,
+                on_store_changed,
+            )
+        )
         self._request_access()
 
+    def close(self):
+        """Stop observing event store changes."""
+        if self._observer is not None:
+            NSNotificationCenter.defaultCenter().removeObserver_(
+                self._observer)
+            self._observer = None
+
     def _request_access(self):
         """Request access to reminders."""
-        completion_called = [False]
+        completed = threading.Event()
 
         def completion_handler(granted, error):
             self.access_granted = granted
-            completion_called[0] = True
+            completed.set()
 
         try:
             self.event_store.requestFullAccessToRemindersWithCompletion_(
@@ -53,9 +102,7 @@ class Reminders:
                 )
 
         # Wait for completion
-        start_time = time.time()
-        while not completion_called[0] and time.time() - start_time < 10:
-            time.sleep(0.1)
+        completed.wait(TIMEOUT)
 
         if not self.access_granted:
             raise PyObjCRemindersError("Access to reminders was denied")
@@ -65,6 +112,104 @@ class Reminders:
         if not self.access_granted:
             raise PyObjCRemindersError("No access to reminders")
 
+    def _get_calendar_index(self) -> tuple[list, dict, dict]:
+        """Get the reminder calendars, indexed by title and by ID.
+
+        The index is built on first use and reused until the event store
+        reports a change or a calendar is created, updated or deleted.
+
+        Returns:
+            All EKCalendar objects, a title to EKCalendar mapping and an ID
+            to EKCalendar mapping.
+        """
+        index = self._calendar_index
+        if index is None:
+            calendars = list(
+                self.event_store.calendarsForEntityType_(EKEntityTypeReminder)
+            )
+            by_title = {}
+            for calendar in calendars:
+                # Keep the first calendar for duplicate titles
+                by_title.setdefault(calendar.title(), calendar)
+            by_id = {
+                calendar.calendarIdentifier(): calendar
+                for calendar in calendars
+            }
+            index = self._calendar_index = (calendars, by_title, by_id)
+        return index
+
+    def _find_calendar(
+            self,
+            title: Optional[str] = None,
+            id: Optional[str] = None
+    ) -> Optional[EKCalendar]:
+        """Find an EKCalendar by title or by ID.
+
+        Args:
+            title: The title of the calendar.
+            id: The identifier of the calendar.
+
+        Returns:
+            The EKCalendar if found, otherwise None.
+        """
+        _, by_title, by_id = self._get_calendar_index()
+        if id is not None:
+            return by_id.get(id)
+        return by_title.get(title)
+
+    def _invalidate_calendars(self):
+        """Drop the calendar index so it is rebuilt on next use."""
+        self._calendar_index = None
+
+    def _on_store_changed(self):
+        """Handle an EKEventStoreChangedNotification.
+
+        The calendar index is always dropped, since calendars may also have
+        changed outside the app, but our own commits do not wake up
+        `wait_for_changes`.
+        """
+        self._invalidate_calendars()
+        if not self._ignore_changes:
+            self._changed.set()
+
+    def _committed(self):
+        """Record a commit of ours, whose change notification is ignored."""
+        self._own_changes = True
+
+    def wait_for_changes(self, timeout: float) -> bool:
+        """Wait until the event store reports a change.
+
+        The current run loop is run while waiting, so that EventKit can
+        deliver its change notifications. Notifications delivered within
+        `OWN_CHANGES_DELAY` after our own commits are ignored, as they
+        report our own writes; an outside change made at the same time is
+        then only seen on the next change or timeout.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if a change was reported, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        run_loop = NSRunLoop.currentRunLoop()
+        if self._own_changes:
+            self._own_changes = False
+            self._ignore_changes = True
+            try:
+                run_loop.runUntilDate_(NSDate.dateWithTimeIntervalSinceNow_(
+                    min(timeout, OWN_CHANGES_DELAY)))
+            finally:
+                self._ignore_changes = False
+        while not self._changed.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            run_loop.runUntilDate_(
+                NSDate.dateWithTimeIntervalSinceNow_(min(remaining, 0.5)))
+        self._changed.clear()
+        return True
+
     def create_reminder(
             self, title: str,
             notes: str = "",
@@ -105,13 +250,7 @@ class Reminders:
 
         # Set calendar
         if calendar:
-            calendars = self.event_store.calendarsForEntityType_(
-                EKEntityTypeReminder)
-            target_calendar = None
-            for cal in calendars:
-                if cal.title() == calendar:
-                    target_calendar = cal
-                    break
+            target_calendar = self._find_calendar(title=calendar)
             reminder.setCalendar_(
                 target_calendar or self.event_store.defaultCalendarForNewReminders())
         else:
@@ -120,6 +259,7 @@ class Reminders:
 
         error = self.event_store.saveReminder_commit_error_(reminder, True,
                                                             None)
+        self._committed()
         if error[1]:
             raise PyObjCRemindersError(f"Failed to create reminder: {error[1]}")
 
@@ -128,57 +268,255 @@ class Reminders:
     def get_reminders(
             self,
             include_completed: bool = False,
-            calendar: Optional[str] = None
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
     ) -> list[Reminder]:
         """Get all reminders.
 
+        Calendar and completion filters are applied in the EventKit
+        predicate, so reminders that are filtered out are never fetched.
+
         Args:
             include_completed: Whether to include completed reminders.
             calendar: The calendar to filter reminders by (optional).
+            calendars: Titles of calendars to include (optional).
+            exclude_calendars: Titles of calendars to exclude (optional).
+            fields: Names of the Reminder fields to read (default all).
+            lazy: Whether to return `LazyReminder` objects reading each
+                field on first access (default False).
 
         Returns:
             A list of reminders.
         """
         self._ensure_access()
 
+        predicate = self._reminders_predicate(
+            include_completed, calendar, calendars, exclude_calendars)
+        return [
+            _convert(reminder, fields, lazy)
+            for reminder in self._fetch_reminders(predicate)
+        ]
+
+    async def aget_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+    ) -> list[Reminder]:
+        """Get all reminders without blocking the event loop.
+
+        Args:
+            include_completed: Whether to include completed reminders.
+            calendar: The calendar to filter reminders by (optional).
+            calendars: Titles of calendars to include (optional).
+            exclude_calendars: Titles of calendars to exclude (optional).
+            fields: Names of the Reminder fields to read (default all).
+            lazy: Whether to return `LazyReminder` objects reading each
+                field on first access (default False).
+
+        Returns:
+            A list of reminders.
+        """
+        self._ensure_access()
+
+        predicate = self._reminders_predicate(
+            include_completed, calendar, calendars, exclude_calendars)
+        return [
+            _convert(reminder, fields, lazy)
+            for reminder in await self._afetch_reminders(predicate)
+        ]
+
+    async def astream_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+    ) -> AsyncIterator[list[Reminder]]:
+        """Get reminders calendar by calendar as they are fetched.
+
+        A fetch is sent for every calendar at once, and the reminders of
+        each calendar are yielded in calendar order as soon as its fetch
+        completes, so they can be processed while later calendars are still
+        being fetched, in the same order on every run.
+
+        Args:
+            include_completed: Whether to include completed reminders.
+            calendar: The calendar to filter reminders by (optional).
+            calendars: Titles of calendars to include (optional).
+            exclude_calendars: Titles of calendars to exclude (optional).
+            fields: Names of the Reminder fields to read (default all).
+            lazy: Whether to return `LazyReminder` objects reading each
+                field on first access (default False).
+
+        Yields:
+            The reminders of each calendar.
+        """
+        self._ensure_access()
+
+        fetches = [
+            asyncio.ensure_future(self._afetch_reminders(
+                self._calendars_predicate([target], include_completed)))
+            for target in self._target_calendars(
+                calendar, calendars, exclude_calendars)
+        ]
+        try:
+            for fetch in fetches:
+                ek_reminders = await fetch
+                if ek_reminders:
+                    yield [
+                        _convert(reminder, fields, lazy)
+                        for reminder in ek_reminders
+                    ]
+        finally:
+            for fetch in fetches:
+                fetch.cancel()
+
+    def _reminders_predicate(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+    ):
+        """Build the EventKit predicate for fetching reminders.
+
+        Args:
+            include_completed: Whether to include completed reminders.
+            calendar: The calendar to filter reminders by (optional).
+            calendars: Titles of calendars to include (optional).
+            exclude_calendars: Titles of calendars to exclude (optional).
+
+        Returns:
+            The NSPredicate, or None if no calendar matches.
+        """
+        return self._calendars_predicate(
+            self._target_calendars(calendar, calendars, exclude_calendars),
+            include_completed,
+        )
+
+    def _target_calendars(
+            self,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+    ) -> list:
+        """Select the EKCalendar objects matching the calendar filters.
+
+        Args:
+            calendar: The calendar to filter reminders by (optional).
+            calendars: Titles of calendars to include (optional).
+            exclude_calendars: Titles of calendars to exclude (optional).
+
+        Returns:
+            The matching EKCalendar objects.
+        """
+        include = set(calendars) if calendars is not None else None
         if calendar:
-            calendars = self.event_store.calendarsForEntityType_(
-                EKEntityTypeReminder)
-            target_calendars = [cal for cal in calendars if
-                                cal.title() == calendar]
-            if not target_calendars:
-                return []
-        else:
-            target_calendars = self.event_store.calendarsForEntityType_(
-                EKEntityTypeReminder)
+            include = {calendar} if include is None else include & {calendar}
+        exclude = set(exclude_calendars or ())
 
-        predicate = self.event_store.predicateForRemindersInCalendars_(
-            target_calendars)
+        return [
+            cal for cal in self._get_calendar_index()[0]
+            if (include is None or cal.title() in include) and
+               cal.title() not in exclude
+        ]
+
+    def _calendars_predicate(
+            self,
+            target_calendars: list,
+            include_completed: bool = False,
+    ):
+        """Build the EventKit predicate for reminders in some calendars.
+
+        Args:
+            target_calendars: The EKCalendar objects to fetch from.
+            include_completed: Whether to include completed reminders.
+
+        Returns:
+            The NSPredicate, or None if there are no calendars.
+        """
+        if not target_calendars:
+            return None
+
+        if include_completed:
+            return self.event_store.predicateForRemindersInCalendars_(
+                target_calendars)
+        # Passing no start and end date matches all incomplete reminders
+        return (
+            self.event_store
+            .predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
+                None, None, target_calendars)
+        )
+
+    def _fetch_reminders(self, predicate) -> list:
+        """Fetch raw EKReminder objects matching a predicate.
+
+        Args:
+            predicate: The predicate from `_reminders_predicate`.
+
+        Returns:
+            A list of EKReminder objects.
+        """
+        if predicate is None:
+            return []
 
         all_reminders = []
-        completion_called = [False]
+        completed = threading.Event()
 
         def completion_handler(reminders):
             if reminders:
                 all_reminders.extend(reminders)
-            completion_called[0] = True
+            completed.set()
 
         self.event_store.fetchRemindersMatchingPredicate_completion_(predicate,
                                                                      completion_handler)
 
-        start_time = time.time()
-        while not completion_called[0] and time.time() - start_time < 10:
-            time.sleep(0.1)
-
-        if not completion_called[0]:
+        if not completed.wait(TIMEOUT):
             raise PyObjCRemindersError("Timeout fetching reminders")
 
-        result = []
-        for reminder in all_reminders:
-            if include_completed or not reminder.isCompleted():
-                result.append(reminder_from_ek(reminder))
+        return all_reminders
 
-        return result
+    async def _afetch_reminders(self, predicate) -> list:
+        """Fetch raw EKReminder objects without blocking the event loop.
+
+        The EventKit completion handler resolves an asyncio future from the
+        thread it is called on.
+
+        Args:
+            predicate: The predicate from `_reminders_predicate`.
+
+        Returns:
+            A list of EKReminder objects.
+        """
+        if predicate is None:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def set_result(reminders):
+            if not future.done():
+                future.set_result(reminders)
+
+        def completion_handler(reminders):
+            loop.call_soon_threadsafe(set_result, list(reminders or []))
+
+        self.event_store.fetchRemindersMatchingPredicate_completion_(predicate,
+                                                                     completion_handler)
+
+        try:
+            return await asyncio.wait_for(future, TIMEOUT)
+        except asyncio.TimeoutError:
+            raise PyObjCRemindersError("Timeout fetching reminders")
 
     def get_reminder(self, id: str) -> Optional[Reminder]:
         """Get a specific reminder by its ID.
@@ -222,6 +560,109 @@ class Reminders:
         """
         self._ensure_access()
 
+        reminder = self._save_reminder_update(
+            id,
+            title=title,
+            notes=notes,
+            calendar=calendar,
+            completed=completed,
+            due_date=due_date,
+            priority=priority,
+            commit=True,
+        )
+        return reminder_from_ek(reminder)
+
+    def update_reminders(
+            self,
+            ids: Iterable[str],
+            title: Optional[str] = None,
+            notes: Optional[str] = None,
+            calendar: Optional[str] = None,
+            completed: Optional[bool] = None,
+            due_date: Optional[datetime] = None,
+            priority: Optional[int] = None,
+            fields: Optional[Iterable[str]] = None,
+    ) -> tuple[list[Reminder], dict[str, PyObjCRemindersError]]:
+        """Apply the same update to many reminders with a single commit.
+
+        Every reminder is saved without committing, then the event store is
+        committed once. If the commit fails, all staged changes are rolled
+        back and reported as failed.
+
+        Args:
+            ids: The identifiers of the reminders to update.
+            title: The new title for the reminders.
+            notes: The new notes for the reminders.
+            calendar: The new calendar for the reminders.
+            completed: Whether the reminders are completed.
+            due_date: The new due date for the reminders.
+            priority: The new priority for the reminders (0-9).
+            fields: Names of the Reminder fields to read for the updated
+                reminders (default all). The ID is always read.
+
+        Returns:
+            The updated reminder objects, and the errors of the reminders
+            that could not be updated keyed by their identifiers.
+        """
+        self._ensure_access()
+
+        staged = {}
+        errors = {}
+        for id in ids:
+            try:
+                staged[id] = self._save_reminder_update(
+                    id,
+                    title=title,
+                    notes=notes,
+                    calendar=calendar,
+                    completed=completed,
+                    due_date=due_date,
+                    priority=priority,
+                    commit=False,
+                )
+            except PyObjCRemindersError as e:
+                errors[id] = e
+
+        if staged:
+            committed, error = self.event_store.commit_(None)
+            self._committed()
+            if not committed:
+                self.event_store.reset()
+                for id in staged:
+                    errors[id] = PyObjCRemindersError(
+                        f"Failed to commit reminder updates: {error}")
+                staged = {}
+
+        return [
+            reminder_from_ek(reminder, fields) for reminder in staged.values()
+        ], errors
+
+    def _save_reminder_update(
+            self,
+            id: str,
+            title: Optional[str] = None,
+            notes: Optional[str] = None,
+            calendar: Optional[str] = None,
+            completed: Optional[bool] = None,
+            due_date: Optional[datetime] = None,
+            priority: Optional[int] = None,
+            commit: bool = True
+    ) -> EKReminder:
+        """Apply an update to a reminder and save it.
+
+        Args:
+            id: The identifier of the reminder to update.
+            title: The new title for the reminder.
+            notes: The new notes for the reminder.
+            calendar: The new calendar for the reminder.
+            completed: Whether the reminder is completed.
+            due_date: The new due date for the reminder.
+            priority: The new priority for the reminder (0-9).
+            commit: Whether to commit the event store after saving.
+
+        Returns:
+            The updated EKReminder object.
+        """
         reminder = self.event_store.calendarItemWithIdentifier_(id)
         if not reminder or not isinstance(reminder, EKReminder):
             raise PyObjCRemindersError(f"Reminder not found: {id}")
@@ -233,14 +674,7 @@ class Reminders:
             reminder.setNotes_(notes)
 
         if calendar is not None:
-            calendars = self.event_store.calendarsForEntityType_(
-                EKEntityTypeReminder
-            )
-            target_calendar = None
-            for cal in calendars:
-                if cal.title() == calendar:
-                    target_calendar = cal
-                    break
+            target_calendar = self._find_calendar(title=calendar)
             if target_calendar:
                 reminder.setCalendar_(target_calendar)
             else:
@@ -265,12 +699,14 @@ class Reminders:
             components.setMinute_(due_date.minute)
             reminder.setDueDateComponents_(components)
 
-        error = self.event_store.saveReminder_commit_error_(reminder, True,
+        error = self.event_store.saveReminder_commit_error_(reminder, commit,
                                                             None)
+        if commit:
+            self._committed()
         if error[1]:
             raise PyObjCRemindersError(f"Failed to update reminder: {error[1]}")
 
-        return reminder_from_ek(reminder)
+        return reminder
 
     def delete_reminder(self, id: str) -> bool:
         """Delete a reminder.
@@ -289,6 +725,7 @@ class Reminders:
 
         error = self.event_store.removeReminder_commit_error_(reminder, True,
                                                               None)
+        self._committed()
         return error[1] is None
 
     def create_calendar(self, title: str,
@@ -343,6 +780,8 @@ class Reminders:
 
         error = self.event_store.saveCalendar_commit_error_(calendar, True,
                                                             None)
+        self._invalidate_calendars()
+        self._committed()
         if error[1]:
             raise PyObjCRemindersError(f"Failed to create calendar: {error[1]}")
 
@@ -356,8 +795,7 @@ class Reminders:
         """
         self._ensure_access()
 
-        calendars = self.event_store.calendarsForEntityType_(
-            EKEntityTypeReminder)
+        calendars, _, _ = self._get_calendar_index()
         result = []
 
         for calendar in calendars:
@@ -376,11 +814,9 @@ class Reminders:
         """
         self._ensure_access()
 
-        calendars = self.event_store.calendarsForEntityType_(
-            EKEntityTypeReminder)
-        for calendar in calendars:
-            if calendar.calendarIdentifier() == id:
-                return calendar_from_ek(calendar)
+        calendar = self._find_calendar(id=id)
+        if calendar is not None:
+            return calendar_from_ek(calendar)
         return None
 
     def get_calendar_by_title(self, title: str) -> Optional[Calendar]:
@@ -394,11 +830,9 @@ class Reminders:
         """
         self._ensure_access()
 
-        calendars = self.event_store.calendarsForEntityType_(
-            EKEntityTypeReminder)
-        for calendar in calendars:
-            if calendar.title() == title:
-                return calendar_from_ek(calendar)
+        calendar = self._find_calendar(title=title)
+        if calendar is not None:
+            return calendar_from_ek(calendar)
         return None
 
     def update_calendar(
@@ -410,14 +844,7 @@ class Reminders:
         """Update a calendar."""
         self._ensure_access()
 
-        calendars = self.event_store.calendarsForEntityType_(
-            EKEntityTypeReminder)
-        target_calendar = None
-
-        for calendar in calendars:
-            if calendar.calendarIdentifier() == id:
-                target_calendar = calendar
-                break
+        target_calendar = self._find_calendar(id=id)
 
         if not target_calendar:
             raise PyObjCRemindersError(f"Calendar not found: {id}")
@@ -434,6 +861,8 @@ class Reminders:
 
         error = self.event_store.saveCalendar_commit_error_(target_calendar,
                                                             True, None)
+        self._invalidate_calendars()
+        self._committed()
         if error[1]:
             raise PyObjCRemindersError(f"Failed to update calendar: {error[1]}")
 
@@ -450,14 +879,7 @@ class Reminders:
         """
         self._ensure_access()
 
-        calendars = self.event_store.calendarsForEntityType_(
-            EKEntityTypeReminder)
-        target_calendar = None
-
-        for calendar in calendars:
-            if calendar.calendarIdentifier() == id:
-                target_calendar = calendar
-                break
+        target_calendar = self._find_calendar(id=id)
 
         if not target_calendar:
             return False
@@ -467,4 +889,26 @@ class Reminders:
 
         error = self.event_store.removeCalendar_commit_error_(target_calendar,
                                                               True, None)
+        self._invalidate_calendars()
+        self._committed()
         return error[1] is None
+
+
+def _convert(
+        ek_reminder: EKReminder,
+        fields: Optional[Iterable[str]] = None,
+        lazy: bool = False
+) -> Reminder:
+    """Convert an EKReminder eagerly or lazily.
+
+    Args:
+        ek_reminder: The EKReminder object to convert.
+        fields: Names of the fields to read eagerly (default all).
+        lazy: Whether to return a `LazyReminder` instead.
+
+    Returns:
+        The converted Reminder object.
+    """
+    if lazy:
+        return LazyReminder(ek_reminder)
+    return reminder_from_ek(ek_reminder, fields)
@@ -0,0 +1,555 @@
+import asyncio
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterable, Optional
+
+from memento.reminders.backend import RemindersError
+from memento.reminders.models import Calendar, Reminder
+
+DEFAULT_CALENDAR = "Reminders"
+
+_REMINDER_COLUMNS = """\
+r.id, r.title, r.notes, r.completed, r.creation_date, r.completion_date,
+r.modification_date, r.due_date, r.priority, c.title, r.url\
+"""
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS calendars (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    color TEXT,
+    allows_modifications INTEGER NOT NULL DEFAULT 1,
+    is_subscribed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS calendars_title ON calendars (title);
+CREATE TABLE IF NOT EXISTS reminders (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    notes TEXT NOT NULL DEFAULT '',
+    completed INTEGER NOT NULL DEFAULT 0,
+    creation_date REAL,
+    completion_date REAL,
+    modification_date REAL,
+    due_date REAL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    calendar_id TEXT NOT NULL REFERENCES calendars (id) ON DELETE CASCADE,
+    url TEXT
+);
+CREATE INDEX IF NOT EXISTS reminders_calendar
+    ON reminders (calendar_id, completed);
+"""
+
+
+class SQLiteReminders:
+    """SQLite-backed reminders store.
+
+    Implements the same interface as the EventKit-based `Reminders`, so
+    the engine can run, be benchmarked and be fed from other task sources
+    on any platform.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Open (or create) the reminders database.
+
+        Args:
+            path: Path to the SQLite database file (default in-memory)
+        """
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def create_reminder(
+            self, title: str,
+            notes: str = "",
+            due_date: Optional[datetime] = None,
+            priority: int = 0,
+            calendar: Optional[str] = None
+    ) -> Reminder:
+        """Create a new reminder.
+
+        Args:
+            title: The title of the reminder.
+            notes: Additional notes for the reminder.
+            due_date: The due date for the reminder.
+            priority: The priority of the reminder (0-9).
+            calendar: The calendar to add the reminder to, created if it
+                does not exist (default calendar if not given).
+
+        Returns:
+            The created reminder object.
+        """
+        now = _now()
+        reminder = Reminder(
+            id=_new_id(),
+            title=title,
+            notes=notes,
+            creation_date=now,
+            modification_date=now,
+            due_date=due_date,
+            priority=priority,
+            calendar=calendar,
+        )
+        self.insert_reminders([reminder])
+        return self.get_reminder(reminder.id)
+
+    def insert_reminders(self, reminders: Iterable[Reminder]) -> int:
+        """Insert many reminders in a single transaction.
+
+        Calendars are looked up by title and created if they do not exist,
+        reminders without a calendar go to the default calendar.
+
+        Args:
+            reminders: The reminders to insert, IDs are kept as given.
+
+        Returns:
+            The number of inserted reminders.
+        """
+        with self._lock, self._connection:
+            calendar_ids = {}
+
+            def calendar_id(title: Optional[str]) -> str:
+                title = title or DEFAULT_CALENDAR
+                if title not in calendar_ids:
+                    calendar_ids[title] = self._calendar_id_for(title)
+                return calendar_ids[title]
+
+            cursor = self._connection.executemany(
+                "INSERT INTO reminders (id, title, notes, completed,"
+                " creation_date, completion_date, modification_date,"
+                " due_date, priority, calendar_id, url)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        reminder.id,
+                        reminder.title,
+                        reminder.notes,
+                        reminder.completed,
+                        _timestamp(reminder.creation_date),
+                        _timestamp(reminder.completion_date),
+                        _timestamp(reminder.modification_date),
+                        _timestamp(reminder.due_date),
+                        reminder.priority,
+                        calendar_id(reminder.calendar),
+                        reminder.url,
+                    )
+                    for reminder in reminders
+                ),
+            )
+            return cursor.rowcount
+
+    def get_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+    ) -> list[Reminder]:
+        """Get all reminders.
+
+        Args:
+            include_completed: Whether to include completed reminders.
+            calendar: The calendar to filter reminders by (optional).
+            calendars: Titles of calendars to include (optional).
+            exclude_calendars: Titles of calendars to exclude (optional).
+            fields: Accepted for interface compatibility, rows are cheap to
+                convert so all fields are always read.
+            lazy: Accepted for interface compatibility, reminders are
+                always converted eagerly.
+
+        Returns:
+            A list of reminders.
+        """
+        return [
+            _reminder_from_row(row)
+            for row in self._select_reminders(
+                include_completed, calendar, calendars, exclude_calendars)
+        ]
+
+    async def aget_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+    ) -> list[Reminder]:
+        """Get all reminders in a worker thread, see `get_reminders`."""
+        return await asyncio.to_thread(
+            self.get_reminders,
+            include_completed, calendar, calendars, exclude_calendars)
+
+    async def astream_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+    ) -> AsyncIterator[list[Reminder]]:
+        """Get all reminders in a single chunk, see `aget_reminders`."""
+        reminders = await self.aget_reminders(
+            include_completed, calendar, calendars, exclude_calendars)
+        if reminders:
+            yield reminders
+
+    def get_reminder(self, id: str) -> Optional[Reminder]:
+        """Get a specific reminder by its ID.
+
+        Args:
+            id: The identifier of the reminder to retrieve.
+
+        Returns:
+            The reminder object if found, otherwise None.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {_REMINDER_COLUMNS} FROM reminders r"
+                " JOIN calendars c ON c.id = r.calendar_id WHERE r.id = ?",
+                (id,),
+            ).fetchone()
+        return _reminder_from_row(row) if row is not None else None
+
+    def update_reminder(
+            self,
+            id: str,
+            title: Optional[str] = None,
+            notes: Optional[str] = None,
+            calendar: Optional[str] = None,
+            completed: Optional[bool] = None,
+            due_date: Optional[datetime] = None,
+            priority: Optional[int] = None
+    ) -> Reminder:
+        """Update a reminder.
+
+        Args:
+            id: The identifier of the reminder to update.
+            title: The new title for the reminder.
+            notes: The new notes for the reminder.
+            calendar: The new calendar for the reminder.
+            completed: Whether the reminder is completed.
+            due_date: The new due date for the reminder.
+            priority: The new priority for the reminder (0-9).
+
+        Returns:
+            The updated reminder object.
+        """
+        updated, errors = self.update_reminders(
+            [id],
+            title=title,
+            notes=notes,
+            calendar=calendar,
+            completed=completed,
+            due_date=due_date,
+            priority=priority,
+        )
+        if errors:
+            raise errors[id]
+        return updated[0]
+
+    def update_reminders(
+            self,
+            ids: Iterable[str],
+            title: Optional[str] = None,
+            notes: Optional[str] = None,
+            calendar: Optional[str] = None,
+            completed: Optional[bool] = None,
+            due_date: Optional[datetime] = None,
+            priority: Optional[int] = None,
+            fields: Optional[Iterable[str]] = None,
+    ) -> tuple[list[Reminder], dict[str, RemindersError]]:
+        """Apply the same update to many reminders in a single transaction.
+
+        Args:
+            ids: The identifiers of the reminders to update.
+            title: The new title for the reminders.
+            notes: The new notes for the reminders.
+            calendar: The new calendar for the reminders.
+            completed: Whether the reminders are completed.
+            due_date: The new due date for the reminders.
+            priority: The new priority for the reminders (0-9).
+            fields: Accepted for interface compatibility, rows are cheap to
+                convert so all fields are always read.
+
+        Returns:
+            The updated reminder objects, and the errors of the reminders
+            that could not be updated keyed by their identifiers.
+        """
+        ids = list(ids)
+        now = _now()
+        assignments = {"modification_date": _timestamp(now)}
+        if title is not None:
+            assignments["title"] = title
+        if notes is not None:
+            assignments["notes"] = notes
+        if completed is not None:
+            assignments["completed"] = completed
+            assignments["completion_date"] = (
+                _timestamp(now) if completed else None)
+        if due_date is not None:
+            assignments["due_date"] = _timestamp(due_date)
+        if priority is not None:
+            assignments["priority"] = priority
+
+        errors = {}
+        with self._lock, self._connection:
+            if calendar is not None:
+                row = self._connection.execute(
+                    "SELECT id FROM calendars WHERE title = ? LIMIT 1",
+                    (calendar,),
+                ).fetchone()
+                if row is None:
+                    error = RemindersError(f"Calendar not found: {calendar}")
+                    return [], {id: error for id in ids}
+                assignments["calendar_id"] = row[0]
+
+            columns = ", ".join(f"{name} = ?" for name in assignments)
+            values = list(assignments.values())
+            updated_ids = []
+            for id in ids:
+                cursor = self._connection.execute(
+                    f"UPDATE reminders SET {columns} WHERE id = ?",
+                    (*values, id),
+                )
+                if cursor.rowcount:
+                    updated_ids.append(id)
+                else:
+                    errors[id] = RemindersError(f"Reminder not found: {id}")
+
+        return [self.get_reminder(id) for id in updated_ids], errors
+
+    def delete_reminder(self, id: str) -> bool:
+        """Delete a reminder.
+
+        Args:
+            id: The identifier of the reminder to delete.
+
+        Returns:
+            True if the reminder was deleted successfully, False otherwise.
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM reminders WHERE id = ?", (id,))
+        return cursor.rowcount > 0
+
+    def create_calendar(self, title: str,
+                        color: Optional[str] = None) -> Calendar:
+        """Create a new calendar.
+
+        Args:
+            title: The title of the calendar.
+            color: The color of the calendar in hex format (e.g., "#FF5733").
+
+        Returns:
+            The created calendar object.
+        """
+        calendar = Calendar(id=_new_id(), title=title, color=color)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO calendars (id, title, color) VALUES (?, ?, ?)",
+                (calendar.id, calendar.title, calendar.color),
+            )
+        return calendar
+
+    def get_calendars(self) -> list[Calendar]:
+        """Get all reminder calendars.
+
+        Returns:
+            A list of all reminder calendars.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, title, color, allows_modifications, is_subscribed"
+                " FROM calendars ORDER BY rowid"
+            ).fetchall()
+        return [_calendar_from_row(row) for row in rows]
+
+    def get_calendar(self, id: str) -> Optional[Calendar]:
+        """Get a specific calendar by its ID.
+
+        Args:
+            id: The identifier of the calendar to retrieve.
+
+        Returns:
+            The calendar object if found, otherwise None.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id, title, color, allows_modifications, is_subscribed"
+                " FROM calendars WHERE id = ?",
+                (id,),
+            ).fetchone()
+        return _calendar_from_row(row) if row is not None else None
+
+    def get_calendar_by_title(self, title: str) -> Optional[Calendar]:
+        """Get a calendar by its title.
+
+        Args:
+            title: The title of the calendar to retrieve.
+
+        Returns:
+            The calendar object if found, otherwise None.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id, title, color, allows_modifications, is_subscribed"
+                " FROM calendars WHERE title = ? ORDER BY rowid LIMIT 1",
+                (title,),
+            ).fetchone()
+        return _calendar_from_row(row) if row is not None else None
+
+    def update_calendar(
+            self,
+            id: str,
+            title: Optional[str] = None,
+            color: Optional[str] = None
+    ) -> Calendar:
+        """Update a calendar."""
+        calendar = self.get_calendar(id)
+        if calendar is None:
+            raise RemindersError(f"Calendar not found: {id}")
+
+        if not calendar.allows_modifications:
+            raise RemindersError("Calendar does not allow modifications")
+
+        if title is not None:
+            calendar.title = title
+        if color is not None:
+            calendar.color = color
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE calendars SET title = ?, color = ? WHERE id = ?",
+                (calendar.title, calendar.color, id),
+            )
+        return calendar
+
+    def delete_calendar(self, id: str) -> bool:
+        """Delete a calendar and all of its reminders.
+
+        Args:
+            id: The identifier of the calendar to delete.
+
+        Returns:
+            True if the calendar was deleted successfully, False otherwise.
+        """
+        calendar = self.get_calendar(id)
+        if calendar is None:
+            return False
+
+        if not calendar.allows_modifications:
+            raise RemindersError("Calendar does not allow modifications")
+
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM calendars WHERE id = ?", (id,))
+        return cursor.rowcount > 0
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def _select_reminders(
+            self,
+            include_completed: bool = False,
+            calendar: Optional[str] = None,
+            calendars: Optional[Iterable[str]] = None,
+            exclude_calendars: Optional[Iterable[str]] = None,
+    ) -> list[tuple]:
+        """Select reminder rows matching the filters."""
+        include = set(calendars) if calendars is not None else None
+        if calendar:
+            include = {calendar} if include is None else include & {calendar}
+        exclude = set(exclude_calendars or ())
+
+        where = []
+        params = []
+        if not include_completed:
+            where.append("r.completed = 0")
+        if include is not None:
+            where.append(f"c.title IN ({', '.join('?' * len(include))})")
+            params.extend(include)
+        if exclude:
+            where.append(f"c.title NOT IN ({', '.join('?' * len(exclude))})")
+            params.extend(exclude)
+
+        query = (
+            f"SELECT {_REMINDER_COLUMNS} FROM reminders r"
+            " JOIN calendars c ON c.id = r.calendar_id"
+        )
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY r.rowid"
+
+        with self._lock:
+            return self._connection.execute(query, params).fetchall()
+
+    def _calendar_id_for(self, title: str) -> str:
+        """Return the ID of the calendar titled `title`, creating it."""
+        row = self._connection.execute(
+            "SELECT id FROM calendars WHERE title = ? ORDER BY rowid LIMIT 1",
+            (title,),
+        ).fetchone()
+        if row is not None:
+            return row[0]
+        id = _new_id()
+        self._connection.execute(
+            "INSERT INTO calendars (id, title) VALUES (?, ?)", (id, title))
+        return id
+
+
+def _new_id() -> str:
+    """Generate an identifier in the same format as EventKit."""
+    return str(uuid.uuid4()).upper()
+
+
+def _now() -> datetime:
+    """Return the current time in UTC."""
+    return datetime.now(tz=timezone.utc)
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Convert a datetime to a POSIX timestamp."""
+    return value.timestamp() if value is not None else None
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    """Convert a POSIX timestamp to a UTC datetime."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+def _reminder_from_row(row: tuple) -> Reminder:
+    """Convert a reminder row to a Reminder dataclass."""
+    return Reminder(
+        id=row[0],
+        title=row[1],
+        notes=row[2],
+        completed=bool(row[3]),
+        creation_date=_datetime(row[4]),
+        completion_date=_datetime(row[5]),
+        modification_date=_datetime(row[6]),
+        due_date=_datetime(row[7]),
+        priority=row[8],
+        calendar=row[9],
+        url=row[10],
+    )
+
+
+def _calendar_from_row(row: tuple) -> Calendar:
+    """Convert a calendar row to a Calendar dataclass."""
+    return Calendar(
+        id=row[0],
+        title=row[1],
+        color=row[2],
+        allows_modifications=bool(row[3]),
+        is_subscribed=bool(row[4]),
+    )
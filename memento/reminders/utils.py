@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
-from typing import Optional
+from functools import cached_property
+from typing import Iterable, Optional
 
 from AppKit import NSColor  # noqa: F401
 from EventKit import EKReminder, EKCalendar  # noqa: F401
@@ -75,14 +76,14 @@ def rgba_to_rgb(rgba: Optional[str]) -> Optional[str]:
     return None
 
 
-def reminder_from_ek(ek_reminder: EKReminder) -> Reminder:
-    """Convert EKReminder to Reminder dataclass.
+def due_date_from_ek(ek_reminder: EKReminder) -> Optional[datetime]:
+    """Get the due date of an EKReminder.
 
     Args:
-        ek_reminder: The EKReminder object to convert.
+        ek_reminder: The EKReminder object.
 
     Returns:
-        The converted Reminder object.
+        The due date in UTC, or None if the reminder has no due date.
     """
     due_date = None
     if hasattr(ek_reminder,
@@ -109,20 +110,92 @@ def reminder_from_ek(ek_reminder: EKReminder) -> Reminder:
                     due_date = datetime_from_ns_date(ns_date)
             except:
                 due_date = None
+    return due_date
+
+
+def _calendar_title(ek_reminder: EKReminder) -> Optional[str]:
+    """Get the title of the calendar an EKReminder belongs to."""
+    calendar = ek_reminder.calendar()
+    return calendar.title() if calendar else None
+
+
+def _url(ek_reminder: EKReminder) -> Optional[str]:
+    """Get the URL of an EKReminder as a string."""
+    url = ek_reminder.URL()
+    return str(url) if url else None
+
+
+# Functions reading each Reminder field from an EKReminder
+REMINDER_FIELDS = {
+    "id": lambda r: r.calendarItemIdentifier(),
+    "title": lambda r: r.title() or "",
+    "notes": lambda r: r.notes() or "",
+    "completed": lambda r: r.isCompleted(),
+    "creation_date": lambda r: datetime_from_ns_date(r.creationDate()),
+    "completion_date": lambda r: datetime_from_ns_date(r.completionDate()),
+    "due_date": due_date_from_ek,
+    "priority": lambda r: r.priority(),
+    "calendar": _calendar_title,
+    "url": _url,
+    "modification_date": lambda r: datetime_from_ns_date(
+        r.lastModifiedDate()),
+}
+
+
+def reminder_from_ek(
+        ek_reminder: EKReminder,
+        fields: Optional[Iterable[str]] = None
+) -> Reminder:
+    """Convert EKReminder to Reminder dataclass.
 
-    return Reminder(
-        id=ek_reminder.calendarItemIdentifier(),
-        title=ek_reminder.title() or "",
-        notes=ek_reminder.notes() or "",
-        completed=ek_reminder.isCompleted(),
-        creation_date=datetime_from_ns_date(ek_reminder.creationDate()),
-        completion_date=datetime_from_ns_date(
-            ek_reminder.completionDate()) if ek_reminder.completionDate() else None,
-        due_date=due_date,
-        priority=ek_reminder.priority(),
-        calendar=ek_reminder.calendar().title() if ek_reminder.calendar() else None,
-        url=str(ek_reminder.URL()) if ek_reminder.URL() else None
-    )
+    Args:
+        ek_reminder: The EKReminder object to convert.
+        fields: Names of the fields to read (default all). The ID is always
+            read, other fields keep their default values.
+
+    Returns:
+        The converted Reminder object.
+    """
+    if fields is None:
+        fields = REMINDER_FIELDS
+    values = {"title": "", "notes": ""}
+    for name in {"id", *fields}:
+        values[name] = REMINDER_FIELDS[name](ek_reminder)
+    return Reminder(**values)
+
+
+def _lazy_field(name: str) -> cached_property:
+    """Create a property reading a Reminder field on first access."""
+    getter = REMINDER_FIELDS[name]
+    return cached_property(lambda self: getter(self._ek_reminder))
+
+
+class LazyReminder(Reminder):
+    """Reminder reading its fields from an EKReminder on first access.
+
+    Every field is fetched through the PyObjC bridge only when it is first
+    used, and cached on the instance afterwards.
+    """
+
+    def __init__(self, ek_reminder: EKReminder):
+        """Wrap an EKReminder.
+
+        Args:
+            ek_reminder: The EKReminder object to read fields from.
+        """
+        self._ek_reminder = ek_reminder
+
+    id = _lazy_field("id")
+    title = _lazy_field("title")
+    notes = _lazy_field("notes")
+    completed = _lazy_field("completed")
+    creation_date = _lazy_field("creation_date")
+    completion_date = _lazy_field("completion_date")
+    due_date = _lazy_field("due_date")
+    priority = _lazy_field("priority")
+    calendar = _lazy_field("calendar")
+    url = _lazy_field("url")
+    modification_date = _lazy_field("modification_date")
 
 
 def calendar_from_ek(ek_calendar: EKCalendar) -> Calendar:
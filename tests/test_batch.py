@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import pytest
+
+from memento.benchmark.ollama import FakeOllama
+from memento.llm import LLMProcessor
+
+TEXTS = [
+    "Buy milk\nThe oat one",
+    "Call mom\nAbout the weekend",
+    "File taxes\nBefore the deadline",
+]
+
+
+class PartialOllama(FakeOllama):
+    """Fake Ollama breaking every batch response in a configurable way."""
+
+    def __init__(self, mode: str):
+        super().__init__(latency=0, prompt_rate=1e9, generation_rate=1e9)
+        self.mode = mode
+        # Number of reminders in each request, 1 for single prompts
+        self.sizes = []
+
+    def _answer(self, request):
+        name, arguments, prompt_tokens, completion_tokens = (
+            super()._answer(request))
+        output = json.loads(arguments)
+        if "reminders" not in output:
+            self.sizes.append(1)
+        else:
+            self.sizes.append(len(output["reminders"]))
+            if self.mode == "partial":
+                arguments = json.dumps(
+                    {"reminders": output["reminders"][:-1]})
+            else:
+                arguments = arguments[:-2]
+        return name, arguments, prompt_tokens, completion_tokens
+
+
+@pytest.fixture(params=["partial", "malformed"])
+def ollama(request):
+    server = PartialOllama(request.param)
+    server.start()
+    yield server
+    server.close()
+
+
+def test_broken_batch_is_retried_one_by_one(ollama):
+    processor = LLMProcessor(
+        base_url=ollama.base_url, warm_up="off", fast_path=False)
+
+    async def process():
+        try:
+            return await processor.aprocess_reminders(TEXTS)
+        finally:
+            await processor.aclose()
+
+    outputs = asyncio.run(process())
+    assert [output.title for output in outputs] == [
+        "Buy milk", "Call mom", "File taxes"]
+    assert outputs[2].text == "Before the deadline"
+    # The batch, possibly retried by the agent, then one request each
+    assert ollama.sizes[0] == 3
+    assert ollama.sizes[-3:] == [1, 1, 1]
+    assert processor.stats["batch_fallback"] == 1
+    assert processor.stats["model"] == 3
@@ -0,0 +1,117 @@
+import asyncio
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import (
+    AgentInfo,
+    DeltaToolCall,
+    FunctionModel,
+)
+from pydantic_ai.usage import Usage
+
+from memento.llm import LLMProcessor
+from memento.llm.budget import (
+    ELLIPSIS,
+    MIN_OUTPUT_TOKENS,
+    count_tokens,
+    generation_limit,
+    output_tokens,
+    truncate_notes,
+)
+
+OUTPUT = '{"title": "Call the bank", "text": "Ask about the loan"}'
+
+
+def test_short_text_is_unchanged():
+    text = "Call the bank\nAsk about the loan"
+    assert truncate_notes(text, 512) == text
+    assert truncate_notes(text * 100, 0) == text * 100
+
+
+def test_truncate_keeps_title_links_and_mentions():
+    notes = " ".join(["word"] * 200)
+    text = f"Call the bank\n{notes} https://bank.example/loan @sam"
+    truncated = truncate_notes(text, 32)
+    title, notes, kept = truncated.split("\n")
+    assert title == "Call the bank"
+    assert notes.endswith(ELLIPSIS)
+    assert notes.removesuffix(ELLIPSIS).split() == ["word"] * len(
+        notes.removesuffix(ELLIPSIS).split())
+    assert kept == "https://bank.example/loan @sam"
+    assert count_tokens("\n".join([title, notes])) <= 32
+
+
+def test_title_only_is_never_truncated():
+    text = "x" * 1000
+    assert truncate_notes(text, 8) == text
+
+
+def test_output_tokens_grow_with_the_text():
+    assert output_tokens("a" * 400) > output_tokens("a" * 40)
+
+
+def test_generation_limit_has_a_floor_and_a_cap():
+    assert generation_limit(["Buy milk"], 2048) == MIN_OUTPUT_TOKENS
+    assert generation_limit(["Buy milk"], 100) == 100
+    long = "Ďakujem " * 300
+    assert MIN_OUTPUT_TOKENS < generation_limit([long], 4096) < 4096
+    assert generation_limit([long], 512) == 512
+
+
+def cut_off_model(limits: list):
+    """Model cutting its output off below 2048 tokens."""
+
+    def complete(messages, info: AgentInfo) -> ModelResponse:
+        limit = info.model_settings["max_tokens"]
+        limits.append(limit)
+        tool = info.output_tools[0]
+        args = OUTPUT if limit >= 2048 else OUTPUT[:20]
+        return ModelResponse(
+            parts=[ToolCallPart(tool.name, args)],
+            usage=Usage(requests=1, response_tokens=min(limit, 300)),
+        )
+
+    return FunctionModel(complete)
+
+
+def test_cut_off_output_is_retried_with_max_tokens():
+    limits = []
+    processor = LLMProcessor(warm_up="off", fast_path=False, max_tokens=2048)
+    with processor.agent.override(model=cut_off_model(limits)):
+        output = processor.process_reminder("Call the bank")
+    assert output.title == "Call the bank"
+    assert limits == [MIN_OUTPUT_TOKENS, MIN_OUTPUT_TOKENS, 2048]
+    assert processor.tokens["length_retries"] == 1
+
+
+def test_cut_off_output_is_retried_asynchronously():
+    limits = []
+    processor = LLMProcessor(warm_up="off", fast_path=False, max_tokens=2048)
+    with processor.agent.override(model=cut_off_model(limits)):
+        output = asyncio.run(processor.aprocess_reminder("Call the bank"))
+    assert output.title == "Call the bank"
+    assert limits[-1] == 2048
+
+
+def test_cut_off_stream_is_retried():
+    limits = []
+
+    async def stream(messages, info: AgentInfo):
+        limits.append(info.model_settings["max_tokens"])
+        tool = info.output_tools[0]
+        yield {0: DeltaToolCall(tool.name, '{"title": "Call the bank"')}
+        words = " ".join(["loan"] * 300)
+        yield {0: DeltaToolCall(None, f', "text": "{words}')}
+
+    async def fields(processor):
+        return [field async for field in processor.astream_reminder(
+            "Call the bank")]
+
+    processor = LLMProcessor(warm_up="off", fast_path=False, max_tokens=2048)
+    model = FunctionModel(
+        cut_off_model(limits).function, stream_function=stream)
+    with processor.agent.override(model=model):
+        result = asyncio.run(fields(processor))
+    assert result[:2] == [
+        ("title", "Call the bank"), ("text", "Ask about the loan")]
+    assert limits[-1] == 2048
+    assert processor.tokens["length_retries"] == 1
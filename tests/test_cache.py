@@ -0,0 +1,62 @@
+from memento.llm import ReminderCache, ReminderOutput
+from memento.llm import cache as cache_module
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def output(title):
+    return ReminderOutput(title=title)
+
+
+def test_key_depends_on_every_input():
+    key = ReminderCache.key("buy milk", "prompt", "model", {"seed": 0})
+    assert key == ReminderCache.key("buy milk", "prompt", "model", {"seed": 0})
+    assert key != ReminderCache.key("buy milk", "prompt", "other", {"seed": 0})
+    assert key != ReminderCache.key("buy milk", "prompt", "model", {"seed": 1})
+
+
+def test_ttl_expires_entries(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    cache = ReminderCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+    cache.set("a", output("Buy milk"))
+    clock.now += 59
+    assert cache.get("a") == output("Buy milk")
+    clock.now += 2
+    assert cache.get("a") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 0}
+    cache.close()
+
+
+def test_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    cache = ReminderCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.set("a", output("A"))
+    clock.now += 1
+    cache.set("b", output("B"))
+    clock.now += 1
+    assert cache.get("a") == output("A")
+    clock.now += 1
+    cache.set("c", output("C"))
+    assert cache.get("b") is None
+    assert cache.get("a") == output("A")
+    assert cache.get("c") == output("C")
+    assert cache.stats()["size"] == 2
+    cache.close()
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ReminderCache(path, ttl=0)
+    cache.set("a", output("Buy milk"))
+    cache.close()
+    cache = ReminderCache(path, ttl=0)
+    assert cache.get("a") == output("Buy milk")
+    cache.close()
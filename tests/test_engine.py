@@ -0,0 +1,120 @@
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+from escpos.printer import Dummy
+
+from memento.benchmark import DummySession
+from memento.engine import Engine, _print_rendered, _process_concurrently
+from memento.llm import LLMProcessor, ReminderOutput
+from memento.metrics import Metrics
+from memento.printer import PrintQueue, render_reminder
+from memento.reminders import Reminder, SQLiteReminders
+
+
+def reminder(id: str) -> Reminder:
+    return Reminder(id=id, title=id, notes="")
+
+
+class Processor:
+    """Processor stand-in logging the reminders it extracts."""
+
+    def __init__(self, log: list):
+        self.log = log
+
+    async def aprocess_reminders(self, texts):
+        self.log.append(("extract", texts))
+        await asyncio.sleep(0)
+        return [ReminderOutput(title=text) for text in texts]
+
+
+def test_extracts_chunks_while_fetching():
+    log = []
+    second_chunk = asyncio.Event()
+
+    async def chunks():
+        yield [reminder("a"), reminder("b"), reminder("c")]
+        # The first chunk is extracted and handled before the next arrives
+        await second_chunk.wait()
+        log.append(("fetched", "d"))
+        yield [reminder("d")]
+
+    def handle(reminder, output):
+        log.append(("handle", output.title))
+        if output.title == "c":
+            second_chunk.set()
+
+    asyncio.run(_process_concurrently(
+        Processor(log), chunks(), concurrency=2, batch_size=2, handle=handle))
+
+    assert log == [
+        ("extract", ["a", "b"]),
+        ("extract", ["c"]),
+        ("handle", "a"),
+        ("handle", "b"),
+        ("handle", "c"),
+        ("fetched", "d"),
+        ("extract", ["d"]),
+        ("handle", "d"),
+    ]
+
+
+def test_fetch_errors_are_raised():
+    async def chunks():
+        yield [reminder("a")]
+        raise RuntimeError("fetch failed")
+
+    handled = []
+    with pytest.raises(RuntimeError, match="fetch failed"):
+        asyncio.run(_process_concurrently(
+            Processor([]), chunks(), concurrency=1, batch_size=1,
+            handle=lambda r, output: handled.append(output.title)))
+
+
+def rendered(data: bytes) -> Future:
+    future = Future()
+    future.set_result(data)
+    return future
+
+
+def test_prints_pool_rendered_ticket():
+    printer = Dummy(profile="TM-T88V")
+    output = ReminderOutput(title="Buy milk")
+    _print_rendered(
+        printer, rendered(b"ticket"), output, "TM-T88V", Metrics())
+    assert printer.output == b"ticket"
+
+
+def test_renders_again_after_failover_to_another_profile():
+    printer = Dummy(profile="TM-T88V")
+    output = ReminderOutput(title="Buy milk", text="From the corner shop")
+    metrics = Metrics()
+    _print_rendered(printer, rendered(b"ticket"), output, None, metrics)
+    assert printer.output == render_reminder(
+        title=output.title, text=output.text, profile=printer.profile)
+    assert metrics.counts["render"] == 1
+
+
+def test_engine_keeps_its_event_loop_private():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    reminders = SQLiteReminders()
+    reminders.create_calendar("Processed")
+    reminders.create_reminder("Buy milk")
+    session = DummySession()
+    try:
+        engine = Engine(
+            reminders=reminders,
+            processor=LLMProcessor(warm_up="off"),
+            print_queue=PrintQueue(session),
+        )
+        assert asyncio.get_event_loop() is loop
+        assert engine.run_once() == 1
+        engine.close()
+        assert asyncio.get_event_loop() is loop
+        assert session.bytes_received > 0
+        assert reminders.get_reminders(calendar="Processed")[0].title == (
+            "Buy milk")
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
@@ -0,0 +1,77 @@
+from memento.journal import EXTRACTED, PRINTED, RENDERED, Journal
+from memento.llm import ReminderOutput
+
+OUTPUT = ReminderOutput(title="Buy milk")
+
+
+def test_replay_merges_records(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = Journal(path)
+    journal.extracted("a", "buy milk", OUTPUT)
+    journal.rendered("a", b"ticket")
+    journal.extracted("b", "call mom", OUTPUT)
+    journal.moved(["b"])
+    journal._file.close()
+
+    journal = Journal(path)
+    entry = journal.get("a", "buy milk")
+    assert entry["stage"] == RENDERED
+    assert Journal.output(entry) == OUTPUT
+    assert Journal.data(entry) == b"ticket"
+    assert journal.get("b", "call mom") is None
+    journal.close()
+
+
+def test_edited_text_ignores_record(tmp_path):
+    journal = Journal(str(tmp_path / "journal.jsonl"))
+    journal.extracted("a", "buy milk", OUTPUT)
+    assert journal.get("a", "buy oat milk") is None
+    journal.close()
+
+
+def test_recovers_from_torn_write(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = Journal(path)
+    journal.extracted("a", "buy milk", OUTPUT)
+    journal.extracted("b", "call mom", OUTPUT)
+    journal._file.write('{"id": "b", "stage": "pri')
+    journal._file.close()
+
+    journal = Journal(path)
+    journal.printed("a")
+    journal._file.close()
+
+    journal = Journal(path)
+    assert journal.get("a", "buy milk")["stage"] == PRINTED
+    assert journal.get("b", "call mom")["stage"] == EXTRACTED
+    journal.close()
+
+
+def test_compaction_keeps_unfinished(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = Journal(path, compact_every=3)
+    journal.extracted("a", "buy milk", OUTPUT)
+    journal.extracted("b", "call mom", OUTPUT)
+    journal.moved(["a"])
+    with open(path) as f:
+        assert len(f.readlines()) == 1
+    journal.close()
+
+    journal = Journal(path)
+    assert journal.get("a", "buy milk") is None
+    assert journal.get("b", "call mom")["stage"] == EXTRACTED
+    journal.close()
+
+
+def test_compaction_drops_reminders_no_longer_pending(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = Journal(path)
+    journal.extracted("a", "buy milk", OUTPUT)
+    journal.extracted("b", "call mom", OUTPUT)
+    journal.compact(pending=["b", "c"])
+    journal.close()
+
+    journal = Journal(path)
+    assert journal.get("a", "buy milk") is None
+    assert journal.get("b", "call mom")["stage"] == EXTRACTED
+    journal.close()
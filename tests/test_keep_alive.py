@@ -0,0 +1,86 @@
+import json
+import math
+
+import pytest
+
+from memento.llm.ollama import _keep_alive_value, keep_alive_seconds
+
+
+@pytest.mark.parametrize("value, seconds", [
+    ("300", 300),
+    ("30m", 1800),
+    ("1h30m", 5400),
+    ("5m0s", 300),
+    ("500ms", 0.5),
+    ("1.5h", 5400),
+    ("+10s", 10),
+])
+def test_keep_alive_seconds(value, seconds):
+    assert keep_alive_seconds(value) == pytest.approx(seconds)
+
+
+@pytest.mark.parametrize("value", ["-1", "-1m", "-5m0s"])
+def test_negative_keep_alive_is_for_ever(value):
+    assert keep_alive_seconds(value) == math.inf
+
+
+@pytest.mark.parametrize("value", ["", "-", "30x", "m", "1h 30m", "nan"])
+def test_invalid_keep_alive(value):
+    with pytest.raises(ValueError):
+        keep_alive_seconds(value)
+
+
+def test_keep_alive_value():
+    assert _keep_alive_value("-1") == -1
+    assert _keep_alive_value("300") == 300
+    assert _keep_alive_value("0.5") == 0.5
+    assert _keep_alive_value("30m") == "30m"
+
+
+def test_processor_rejects_invalid_keep_alive():
+    from memento.llm import LLMProcessor
+
+    with pytest.raises(ValueError, match="keep-alive"):
+        LLMProcessor(warm_up="off", keep_alive="30 minutes")
+
+
+def test_requests_carry_keep_alive(monkeypatch):
+    import httpx
+
+    from memento.llm import LLMProcessor
+    from memento.llm import router
+
+    bodies = []
+
+    def handle(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "id": "1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "model",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "tool_calls",
+                "message": {
+                    "role": "assistant",
+                    "tool_calls": [{
+                        "id": "call",
+                        "type": "function",
+                        "function": {
+                            "name": "final_result",
+                            "arguments": '{"title": "Buy milk"}',
+                        },
+                    }],
+                },
+            }],
+        })
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    monkeypatch.setattr(router, "pooled_http_client", lambda: client)
+    processor = LLMProcessor(
+        model_name="model", warm_up="off", keep_alive="1h", fast_path=False)
+    output = processor.process_reminder("Please buy some milk on the way")
+    assert output.title == "Buy milk"
+    assert bodies[0]["keep_alive"] == "1h"
+    assert bodies[0]["max_completion_tokens"] < processor.max_tokens
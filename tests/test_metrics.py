@@ -0,0 +1,84 @@
+import json
+import os
+
+import pytest
+
+from memento import metrics as metrics_module
+from memento.metrics import Metrics
+
+
+def observed(window: int = 1024) -> Metrics:
+    metrics = Metrics(window=window)
+    for seconds in (1, 2, 3, 4):
+        metrics.observe("extract", seconds)
+    metrics.observe("print", 0.5)
+    metrics.set_counters("reminders", {"model": 3, "fast_path": 1})
+    return metrics
+
+
+def test_window_quantiles():
+    metrics = Metrics(window=3)
+    for seconds in (100, 1, 2, 3):
+        metrics.observe("extract", seconds)
+    # The count and sum cover every sample, quantiles only the window
+    assert metrics.summary()["extract"] == {
+        "count": 4, "sum": 106, "p50": 2, "p95": 3, "max": 3}
+
+
+def test_span_observes_its_duration():
+    metrics = Metrics()
+    with pytest.raises(RuntimeError):
+        with metrics.span("render", id="a"):
+            raise RuntimeError
+    assert metrics.counts["render"] == 1
+    assert metrics.sums["render"] >= 0
+
+
+def test_prometheus_output():
+    assert observed().to_prometheus() == """\
+# HELP memento_stage_seconds Time spent in each pipeline stage.
+# TYPE memento_stage_seconds summary
+memento_stage_seconds{stage="extract",quantile="0.5"} 2
+memento_stage_seconds{stage="extract",quantile="0.95"} 4
+memento_stage_seconds_sum{stage="extract"} 10
+memento_stage_seconds_count{stage="extract"} 4
+memento_stage_seconds{stage="print",quantile="0.5"} 0.5
+memento_stage_seconds{stage="print",quantile="0.95"} 0.5
+memento_stage_seconds_sum{stage="print"} 0.5
+memento_stage_seconds_count{stage="print"} 1
+# HELP memento_reminders_total Reminders handled by each extraction path.
+# TYPE memento_reminders_total counter
+memento_reminders_total{path="fast_path"} 1
+memento_reminders_total{path="model"} 3
+"""
+
+
+def test_json_output(tmp_path):
+    path = str(tmp_path / "metrics.json")
+    observed().write(path)
+    with open(path) as f:
+        data = json.load(f)
+    assert data["stages"]["extract"]["p95"] == 4
+    assert data["reminders"] == {"model": 3, "fast_path": 1}
+
+
+def test_write_is_atomic(tmp_path, monkeypatch):
+    path = str(tmp_path / "metrics.prom")
+    Metrics().write(path)
+    with open(path) as f:
+        before = f.read()
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(metrics_module.os, "replace", fail)
+    with pytest.raises(OSError):
+        observed().write(path)
+    with open(path) as f:
+        assert f.read() == before
+
+    monkeypatch.undo()
+    observed().write(path)
+    with open(path) as f:
+        assert f.read() == observed().to_prometheus()
+    assert os.listdir(tmp_path) == ["metrics.prom"]
@@ -0,0 +1,83 @@
+import dataclasses
+from datetime import datetime, timezone
+
+import pytest
+
+from memento.reminders import (
+    Calendar,
+    FrozenCalendar,
+    FrozenReminder,
+    Reminder,
+)
+
+REMINDER = Reminder(
+    id="a",
+    title="Buy milk",
+    notes="From the corner shop",
+    completed=True,
+    creation_date=datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc),
+    completion_date=None,
+    due_date=datetime(2024, 5, 2, 18, 0),
+    priority=5,
+    calendar="Groceries",
+    url=None,
+    modification_date=datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc),
+)
+CALENDAR = Calendar(id="c", title="Groceries", color=None, is_subscribed=True)
+
+
+@pytest.mark.parametrize("record", [
+    REMINDER,
+    Reminder(id="b", title="Call mom", notes=""),
+    CALENDAR,
+])
+@pytest.mark.parametrize("encode, decode", [
+    ("to_tuple", "from_tuple"),
+    ("to_json", "from_json"),
+    ("to_msgpack", "from_msgpack"),
+])
+def test_round_trip(record, encode, decode):
+    if encode == "to_msgpack":
+        pytest.importorskip("msgpack")
+    data = getattr(record, encode)()
+    assert getattr(type(record), decode)(data) == record
+
+
+def test_json_keeps_datetimes():
+    decoded = Reminder.from_json(REMINDER.to_json())
+    assert decoded.creation_date == REMINDER.creation_date
+    assert decoded.creation_date.tzinfo is not None
+    assert decoded.due_date.tzinfo is None
+    assert decoded.completion_date is None
+
+
+def test_decodes_arrays_missing_trailing_fields():
+    assert Reminder.from_json('["a","Buy milk",""]') == Reminder(
+        id="a", title="Buy milk", notes="")
+
+
+@pytest.mark.parametrize("frozen, record", [
+    (FrozenReminder, REMINDER),
+    (FrozenCalendar, CALENDAR),
+])
+def test_frozen_round_trip(frozen, record):
+    value = frozen.from_tuple(record.to_tuple())
+    assert value.to_tuple() == record.to_tuple()
+    assert frozen.from_json(value.to_json()) == value
+    assert hash(value) == hash(frozen.from_tuple(record.to_tuple()))
+
+
+def test_frozen_rejects_assignment():
+    reminder = FrozenReminder.from_tuple(REMINDER.to_tuple())
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        reminder.title = "Buy oat milk"
+    calendar = FrozenCalendar.from_tuple(CALENDAR.to_tuple())
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        calendar.title = "Errands"
+    assert reminder.text == REMINDER.text
+
+
+def test_models_are_slotted():
+    assert not hasattr(REMINDER, "__dict__")
+    assert not hasattr(FrozenReminder.from_tuple(REMINDER.to_tuple()),
+                       "__dict__")
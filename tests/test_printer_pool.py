@@ -0,0 +1,119 @@
+import threading
+
+import pytest
+from escpos.exceptions import DeviceNotFoundError
+
+from memento.printer import PrinterPool, PrintInterruptedError, PrintQueue
+
+
+class Session:
+    """Printer session stand-in running jobs on its own name."""
+
+    def __init__(self, name: str, error: Exception = None):
+        self.name = name
+        self.error = error
+        self.jobs = 0
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def run(self, job, *args, **kwargs):
+        self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        self.jobs += 1
+        return job(self.name, *args, **kwargs)
+
+    def check(self, timeout: float = 1.0) -> bool:
+        return self.error is None
+
+    def close(self):
+        pass
+
+
+def pool(*sessions, **kwargs) -> PrinterPool:
+    return PrinterPool(
+        {session.name: PrintQueue(session) for session in sessions},
+        health_interval=3600,
+        **kwargs,
+    )
+
+
+def printed_on(printer: str) -> str:
+    return printer
+
+
+def test_round_robin():
+    p = pool(Session("a"), Session("b"))
+    names = [p.select().submit(printed_on).result() for _ in range(4)]
+    assert names == ["a", "b", "a", "b"]
+    p.close()
+
+
+def test_least_queue():
+    a, b = Session("a"), Session("b")
+    a.gate.clear()
+    p = pool(a, b, routing="least_queue")
+    blocked = p.select().submit(printed_on)
+    assert [p.select().submit(printed_on).result() for _ in range(2)] == [
+        "b", "b"]
+    a.gate.set()
+    assert blocked.result() == "a"
+    p.close()
+
+
+def test_rules():
+    p = pool(
+        Session("a"), Session("b"),
+        rules=[("calendar", "Work", "b"), ("assignee", "sam", "a")],
+    )
+    assert p.select(calendar="Work").name == "b"
+    assert p.select(assignee="sam").name == "a"
+    p.close()
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        pool(Session("a"), routing="random")
+    with pytest.raises(ValueError):
+        pool(Session("a"), rules=[("calendar", "Work", "b")])
+
+
+def test_fails_over_from_unreachable_printer():
+    p = pool(Session("a", DeviceNotFoundError("down")), Session("b"))
+    assert p.select().submit(printed_on).result() == "b"
+    assert p.stats()["unhealthy"] == ["a"]
+    assert p.failovers == 1
+    assert p.select().submit(printed_on).result() == "b"
+    p.close()
+
+
+def test_interrupted_job_does_not_fail_over():
+    b = Session("b")
+    p = pool(Session("a", PrintInterruptedError("cut off")), b)
+    with pytest.raises(PrintInterruptedError):
+        p.select().submit(printed_on).result()
+    assert b.jobs == 0
+    assert p.stats()["unhealthy"] == ["a"]
+    assert p.failovers == 0
+    p.close()
+
+
+def test_fails_when_every_printer_is_unreachable():
+    p = pool(
+        Session("a", DeviceNotFoundError("down")),
+        Session("b", DeviceNotFoundError("down")),
+    )
+    with pytest.raises(DeviceNotFoundError):
+        p.select().submit(printed_on).result()
+    p.close()
+
+
+def test_queue_stats():
+    queue = PrintQueue(Session("a"))
+    for _ in range(3):
+        queue.submit(printed_on).result()
+    queue.close()
+    stats = queue.stats()
+    assert stats["jobs"] == 3
+    assert 0 <= stats["mean_latency"] <= stats["max_latency"]
+    assert not hasattr(queue, "latencies")
@@ -0,0 +1,85 @@
+import socket
+import threading
+import time
+
+import pytest
+from escpos.exceptions import DeviceNotFoundError
+
+from memento.printer.session import PrinterSession, PrintInterruptedError
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Printer:
+    """TCP printer stand-in closing each connection after `keep` bytes."""
+
+    def __init__(self, keep: int = 0):
+        self.keep = keep
+        self.received: list[bytes] = []
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                return
+            data = b""
+            with connection:
+                while not self.keep or len(data) < self.keep:
+                    chunk = connection.recv(4096)
+                    if not chunk:
+                        break
+                    data += chunk
+            self.received.append(data)
+
+    def close(self):
+        self.server.close()
+
+
+def write(printer, data: bytes):
+    printer._raw(data)
+
+
+def test_reconnects_when_printer_closed_the_connection():
+    printer = Printer(keep=5)
+    session = PrinterSession(host="127.0.0.1", port=printer.port)
+    session.run(write, b"first")
+    time.sleep(0.2)
+    session.run(write, b"again")
+    session.close()
+    time.sleep(0.2)
+    assert printer.received == [b"first", b"again"]
+    printer.close()
+
+
+def test_unreachable_printer_raises_without_running_the_job():
+    calls = []
+    session = PrinterSession(host="127.0.0.1", port=free_port(), retries=2)
+    with pytest.raises(DeviceNotFoundError):
+        session.run(lambda printer: calls.append(printer))
+    assert calls == []
+
+
+def test_interrupted_job_is_not_retried():
+    printer = Printer()
+    session = PrinterSession(host="127.0.0.1", port=printer.port)
+    calls = []
+
+    def job(p):
+        calls.append(p)
+        p._raw(b"half a ticket")
+        raise ConnectionResetError("printer went away")
+
+    with pytest.raises(PrintInterruptedError):
+        session.run(job)
+    assert len(calls) == 1
+    time.sleep(0.2)
+    assert printer.received == [b"half a ticket"]
+    printer.close()
@@ -0,0 +1,11 @@
+from escpos.printer import Network
+
+from memento.printer.render import render_reminder
+
+TEXT = "Šđčć жд é"
+
+
+def test_profile_object_renders_like_its_name():
+    profile = Network("localhost", profile="TSP600").profile
+    assert render_reminder(TEXT, TEXT, profile=profile) == render_reminder(
+        TEXT, TEXT, profile="TSP600")
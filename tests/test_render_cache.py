@@ -0,0 +1,51 @@
+import pytest
+
+from memento.printer import render_cache_stats, render_reminder
+from memento.printer import utils
+
+TICKET = {
+    "title": "review the quarterly report",
+    "text": "Check the numbers against last quarter before the meeting",
+    "link": "https://example.com/report",
+    "assignee": "sam",
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cached in (utils.title_block, utils.body_block, utils.qr_data):
+        cached.cache_clear()
+
+
+def test_counts_hits_and_misses():
+    render_reminder(**TICKET)
+    assert render_cache_stats() == {
+        "title": {"hits": 0, "misses": 1, "size": 1},
+        "body": {"hits": 0, "misses": 1, "size": 1},
+        "qr": {"hits": 0, "misses": 1, "size": 1},
+    }
+    render_reminder(**TICKET)
+    render_reminder(**{**TICKET, "title": "another title"})
+    stats = render_cache_stats()
+    assert stats["title"] == {"hits": 1, "misses": 2, "size": 2}
+    assert stats["body"] == {"hits": 2, "misses": 1, "size": 1}
+    assert stats["qr"] == {"hits": 2, "misses": 1, "size": 1}
+
+
+def print_link(p, link):
+    """The QR code printing before it was cached."""
+    p.set(align="center")
+    p.qr(link, size=6)
+    p.set(align="left", normal_textsize=True)
+
+
+@pytest.mark.parametrize("profile", [None, "TM-T88V"])
+def test_cached_tickets_match_uncached(monkeypatch, profile):
+    first = render_reminder(**TICKET, profile=profile)
+    cached = render_reminder(**TICKET, profile=profile)
+    for name in ("title_block", "body_block"):
+        monkeypatch.setattr(
+            utils, name, getattr(utils, name).__wrapped__)
+    monkeypatch.setattr(utils, "print_link", print_link)
+    uncached = render_reminder(**TICKET, profile=profile)
+    assert first == cached == uncached
@@ -0,0 +1,55 @@
+import httpx
+import pytest
+
+from memento.llm.router import ModelRouter, pooled_http_client
+
+URLS = ["http://one:11434/v1", "http://two:11434/v1"]
+
+
+def test_short_reminders_go_to_the_small_model():
+    router = ModelRouter("large", "small", URLS, small_max_length=10)
+    assert router.select(["Buy milk"]) == "small"
+    assert router.select(["Buy milk", "Call mom"]) == "small"
+    assert router.select(["Buy milk", "Water the plants"]) == "large"
+    assert router.model(["Buy milk"]).model_name == "small"
+    assert router.model(["Water the plants"]).model_name == "large"
+
+
+def test_without_small_model_everything_goes_to_the_large_one():
+    router = ModelRouter("large", base_urls=URLS)
+    assert list(router.models) == ["large"]
+    assert router.select(["Buy milk"]) == "large"
+    assert router.default is router.models["large"][0]
+
+
+def test_requests_rotate_over_the_endpoints():
+    router = ModelRouter("large", "small", URLS)
+    urls = [router.model(["x" * 200]).base_url for _ in range(3)]
+    assert urls == ["http://one:11434/v1/", "http://two:11434/v1/",
+                    "http://one:11434/v1/"]
+    # Each model rotates on its own
+    assert router.model(["Buy milk"]).base_url == "http://one:11434/v1/"
+    assert router.model(["x" * 200]).base_url == "http://two:11434/v1/"
+
+
+def test_endpoints_share_one_client():
+    client = httpx.AsyncClient()
+    router = ModelRouter("large", "small", URLS, http_client=client)
+    models = [model for models in router.models.values() for model in models]
+    assert len(models) == 4
+    assert all(model.client._client is client for model in models)
+
+
+def test_at_least_one_endpoint_is_required():
+    with pytest.raises(ValueError):
+        ModelRouter("large", base_urls=[])
+
+
+def test_pooled_client_keeps_connections_alive():
+    client = pooled_http_client(
+        max_connections=3, keepalive_expiry=7, timeout=9)
+    pool = client._transport._pool
+    assert pool._max_connections == 3
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 7
+    assert client.timeout == httpx.Timeout(9, connect=5)
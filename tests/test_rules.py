@@ -0,0 +1,66 @@
+import pytest
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from memento.llm import LLMProcessor, ReminderOutput
+from memento.llm.rules import extract_simple
+
+
+@pytest.mark.parametrize("text, output", [
+    ("Buy milk", ReminderOutput(title="Buy milk")),
+    ("  Buy milk  ", ReminderOutput(title="Buy milk")),
+    ("Review PR https://example.com/pr/1.", ReminderOutput(
+        title="Review PR", link="https://example.com/pr/1")),
+    ("@sam: water the plants", ReminderOutput(
+        title="water the plants", assignee="sam")),
+    ("Book flights @alex.k https://example.com/flights", ReminderOutput(
+        title="Book flights", link="https://example.com/flights",
+        assignee="alex.k")),
+    ("Email bob@example.com", ReminderOutput(title="Email bob@example.com")),
+])
+def test_simple_reminders(text, output):
+    assert extract_simple(text) == output
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "   ",
+    "Buy milk\nThe oat one",
+    "Compare https://example.com/a with https://example.com/b",
+    "@sam and @alex pair on the release",
+    "Write up the notes from the planning meeting with the whole team",
+    "https://example.com/only-a-link",
+])
+def test_complex_reminders_need_the_model(text):
+    assert extract_simple(text) is None
+
+
+def model(calls: list) -> FunctionModel:
+    def complete(messages, info: AgentInfo) -> ModelResponse:
+        calls.append(messages)
+        tool = info.output_tools[0]
+        return ModelResponse(
+            parts=[ToolCallPart(tool.name, '{"title": "From the model"}')])
+
+    return FunctionModel(complete)
+
+
+def test_fast_path_skips_the_model():
+    calls = []
+    processor = LLMProcessor(warm_up="off", fast_path=True)
+    with processor.agent.override(model=model(calls)):
+        output = processor.process_reminder("Water the plants @sam")
+    assert output == ReminderOutput(title="Water the plants", assignee="sam")
+    assert calls == []
+    assert processor.stats["fast_path"] == 1
+
+
+def test_other_reminders_fall_through_to_the_model():
+    calls = []
+    processor = LLMProcessor(warm_up="off", fast_path=True)
+    with processor.agent.override(model=model(calls)):
+        output = processor.process_reminder("Water the plants\nTwice a week")
+    assert output.title == "From the model"
+    assert len(calls) == 1
+    assert processor.stats["fast_path"] == 0
+    assert processor.stats["model"] == 1
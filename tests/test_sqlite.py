@@ -0,0 +1,100 @@
+import asyncio
+import threading
+
+import pytest
+
+from memento.reminders import RemindersError, SQLiteReminders
+
+
+@pytest.fixture
+def store():
+    store = SQLiteReminders()
+    store.create_reminder("Buy milk", calendar="Groceries")
+    store.create_reminder("Call mom")
+    store.create_reminder("File taxes", calendar="Work")
+    done = store.create_reminder("Old task", calendar="Work")
+    store.update_reminder(done.id, completed=True)
+    yield store
+    store.close()
+
+
+def titles(reminders):
+    return [reminder.title for reminder in reminders]
+
+
+def test_filters_by_calendar(store):
+    assert titles(store.get_reminders()) == [
+        "Buy milk", "Call mom", "File taxes"]
+    assert titles(store.get_reminders(calendar="Work")) == ["File taxes"]
+    assert titles(store.get_reminders(calendars=["Groceries", "Work"])) == [
+        "Buy milk", "File taxes"]
+    assert titles(store.get_reminders(
+        calendars=["Groceries", "Work"], calendar="Groceries")) == [
+        "Buy milk"]
+    assert titles(store.get_reminders(
+        exclude_calendars=["Work", "Groceries"])) == ["Call mom"]
+    assert titles(store.get_reminders(
+        include_completed=True, calendar="Work")) == [
+        "File taxes", "Old task"]
+
+
+def test_update_reminders(store):
+    milk, mom, taxes = store.get_reminders()
+    store.create_calendar("Processed")
+    moved, errors = store.update_reminders(
+        [milk.id, "missing", taxes.id], calendar="Processed")
+    assert [reminder.id for reminder in moved] == [milk.id, taxes.id]
+    assert all(reminder.calendar == "Processed" for reminder in moved)
+    assert list(errors) == ["missing"]
+    assert isinstance(errors["missing"], RemindersError)
+    assert titles(store.get_reminders(
+        exclude_calendars=["Processed"])) == ["Call mom"]
+
+
+def test_update_reminders_to_unknown_calendar(store):
+    milk = store.get_reminders()[0]
+    moved, errors = store.update_reminders([milk.id], calendar="Nowhere")
+    assert moved == []
+    assert list(errors) == [milk.id]
+    assert store.get_reminder(milk.id).calendar == "Groceries"
+
+
+def test_update_reminder_raises(store):
+    with pytest.raises(RemindersError):
+        store.update_reminder("missing", title="Nothing")
+
+
+def test_async_variants_run_off_the_event_loop(store, monkeypatch):
+    threads = []
+    select = store._select_reminders
+
+    def record(*args):
+        threads.append(threading.current_thread())
+        return select(*args)
+
+    monkeypatch.setattr(store, "_select_reminders", record)
+
+    async def fetch():
+        reminders = await store.aget_reminders(exclude_calendars=["Work"])
+        chunks = [
+            chunk async for chunk in store.astream_reminders(calendar="Work")
+        ]
+        empty = [
+            chunk async for chunk in store.astream_reminders(calendar="None")
+        ]
+        return reminders, chunks, empty
+
+    reminders, chunks, empty = asyncio.run(fetch())
+    assert titles(reminders) == ["Buy milk", "Call mom"]
+    assert [titles(chunk) for chunk in chunks] == [["File taxes"]]
+    assert empty == []
+    assert threading.main_thread() not in threads
+
+
+def test_calendars(store):
+    calendar = store.create_calendar("Errands", color="#FF0000")
+    assert store.get_calendar_by_title("Errands") == calendar
+    calendar = store.update_calendar(calendar.id, title="Chores")
+    assert store.get_calendar(calendar.id).title == "Chores"
+    assert store.delete_calendar(calendar.id)
+    assert store.get_calendar(calendar.id) is None
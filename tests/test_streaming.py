@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+from pydantic_ai.models.function import (
+    AgentInfo,
+    DeltaToolCall,
+    FunctionModel,
+)
+
+from memento.llm import LLMProcessor
+from memento.llm.ollama import _complete_fields
+
+
+@pytest.mark.parametrize("started, complete", [
+    ([], 0),
+    (["title"], 0),
+    (["title", "text"], 1),
+    (["title", "text", "link"], 2),
+    (["title", "link"], 1),
+    (["link", "title"], 0),
+    (["link", "title", "assignee"], 1),
+    (["title", "text", "link", "assignee"], 3),
+])
+def test_complete_fields(started, complete):
+    assert _complete_fields(started) == complete
+
+
+def test_title_streams_before_the_end_without_text():
+    chunks = [
+        '{"title": "Buy milk"',
+        ', "link": "https://example.com"',
+        ', "assignee": "sam"}',
+    ]
+    sent = []
+
+    async def stream(messages, info: AgentInfo):
+        tool = info.output_tools[0]
+        for number, chunk in enumerate(chunks):
+            sent.append(chunk)
+            name = tool.name if number == 0 else None
+            yield {0: DeltaToolCall(name=name, json_args=chunk)}
+
+    async def fields(processor):
+        result = []
+        async for name, value in processor.astream_reminder("Buy milk"):
+            result.append((name, value, len(sent)))
+        return result
+
+    processor = LLMProcessor(warm_up="off", fast_path=False)
+    with processor.agent.override(model=FunctionModel(stream_function=stream)):
+        result = asyncio.run(fields(processor))
+
+    assert result[0] == ("title", "Buy milk", 2)
+    assert [(name, value) for name, value, _ in result[1:]] == [
+        ("text", None), ("link", "https://example.com"), ("assignee", "sam"),
+    ]